@@ -0,0 +1,177 @@
+### KIM_Backend_Benchmark.py
+# developed for Yamada North America, INC. Quality Assurance by Mason Ritchason
+"""KIM_Backend_Benchmark.py
+
+Compares the KIM Interface Manager config stores (single file, sharded
+and SQLite) on a generated configuration. Each store loads the config
+cold, commits the operations the GUI makes (add machine, edit, duplicate
+and remove config, remove machine) and exports the single-file layout.
+
+    python KIM_Backend_Benchmark.py [--machines 10000] [--models 100] [--commits 20]
+"""
+
+
+### Libraries Segment
+#__________________________________________________________________________________________________
+import os as os
+from json import dumps
+from time import perf_counter
+from statistics import median
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from classes.ConfigCache import ConfigCache as ConfigCache
+from classes.ConfigJournal import ConfigJournal as ConfigJournal
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+from classes.CommitPipeline import CommitPipeline as CommitPipeline
+from classes.ChangelogWriter import ChangelogWriter as ChangelogWriter
+from classes.ConfigFileStore import ConfigFileStore as ConfigFileStore
+from classes.ShardedConfigStore import ShardedConfigStore as ShardedConfigStore
+from classes.SqliteConfigStore import SqliteConfigStore as SqliteConfigStore
+
+
+### Benchmark Segment
+#__________________________________________________________________________________________________
+# builds a generated KIM Interface config
+def generateConfig(machine_count, model_count, configs_per_machine = 3, mappings_per_config = 5):
+    """generateConfig(machine_count, model_count, configs_per_machine = 3, mappings_per_config = 5)
+
+    Builds a config Dict with the passed number of machines spread over the passed
+    number of models (no keys; they are assigned on import like a pre-key config).
+
+    -> {"timestamp", "models"}
+    """
+    # create the models
+    models = [{"name":"M" + str(i), "base_information":["Program", "Lot", "Operator"],
+        "machines":[]} for i in range(model_count)]
+    # spread the machines over the models
+    for i in range(machine_count):
+        configs = [{"id":str(i) + "-" + str(k), "mappings":[{"item":"Ø OD " + str(m), "sheet":1,
+            "cluster":m + 1, "type":"string", "value":""} for m in range(mappings_per_config)]}
+            for k in range(configs_per_machine)]
+        models[i % model_count]['machines'].append({"name":"MACHINE " + str(i),
+            "measurements":["Ø OD " + str(m) for m in range(mappings_per_config)],
+            "mapping_configurations":configs})
+    # return the config Dict
+    return {"timestamp":"benchmark", "models":models}
+
+# times one callable
+def timed(function):
+    """timed(function)
+
+    -> (result, seconds)
+    """
+    # start the clock
+    start = perf_counter()
+    # run the function
+    result = function()
+    # return the result and the elapsed time
+    return result, perf_counter() - start
+
+# benchmarks one store
+def benchmarkStore(name, make_store, source_path, work_dir, commits):
+    """benchmarkStore(name, make_store, source_path, work_dir, commits)
+
+    name: str; the store name shown in the results.
+    make_store: function(); opens a new store on the benchmark location.
+    source_path: str; the generated single config file.
+    work_dir: str; a folder for the store's journal, changelog and export.
+    commits: int; the number of commits timed per operation.
+
+    -> {measurement: seconds}
+    """
+    # create a dictionary to hold the results
+    results = {}
+    # load the single file into the store (the file store reads it in place)
+    Store = make_store()
+    if not isinstance(Store, ConfigFileStore):
+        _, results['import'] = timed(lambda: Store.importFile(source_path))
+        Store.close()
+    # load the config cold (new store, new cache)
+    Store = make_store()
+    Journal = ConfigJournal(os.path.join(work_dir, name + ".journal"), 0)
+    Cache = ConfigCache(Store, Journal)
+    document, results['cold load'] = timed(Cache.getDocument)
+    # commit through the same pipeline as the GUI (write-through)
+    Changelog = ChangelogWriter(os.path.join(work_dir, name + "_changelog"), "benchmark")
+    Pipeline = CommitPipeline(Store, Cache, Changelog, Journal, "benchmark")
+    Pipeline.compact()
+    # pick the machines to change (spread over the models)
+    machines = [model['machines'][0] for model in document['models']][:commits]
+    # time each GUI operation
+    samples = {"add machine":[], "edit config":[], "duplicate config":[], "remove config":[],
+        "remove machine":[]}
+    for i, machine in enumerate(machines):
+        model_key = Cache.getDocument()['models'][i]['key']
+        config = machine['mapping_configurations'][0]
+        new_machine = {"key":"bench" + str(i), "name":"NEW " + str(i), "measurements":[],
+            "mapping_configurations":[]}
+        samples['add machine'].append(Pipeline.commitOperations([ConfigOperation.add(model_key,
+            new_machine)], "Add Machine")['seconds'])
+        edited = dict(config, id = config['id'] + "e")
+        samples['edit config'].append(Pipeline.commitOperations([ConfigOperation.replace(edited)],
+            "Edit Configuration")['seconds'])
+        copied = {"key":"copy" + str(i), "id":config['id'] + "c", "mappings":config['mappings']}
+        samples['duplicate config'].append(Pipeline.commitOperations([ConfigOperation.add(
+            machine['key'], copied)], "Duplicate Config")['seconds'])
+        samples['remove config'].append(Pipeline.commitOperations([ConfigOperation.remove(
+            copied['key'])], "Remove Config")['seconds'])
+        samples['remove machine'].append(Pipeline.commitOperations([ConfigOperation.remove(
+            new_machine['key'])], "Remove Machine")['seconds'])
+    # keep the median of each operation
+    for operation in samples:
+        results[operation] = median(samples[operation])
+    # write the single file the KIM Interface reads
+    if not isinstance(Store, ConfigFileStore):
+        _, results['export'] = timed(lambda: Store.exportFile(os.path.join(work_dir,
+            name + "_export.json"), Cache.getDocument()))
+    # clean up
+    Changelog.close()
+    Store.close()
+    # return the results
+    return results
+
+# parses the command line and runs the benchmark
+def main(argv = None):
+    """main(argv = None)
+
+    argv: (optional) [str]; the command line arguments (defaults to sys.argv).
+
+    -> int; the exit code.
+    """
+    # build the command line
+    parser = ArgumentParser(prog = "KIM_Backend_Benchmark",
+        description = "Compare the KIM Interface Manager config stores.")
+    parser.add_argument("--machines", type = int, default = 10000)
+    parser.add_argument("--models", type = int, default = 100)
+    parser.add_argument("--commits", type = int, default = 20)
+    args = parser.parse_args(argv)
+    # work in a temporary folder
+    with TemporaryDirectory() as work_dir:
+        # write the generated config as a single file
+        source_path = os.path.join(work_dir, "source.json")
+        File = open(source_path, 'w')
+        File.write(dumps(generateConfig(args.machines, args.models), indent = 4))
+        File.close()
+        print("Config: " + str(args.machines) + " machines / " + str(args.models) + " models / "
+            + str(os.path.getsize(source_path)) + " bytes")
+        # the stores under test
+        stores = {"file":lambda: ConfigFileStore(source_path),
+            "sharded":lambda: ShardedConfigStore(os.path.join(work_dir, "sharded")),
+            "sqlite":lambda: SqliteConfigStore(os.path.join(work_dir, "config.db"))}
+        # run each store
+        results = {}
+        for name in stores:
+            results[name] = benchmarkStore(name, stores[name], source_path, work_dir, args.commits)
+    # print the results table (milliseconds)
+    measurements = ["import", "cold load", "add machine", "edit config", "duplicate config",
+        "remove config", "remove machine", "export"]
+    print("\n" + "ms".ljust(18) + "".join(name.rjust(12) for name in results))
+    for measurement in measurements:
+        print(measurement.ljust(18) + "".join((("%.2f" % (results[name][measurement] * 1000))
+            if measurement in results[name] else "-").rjust(12) for name in results))
+    # success
+    return 0
+
+# run as a script
+if __name__ == "__main__":
+    raise SystemExit(main())
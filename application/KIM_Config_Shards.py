@@ -0,0 +1,73 @@
+### KIM_Config_Shards.py
+# developed for Yamada North America, INC. Quality Assurance by Mason Ritchason
+"""KIM_Config_Shards.py
+
+Converts the KIM Interface configuration between the single-file layout
+(read by the KIM Interface) and the sharded layout (a manifest plus one
+file per model) or SQLite database used by the KIM Interface Manager.
+Shards are not meant to be edited by hand: the Manager notices changes
+through the manifest only, so edit the single file and import it again.
+
+    python KIM_Config_Shards.py import [--file PATH] [--shards DIR | --database PATH]
+    python KIM_Config_Shards.py export [--file PATH] [--shards DIR | --database PATH]
+"""
+
+
+### Libraries Segment
+#__________________________________________________________________________________________________
+import os as os
+from argparse import ArgumentParser
+from classes.ShardedConfigStore import ShardedConfigStore as ShardedConfigStore
+from classes.SqliteConfigStore import SqliteConfigStore as SqliteConfigStore
+
+
+### Command Segment
+#__________________________________________________________________________________________________
+# parses the command line and runs the conversion
+def main(argv = None):
+    """main(argv = None)
+
+    argv: (optional) [str]; the command line arguments (defaults to sys.argv).
+
+    Imports the single config file into shards (or the database), or exports the shards
+    (or the database) to the single config file.
+
+    -> int; the exit code.
+    """
+    # environment directory
+    sys_env_dir = os.path.abspath(os.path.join(os.getcwd()))
+    # build the command line
+    parser = ArgumentParser(prog = "KIM_Config_Shards",
+        description = "Convert the KIM Interface configuration between layouts.")
+    parser.add_argument("direction", choices = ["import", "export"],
+        help = "import: single file -> shards; export: shards -> single file")
+    parser.add_argument("--file", default = os.path.join(sys_env_dir, "config",
+        "KIM_interface_configuration.json"), help = "the single config file")
+    parser.add_argument("--shards", default = os.path.join(sys_env_dir, "config", "sharded"),
+        help = "the sharded config folder")
+    parser.add_argument("--database", default = None,
+        help = "an SQLite config database (used instead of the sharded folder)")
+    args = parser.parse_args(argv)
+    # open the SQLite or sharded store
+    if args.database:
+        Store = SqliteConfigStore(args.database)
+        location = args.database
+    else:
+        Store = ShardedConfigStore(args.shards)
+        location = args.shards
+    # split the single file into the store
+    if args.direction == "import":
+        count = Store.importFile(args.file)
+        print("Imported " + str(count) + " models into " + location)
+    # join the store into the single file
+    else:
+        size = Store.exportFile(args.file)
+        print("Exported " + str(size) + " bytes to " + args.file)
+    # release the store
+    Store.close()
+    # success
+    return 0
+
+# run as a script
+if __name__ == "__main__":
+    raise SystemExit(main())
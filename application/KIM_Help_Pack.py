@@ -0,0 +1,66 @@
+### KIM_Help_Pack.py
+# developed for Yamada North America, INC. Quality Assurance by Mason Ritchason
+"""KIM_Help_Pack.py
+
+Builds the pre-decoded help page pack: every chapter image is decoded once into
+the float RGBA layout DPG textures take and written to one file, with a manifest
+holding the page order and the offset of every page. The KIM Interface Manager maps
+the pack and creates help textures straight from it; it falls back to the JPGs
+whenever the pack is missing or older than the images.
+
+    python KIM_Help_Pack.py [--help-dir DIR]
+
+Run again after the help images change. The pack is large (4 floats per pixel,
+about 300 MB for the manual) but is only paged in for the pages being viewed.
+"""
+
+
+### Libraries Segment
+#__________________________________________________________________________________________________
+import os as os
+import dearpygui.dearpygui as dpg
+from argparse import ArgumentParser
+from time import perf_counter
+from classes.HelpPack import HelpPack as HelpPack
+
+
+### Command Segment
+#__________________________________________________________________________________________________
+# parses the command line and builds the pack
+def main(argv = None):
+    """main(argv = None)
+
+    argv: (optional) [str]; the command line arguments (defaults to sys.argv).
+
+    Decodes the help pages and writes the help pack and its manifest.
+
+    -> int; the exit code.
+    """
+    # environment directory
+    sys_env_dir = os.path.abspath(os.path.join(os.getcwd()))
+    # build the command line
+    parser = ArgumentParser(prog = "KIM_Help_Pack",
+        description = "Build the pre-decoded help page pack.")
+    parser.add_argument("--help-dir", default = os.path.join(sys_env_dir, "assets", "help"),
+        help = "the help folder (holding the chap# folders)")
+    args = parser.parse_args(argv)
+    # no help folder
+    if not os.path.isdir(args.help_dir):
+        print("No help folder at " + args.help_dir)
+        return 1
+    # decode with the same decoder the Manager uses
+    dpg.create_context()
+    start = perf_counter()
+    size = HelpPack.build(args.help_dir, dpg.load_image)
+    elapsed = perf_counter() - start
+    dpg.destroy_context()
+    # report the pack
+    Pack = HelpPack(args.help_dir)
+    print("Wrote " + str(size) + " bytes to " + Pack.pack_path + " in " + str(round(elapsed, 2)) + "s")
+    print("Wrote the page manifest to " + Pack.manifest_path)
+    # success
+    return 0
+
+# run as a script
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,14 +13,26 @@ mapping configuration experience without JSON literacy.
 #__________________________________________________________________________________________________
 import dearpygui.dearpygui as dpg
 import os as os
-from json import loads, dumps
-from re import compile
-from shutil import copyfile
 from datetime import datetime
 from webbrowser import open as web
+from zipfile import BadZipFile
 from classes.Model import Model as Model
 from classes.Machine import Machine as Machine
 from classes.MappingConfiguration import MappingConfiguration as MappingConfiguration
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+from classes.ConfigValidator import ConfigValidator as ConfigValidator
+from classes.InterfaceCore import InterfaceCore as InterfaceCore
+from classes.RuntimeStats import RuntimeStats as RuntimeStats
+from classes.LogIndex import LogIndex as LogIndex
+from classes.LogView import LogView as LogView
+from classes.ResultsWatcher import ResultsWatcher as ResultsWatcher
+from classes.HelpPageCache import HelpPageCache as HelpPageCache
+from classes.HelpPack import HelpPack as HelpPack
+from classes.ConfigBatch import ConfigBatch as ConfigBatch
+from classes.SheetReader import SheetReader as SheetReader
+from classes.SheetImporter import SheetImporter as SheetImporter
+from classes.ClusterOccupancy import ClusterOccupancy as ClusterOccupancy
+from classes.ConfigDiff import ConfigDiff as ConfigDiff
 
 
 ### Global Definition Segmemt
@@ -31,20 +43,30 @@ sys_env_dir = os.path.abspath(os.path.join(os.getcwd()))
 # detect user signature
 user = os.getenv('username')
 
-# get the manager configuration; open the KIM Interface Manager configuration file
-File = open(os.path.join(sys_env_dir, "KIM_interface_manager_config.json"), 'r')
-# read it
-Manager_Config_File = File.read()
-# close it
-File.close()
-# convert from JSON to Dict
-Manager_Config_File = loads(Manager_Config_File)
+# create the KIM Interface core (config store, journal, cache, changelog, commit pipeline and
+# backups; no GUI) with the settings of the KIM Interface Manager configuration file
+Interface_Core = InterfaceCore.fromManagerConfig(sys_env_dir, user)
+# check configurations in this process (a process pool re-imports this script on Windows)
+Interface_Core.linter.workers = 1
 # save the version number
-version = Manager_Config_File['version']
+version = Interface_Core.version
 # save the version date
-version_date = Manager_Config_File['version_date']
-# release unnecessary used memory
-del(Manager_Config_File)
+version_date = Interface_Core.version_date
+
+# create the runtime statistics (kept in a sidecar; only new runtime log lines are parsed)
+Interface_Runtime_Stats = RuntimeStats(os.path.join(sys_env_dir, "logs", "runtime_log.txt"), 
+    os.path.join(sys_env_dir, "logs", "runtime_stats.json"))
+
+# create the runtime log view (line-offset index kept for the session; 14 rows on screen)
+Interface_Log_View = LogView(LogIndex(os.path.join(sys_env_dir, "logs", "runtime_log.txt")), 14)
+
+# create the results watcher (background thread; re-reads results.txt only when it changes)
+Interface_Results_Watcher = ResultsWatcher(os.path.join(sys_env_dir, "results.txt"), 0.5)
+
+# create the help page cache (at most 6 page textures; pages mapped from the pre-decoded pack, 
+# or neighbours decoded in the background when the pack is missing or stale)
+Interface_Help_Pages = HelpPageCache(dpg, os.path.join(sys_env_dir, "assets", "help"), 9, 6, 
+    HelpPack(os.path.join(sys_env_dir, "assets", "help")))
 
 # create dpg context and viewport
 # set up dpg
@@ -59,86 +81,35 @@ StartupWindow = dpg.window(tag = "startupWindow", pos = [0, 0], width = 1280, he
 
 ### Helper Function Segment
 #__________________________________________________________________________________________________
-# timestamp function adds a timestamp to the top of the config file passed
-def timestamp(cfg, action):
-    """timestamp(cfg, action)
-
-    cfg: str|dict; the path of the file needing a timestamp update OR
-        a file dict object with a timestamp key.
-    action: str; a plaintext description of the action performed.
-    
-    Creates a timestamp on the top of the configuration files. This timestamp
-    allows the system to create a collection of backups, created at each launch.
-    It also allows users to see when a change was made.
-    """
-    # try as a file path is passed
-    try:
-        # open the config file needing a timestamp
-        File = open(cfg, 'r')
-        # save the file's lines
-        text = File.read()
-        # close the file
-        File.close()
-        # format the lines as JSON
-        text = loads(text)
-        # update the timestamp
-        text.update({"timestamp":str(str(datetime.now()) + " | " + str(user))})
-        # dump the text to JSON
-        text = dumps(text, indent = 4)
-        # open the file to write
-        File = open(cfg, 'w')
-        # write the lines back into the file
-        File.writelines(text)
-        # close the file
-        File.close()
-    # not a file
-    except Exception:
-        # update the timestamp key:value
-        cfg.update({"timestamp":str(str(datetime.now()) + " | " + str(user))})
-        # return the new config object
-    # update the timestamp of the main config file
-    File = open(os.path.join(sys_env_dir, "config", "KIM_interface_configuration.json"), 'r')
-    text = File.read()
-    File.close()
-    # format the file as dict
-    text = loads(text)
-    # update the timestamp
-    text.update({"timestamp":str(str(datetime.now()) + " | " + str(user))})
-    # format the file as JSON
-    text = dumps(text, indent = 4)
-    # update the config file
-    File = open(os.path.join(sys_env_dir, "config", "KIM_interface_configuration.json"), 'w')
-    File.write(text)
-    File.close()
-    # add entry to the changelog
-    File = open(os.path.join(sys_env_dir, "logs", "changelog.txt"), 'a')
-    # write the entry to the file
-    File.write(str(str(datetime.now()) + " | " + str(user) + " | " + str(action) + "\n"))
-    # close file
-    File.close()
-    # return the new config item (may not be used if a filepath was passed)
-    return cfg
-
-
 ### Config File Management
 # openConfigFile reads and returns the KIM Interface configuration
 def openConfigFile():
     """openConfigFile()
 
     Retrieves the Dict Object of the current KIM Interface configuration file.
+    The file is only re-read when its mtime/size/inode changes; otherwise the
+    cached Dict is returned.
 
     -> Interface_Config_File
     """
-    # open the KIM Interface config file
-    File = open(os.path.join(sys_env_dir, "config", "KIM_interface_configuration.json"), 'r')
-    # read the file
-    Interface_Config_File = File.read()
-    # convert from JSON to Py Dict
-    Interface_Config_File = loads(Interface_Config_File)
-    # close
-    File.close()
-    # return the KIM Interface config object
-    return Interface_Config_File
+    # get the KIM Interface config object from the core
+    return Interface_Core.openConfigFile()
+
+# commits a set of keyed operations to the KIM Interface config
+def commitConfigOperations(operations, action):
+    """commitConfigOperations(operations, action)
+
+    operations: [ConfigOperation]; the keyed add/replace/remove operations of one commit.
+    action: str; a plaintext description of the action performed.
+
+    Applies the operations to the current KIM Interface configuration and appends
+    them to the journal as one record. The configuration file itself is only
+    rewritten once the journal passes its compaction threshold.
+
+    -> {"action", "bytes", "seconds", "compacted"}
+    """
+    # apply, journal and log the operations; recompile the getvalue lookups
+    return Interface_Core.commitOperations(operations, action)
 
 # overwrites the KIM Interface config file with a new config object
 def overwriteConfigFile(new_config_object, action):
@@ -149,101 +120,58 @@ def overwriteConfigFile(new_config_object, action):
     action: str; a plaintext description of the action performed.
 
     Overwrites the existing KIM Interface configuration JSON file with an edited version.
+    The timestamp is updated in memory, the config is serialized and written once
+    (folding in the journal), and the action is added to the changelog.
+
+    -> {"action", "bytes", "seconds", "compacted"}
     """
-    # update the new config object's timestamp
-    new_config_object = timestamp(new_config_object, action)
-    # convert the new config to json
-    Interface_Config_File = dumps(new_config_object, indent = 4)
-    # open the KIM Interface config file
-    File = open(os.path.join(sys_env_dir, "config", "KIM_interface_configuration.json"), 'w')
-    # overwrite the KIM Interface config file
-    File.write(Interface_Config_File)
-    # close the file
-    File.close()
+    # stamp, write and log the new config in a single pass
+    return Interface_Core.commit(new_config_object, action)
+
+# compiles the getvalue lookup artifact
+def emitLookupArtifact():
+    """emitLookupArtifact()
+
+    Compiles the current KIM Interface configuration into the lookup artifact
+    (config/KIM_interface_lookup.bin): one ready-to-fill mapping list per
+    (URL machine name, config id), found through a memory-mapped offset table
+    instead of a parse of the whole configuration. Compiled when the Manager
+    opens and closes; the stand-in recompiles it when the config file changes.
+
+    -> int; the number of bytes written.
+    """
+    # compile and replace the artifact
+    return Interface_Core.emitLookupArtifact()
+
+# writes the single config file the KIM Interface reads
+def exportInterfaceConfig():
+    """exportInterfaceConfig()
+
+    With sharded or SQLite storage, assembles the current KIM Interface configuration
+    from its store and writes it to the single config file that the KIM Interface (and
+    the config backups) read. Does nothing with single-file storage.
+
+    -> int; the number of bytes written.
+    """
+    # export the current config (store + journal)
+    return Interface_Core.exportInterfaceConfig()
 
 
 ### Backup Management
-# checkBackupCount maintains a limit of 25 backups in the system
-def checkBackupCount():
-    """checkBackupCount():
-    
-    Maintains that there are only 25 previous config backups (excluding the latest).
-    Removes the oldest config backup in the case that the count exceeds 25.
-    """
-    # save the backups directory
-    past_backups_dir = os.path.join(sys_env_dir, "config", "backups", "past")
-    # check the number of folders in the past backups folder
-    while len(os.listdir(past_backups_dir)) >= 25:
-        # scan the size of the folder
-        backups = os.listdir(past_backups_dir)
-        # does the directory need to be trimmed?
-        if len(backups) >= 25:
-            # add the dir root to each file name
-            for i in range(len(backups)):
-                # add the dir root
-                backups[i] = os.path.join(past_backups_dir, backups[i])
-            # there are 25+ files in the past backups folder; remove oldest
-            backups = sorted(backups)
-            # remove the oldest file (first in the list)
-            os.remove(backups[0])
-            backups.pop(0)
-        # once here, there is room for another backup in past backups
-
-# pastBackup moves the latest backup to the past folder
-def pastBackup():
-    """pastBackup()
-
-    Takes the latest backup of the config files and moves it into its own folder
-    in the past backups folder. Clears the latest backup from the latest folder.
-    """
-    # save the backups directories
-    latest_dir = os.path.join(sys_env_dir, "config", "backups", "latest.json")
-    # save the timestamp (used to name the past backup file)
-    try:
-        File = open(latest_dir, 'r')
-        # save the file text
-        text = File.read()
-        # close the file
-        File.close()
-        # convert to JSON
-        text = loads(text)
-        # get the timestamp
-        time = text['timestamp']
-        # remove milliseconds from timestamp
-        time = (time.split('.'))[0]
-        # remove invalid directory characters
-        time = time.replace(':', '.')
-        # save the past backup folder dir
-        past_dir = os.path.join(sys_env_dir, "config", "backups", "past", str(time) + ".json")
-        # check the past backups folder
-        checkBackupCount()
-        # if the timestamped config has not already been backed-up
-        if not os.path.isfile(past_dir):
-            # copy the config tree from the latest to past backup
-            copyfile(latest_dir, past_dir)
-        # delete the latest.json file (needs to happen either way)
-        os.remove(latest_dir)
-    # the latest.json file doesn't exist
-    except Exception:
-        # nothing needs to happen
-        pass
-    
 # createConfigBackup maintains a configuration backup
-def createConfigBackup():
-    """createConfigBackup():
-    
-    Creates a copy of the current KIM_Interface_Configuration.json in the backup folder.
-    """
-    # save the backups directory
-    backups_dir = os.path.join(sys_env_dir, "config", "backups")
-    # set the source for copying
-    source = os.path.join(sys_env_dir, "config", "KIM_interface_configuration.json")
-    dest = os.path.join(backups_dir, "latest.json")
-    # move the previous latest configuration backup to past packups
-    pastBackup()
-    # copy the current config file from the config to backup/latest
-    copyfile(source, dest)
+def createConfigBackup(background = True):
+    """createConfigBackup(background = True):
+
+    background: (optional) bool; back up on the backup worker (see pollBackupStatus).
 
+    Snapshots the current KIM Interface configuration into the backup store (skipped if
+    nothing changed since the latest snapshot; snapshots past the backup limits of the
+    KIM Interface Manager configuration file are dropped).
+
+    -> {"hash", "skipped", "objects", "bytes", "removed", "seconds"} | None
+    """
+    # back up the config
+    return Interface_Core.createConfigBackup(background)
 
 ### DPG Window Management
 # clears the passed window alias for reuse
@@ -275,7 +203,7 @@ def clearWindowRegistry(exclusions = []):
         "viewMachineWindow","editMachineWindow","removeMachineWindow","selectModelWindow",
         "addModelWindow","viewModelWindow","editModelWindow","removeModelWindow",
         "editMachineSubwindow","editModelSubwindow","urlViewWindow","resultsViewWindow",
-        "logsViewWindow","informationWindow","helpWindow","contactPopup"]
+        "logsViewWindow","lintWindow","backupsWindow","informationWindow","helpWindow","contactPopup"]
     # for each item in the program windows list
     for Window in program_windows:
         # window is not excluded
@@ -316,97 +244,83 @@ def showWarningPopup(warning_message):
             callback = deleteItem, user_data = ["warningPopup"])
 
 
-### Object-Returning Functions
-# get Configs from the KIM Interface config file
-def getConfigs(machine):
-    """getConfigs(machine)
-    
-    Returns the list of configs currently in the passed machine.
-
-    machine: machine Object; the machine to return its Configs.
-
-    -> [config]
-    """
-    # create a list to hold the config objects
-    configs = []
-    # add Configs from each machine's config list in the machines list 
-    for i in range(len(machine.mapping_configurations)):
-        # save the current config
-        curr = machine.mapping_configurations[i]
-        # create a config object
-        TempConfig = MappingConfiguration(curr['id'], curr['mappings'], machine)
-        # append that object to the list
-        configs.append(TempConfig)
-    # return configs list
-    return configs
-
-# get Machines from the KIM Interface config file
-def getMachines(model, get_configs):
-    """getMachines(model, get_configs)
-    
-    Returns the list of Machines currently in the passed model.
-
-    model: model Object; the model object to return its Machines.
-    get_configs: bool; indicate whether to get config objects.
-
-    -> [machine]
-    """
-    # create a list to hold the machine objects
-    machines = []
-    # add Machines from the passed model's machine list 
-    for i in range(len(model.machines)):
-        # save the current machine
-        curr = model.machines[i]
-        # create a machine object
-        TempMachine = Machine(curr['name'], curr['measurements'], 
-            curr['mapping_configurations'], model)
-        # fix machine measurement character issues
-        for j in range(len(TempMachine.measurements)):
-            # save current measurement
-            curr = TempMachine.measurements[j]
-            # replace characters 
-            curr = curr.replace('Ã˜', 'Ø')
-            curr = curr.replace('Â±', '±')
-            # save the changed measurement
-            TempMachine.measurements[j] = curr
-        # if the get configs flag is set
-        if get_configs:
-            # add the machine's Configs to its Configs attribute
-            TempMachine.mapping_configurations = getConfigs(TempMachine)
-        # append that object to the list
-        machines.append(TempMachine)
-    # return machines list
-    return machines
+# returns the theme that marks conflicting sheet/cluster inputs
+def conflictTheme():
+    """conflictTheme()
+
+    Returns the theme bound to the sheet/cluster inputs of rows that share a
+    sheet/cluster with another row (created once per session).
+
+    -> DPG Theme ID
+    """
+    # create the theme once
+    if not dpg.does_alias_exist("mapConflictTheme"):
+        with dpg.theme(tag = "mapConflictTheme"):
+            with dpg.theme_component(dpg.mvInputText):
+                # red frame and text
+                dpg.add_theme_color(dpg.mvThemeCol_FrameBg, [120, 30, 30])
+                dpg.add_theme_color(dpg.mvThemeCol_Text, [255, 150, 75])
+    # return the theme
+    return "mapConflictTheme"
 
+
+### Object-Returning Functions
 # get Models from the KIM Interface config file
 def getModels(get_machines, get_configs):
     """getModels(get_machines, get_configs)
     
     Returns the list of Models currently in the KIM Interface config file.
+    The list is hydrated once per config load and served from the config cache.
 
     get_machines: bool; indicate whether to get machine objects.
     get_configs: bool; indicate whether to continue after getMachines (config objects).
 
     -> [model]
     """
-    # get the KIM Interface config
-    Interface_Config_File = openConfigFile()
-    # set models
-    models = Interface_Config_File['models']
-    # convert to a list of model objects
-    for i in range(len(models)):
-        # save current model
-        curr = models[i]
-        # create a new model object
-        TempModel = Model(curr['name'], curr['base_information'], curr['machines'])
-        # if the get_machines flag is set
-        if get_machines:
-            # add the model's Machines to its Machines attribute
-            TempModel.machines = getMachines(TempModel, get_configs)
-        # overwrite the model in the models list
-        models[i] = TempModel
-    # return models list
-    return models
+    # get the models from the core (hydrated only if the config file changed)
+    return Interface_Core.getModels(get_machines, get_configs)
+
+# get the lookup index of the current KIM Interface config
+def getConfigIndex():
+    """getConfigIndex()
+    
+    Returns the name/ID lookup index of the current KIM Interface config file.
+    The index is built once per config load and dropped on every commit.
+
+    -> ConfigIndex
+    """
+    # get the index from the core (rebuilt only if the config file changed)
+    return Interface_Core.getConfigIndex()
+
+# get the names and IDs in use in the current KIM Interface config
+def getValidationIndex():
+    """getValidationIndex()
+
+    Returns the model names, machine names and config IDs in use in the current
+    KIM Interface config file (the uniqueness checks of the validators are hash
+    lookups in it). Commits keep it current; it is only rebuilt on a new load.
+
+    -> ValidationIndex
+    """
+    # get the index from the core
+    return Interface_Core.getValidationIndex()
+
+# read the identifying value of a DPG item or a plain value
+def getInputValue(item_input):
+    """getInputValue(item_input)
+    
+    item_input: DPG Item | str; a DPG item holding a value, or the value itself.
+
+    Returns the value of the DPG item, or the passed value as a string if it is not a DPG item.
+
+    -> str
+    """
+    # attempt with input as a DPG item
+    try:
+        return dpg.get_value(item_input)
+    # input isn't a dpg item, it must be a string
+    except Exception:
+        return str(item_input)
 
 # return a model object flexibly
 def dynamicGetModel(model_input):
@@ -415,27 +329,11 @@ def dynamicGetModel(model_input):
 
     model_input: Model | DPG Listbox | str; some form of identifying information of a model.
     """
-    # get model list
-    models = getModels(get_machines = True, get_configs = True)
-    # test if input is already a model
-    if not (isinstance(model_input, Model)):
-        # find the actual model object
-        for i in range(len(models)):
-            # save the current model
-            curr = models[i]
-            # do the model names match?
-            try:
-                if curr.name == dpg.get_value(model_input):
-                    # return the current model
-                    return curr
-            # input isn't a dpg item, it must be a string
-            except Exception as ex:
-                if str(curr.name) == str(model_input):
-                    # return the current model
-                    return curr
     # the model is already a model, just return it
-    else:
+    if isinstance(model_input, Model):
         return model_input
+    # look up the model by name
+    return getConfigIndex().getModel(getInputValue(model_input))
 
 # return a machine object flexibly
 def dynamicGetMachine(machine_input, model = None):
@@ -444,43 +342,23 @@ def dynamicGetMachine(machine_input, model = None):
 
     machine_input: Machine | DPG Listbox | str; some form of identifying information of a machine.
     model: (optional) Model; limits the search to a specific model object.
+
+    Committed machines are found through the lookup index; machines only in the passed
+    model's list (not committed yet) are found in that list.
     """
-    # hold a machines list
-    machines = []
-    # if a model is passed
-    if not (model is None):
-        # search is limited to this model, use its machine list
-        machines = model.machines
-    # model limiter wasn't passed; search all models
-    else:
-        # get model list
-        models = getModels(get_machines = True, get_configs = True)
-        # for each model in the list
-        for curr_model in models:
-            # for each machine in the model's list
-            for machine in curr_model.machines:
-                # append this machine to the list
-                machines.append(machine)
-    # test if input is already a machine
-    if not (isinstance(machine_input, Machine)):
-        # for each machine in the machines list
-        for i in range(len(machines)):
-            # save the current machine
-            curr_machine = machines[i]
-            # do the machine names match?
-            try:
-                # attempt with input as a DPG Listbox
-                if curr_machine.name == dpg.get_value(machine_input):
-                    # return the current machine
-                    return curr_machine
-            # input isn't a dpg item, it must be a string
-            except Exception as ex:
-                if str(curr_machine.name) == str(machine_input):
-                    # return the current machine
-                    return curr_machine
     # the machine is already a machine, just return it
-    else:
+    if isinstance(machine_input, Machine):
         return machine_input
+    # look up the machine by name (limited to the model if one is passed)
+    name = getInputValue(machine_input)
+    machine = getConfigIndex().getMachine(name, model = model)
+    # search the passed model's own list (it may hold machines not committed yet)
+    if (machine is None) and (model is not None):
+        for curr_machine in model.machines:
+            if str(curr_machine.name) == str(name):
+                return curr_machine
+    # return the machine (None if there is none)
+    return machine
 
 # return a config object flexibly
 def dynamicGetConfig(config_input, machine = None):
@@ -489,48 +367,27 @@ def dynamicGetConfig(config_input, machine = None):
 
     config_input: Config | DPG Listbox | str; some form of identifying information of a config.
     machine: (optional) Machine; limits the search to a specific machine object.
+
+    Committed configs are found through the lookup index; configs only in the passed
+    machine's list (not committed yet) are found in that list.
     """
-    # hold a configs list
-    configs = []
-    # if a machine is passed
-    if not (machine is None):
-        # search is limited to this machine, use its config list
-        configs = machine.mapping_configurations
-    # machine limiter wasn't passed; search all machines
-    else:
-        # get model list
-        models = getModels(get_machines = True, get_configs = True)
-        # for each model in the list
-        for curr_model in models:
-            # for each machine in the model's list
-            for curr_machine in curr_model.machines:
-                # for each config in the machine's list
-                for curr_config in curr_machine.mapping_configurations:
-                    # append this config to the list
-                    configs.append(curr_config)
-    # test if input is already a config
-    if not (isinstance(config_input, MappingConfiguration)):
-        # for each config in that machine's config list
-        for i in range(len(configs)):
-            # save the current config
-            curr_config = configs[i]
-            # do the config ids match?
-            try:
-                # attempt with input as a DPG Listbox
-                if curr_config.id_num == dpg.get_value(config_input):
-                    # return the current config
-                    return curr_config
-            # input isn't a dpg item, it must be a string
-            except Exception as ex:
-                if str(curr_config.id_num) == str(config_input):
-                    # return the current config
-                    return curr_config
     # the config is already a config, just return it
-    else:
+    if isinstance(config_input, MappingConfiguration):
         return config_input
+    # look up the config by ID (limited to the machine if one is passed)
+    id_num = getInputValue(config_input)
+    config = getConfigIndex().getConfig(id_num, machine = machine)
+    # search the passed machine's own list (it may hold configs not committed yet)
+    if (config is None) and (machine is not None):
+        for curr_config in machine.mapping_configurations:
+            if str(curr_config.id_num) == str(id_num):
+                return curr_config
+    # return the config (None if there is none)
+    return config
 
 
 ### Validation Functions
+# (the checks themselves are in ConfigValidator; these read the DPG items they are passed)
 # validates the input of an ADDED config
 def validateAddConfigInput(model, machine, new_id, info_checks, measurement_checks, 
     info_maps, measurement_maps):
@@ -553,86 +410,14 @@ def validateAddConfigInput(model, machine, new_id, info_checks, measurement_chec
     
     -> [Boolean:result, Config|Error]
     """
-    # check that an ID was entered
-    if (not new_id) or (new_id is None):
-        # no ID entered
-        return [False, 
-            {"error":"Mapping Configuration IDs cannot be blank."}]
-    # some kind of ID was entered
-    else:
-        # create a regex to compare to (0-9 and '-')
-        pattern = compile('^[0-9\\-]+$')
-        # if the entered mapping ID does not match
-        if not pattern.match(new_id):
-            # invalid ID entered
-            return [False, 
-                {"error":"Mapping Configuration IDs can only contain digits (0-9) and dashes '-'."
-                + "\nYou have included an invalid character in this ID."}]
-        # valid ID was entered
-        else:
-            # check that it is unique
-            for config in machine.mapping_configurations:
-                # if the config IDs match
-                if config.id_num == new_id:
-                    # overlapping IDs, not unique
-                    return [False, 
-                        {"error":"Mapping Configuration IDs must be unique.\n"
-                        + "The ID " + new_id + " for " + machine.name 
-                        + " has already been assigned.\n"
-                        + "Choose a different Mapping Configuration ID for this new Configuration."
-                        }]
-    # create a map list to hold the verified mapping items
-    map_list = []
-    # track the index of the model base info list
-    index = 0
-    # verify that each selected information field has a full sheet/cluster map
-    for check in info_checks:
-        # get values (s p e e d)
-        sheet = dpg.get_value(info_maps[index][0])
-        cluster = dpg.get_value(info_maps[index][1])
-        # if the checkbox was selected
-        if dpg.get_value(check):
-            # check that there were sheet and cluster #s
-            if not (sheet and cluster):
-                # bad configuration settings
-                return [False, 
-                    {"error":"Selected Model Base Information fields must all have\n"
-                    + "Sheet and Cluster #'s. You have ommited a # for at least one."}]
-            # this map is good to add
-            else:
-                # add it to the list
-                map_list.append(
-                    {"item":model.base_information[index], "sheet":int(sheet), 
-                    "cluster":int(cluster), "type":"string", "value":""})
-        # increment the model_info_loop
-        index += 1
-    # track the index of the machine measurement list
-    index = 0
-    # verify that each selected measurement has a full sheet/cluster map
-    for meas in measurement_checks:
-        # get values (s p e e d)
-        sheet = dpg.get_value(measurement_maps[index][0])
-        cluster = dpg.get_value(measurement_maps[index][1])
-        # if the checkbox was selected
-        if dpg.get_value(meas):
-            # check that there were sheet and cluster #s
-            if not (sheet and cluster):
-                # bad configuration settings
-                return [False, 
-                    {"error":"Selected Machine Measurements fields must all have\n"
-                    + "Sheet and Cluster #'s. You have ommited a # for at least one."}]
-            # this map is good to add
-            else:
-                # add it to the list
-                map_list.append(
-                    {"item":machine.measurements[index], "sheet":int(sheet), 
-                    "cluster":int(cluster), "type":"string", "value":""})
-        # increment the model_info_loop
-        index += 1
-    # if here, the config information can make a config Object
-    config = MappingConfiguration(id_num = new_id, mappings = map_list, machine = machine)
-    # return the config
-    return [True, config]
+    # read the DPG items and validate their values
+    return ConfigValidator.validateAddConfig(model, machine, new_id, 
+        [dpg.get_value(check) for check in info_checks], 
+        [dpg.get_value(check) for check in measurement_checks], 
+        [(dpg.get_value(sheet), dpg.get_value(cluster)) for sheet, cluster in info_maps[:len(info_checks)]], 
+        [(dpg.get_value(sheet), dpg.get_value(cluster)) 
+            for sheet, cluster in measurement_maps[:len(measurement_checks)]], 
+        getValidationIndex().configIds(machine.key))
 
 # validates the input of an EDITED config
 def validateEditConfigInput(machine, config, new_id, prior_id, checks, inputs):
@@ -650,68 +435,11 @@ def validateEditConfigInput(machine, config, new_id, prior_id, checks, inputs):
     
     -> [Boolean:result, Config|Error]
     """
-    # check that an ID was entered
-    if (not new_id) or (new_id is None):
-        # no ID entered
-        return [False, 
-            {"error":"Mapping Configuration IDs cannot be blank."}]
-    # some kind of ID was entered
-    else:
-        # create a regex to compare to (0-9 and '-')
-        pattern = compile('[\\-0-9]+')
-        # if the entered mapping ID does not match
-        if not pattern.match(new_id):
-            # invalid ID entered
-            return [False, 
-                {"error":"Mapping Configuration IDs can only contain digits (0-9) and dashes '-'."
-                + "\nYou have included an invalid character in this ID."}]
-        # valid ID was entered
-        else:
-            # check that it is unique
-            for config in machine.mapping_configurations:
-                # if the config IDs match
-                if config.id_num == new_id:
-                    # is the match with the prior ID
-                    if config.id_num == prior_id:
-                        # skip this config, the ID can match its previous ID
-                        continue
-                    else:
-                        # overlapping IDs, not unique
-                        return [False, 
-                            {"error":"Mapping Configuration IDs must be unique.\n"
-                            + "The ID " + new_id + " for " + str(machine) 
-                            + " has already been assigned.\n"
-                            + "Choose a different Mapping Configuration" 
-                            + " ID for this new Configuration."}]
-    # create a map list to hold the verified mapping items
-    map_list = []
-    # track the index of the config's map list
-    index = 0
-    # for each check item in the checkbox list
-    for check in checks:
-        # get values (s p e e d)
-        sheet = dpg.get_value(inputs[index][0])
-        cluster = dpg.get_value(inputs[index][1])
-        # if the checkbox was selected
-        if dpg.get_value(check):
-            # check that there were sheet and cluster #s
-            if not (sheet and cluster):
-                # bad configuration settings
-                return [False, 
-                    {"error":"Selected Configuration maps must all have\n"
-                    + "Sheet and Cluster #'s. You have ommited a # for at least one."}]
-            # this map is good to add
-            else:
-                # add it to the list
-                map_list.append(
-                    {"item":config.mappings[index]['item'], "sheet":int(sheet), 
-                    "cluster":int(cluster), "type":"string", "value":""})
-        # increment the index
-        index += 1
-    # if here, the config information can make a config Object
-    config = MappingConfiguration(id_num = new_id, mappings = map_list, machine = machine)
-    # return the config
-    return [True, config]
+    # read the DPG items and validate their values
+    return ConfigValidator.validateEditConfig(machine, config, new_id, prior_id, 
+        [dpg.get_value(check) for check in checks], 
+        [(dpg.get_value(sheet), dpg.get_value(cluster)) for sheet, cluster in inputs[:len(checks)]], 
+        getValidationIndex().configIds(machine.key))
 
 # validates the input of an ADDED machine
 def validateAddMachineInput(model, machine_name, measurements):
@@ -727,57 +455,9 @@ def validateAddMachineInput(model, machine_name, measurements):
     
     -> [Boolean:result, machine|Error]
     """
-    # check that a name was entered
-    if (not machine_name) or (machine_name is None):
-        # no name entered
-        return [False, 
-            {"error":"Machine names cannot be blank."}]
-    # some kind of name was entered
-    else:
-        # create a regex to compare to (0-9, a-z, A-Z, space, and '-')
-        pattern = compile('^[a-zA-Z0-9\\- ]+$')
-        # if the entered name does not match
-        if not pattern.match(machine_name):
-            # invalid name entered
-            return [False, 
-                {"error":"Machine names must be alphanumeric (A-Z, 0-9). They may contain\n"
-                + "spaces ' ' and dashes '-' but no other special characters.\n"
-                + "You have included an invalid character in this name."}]
-        # valid name was entered
-        else:
-            # check that the name is unique
-            for curr_machine in model.machines:
-                # if the machine names match
-                if curr_machine == machine_name:
-                    # overlapping names, not unique
-                    return [False, 
-                        {"error":"Machine names must be unique.\n"
-                        + "The Machine '" + machine_name + "' for " + str(model)
-                        + "\nhas already been assigned."
-                        + "\nChoose a different name for this Machine."}]
-    # create a list to hold valid measurements
-    meas_list = []
-    # validate the measurement inputs
-    for meas in measurements:
-        # get the measurement input box value
-        meas = dpg.get_value(meas)
-        # check that there was a value entered
-        if meas:
-            # check the length of the measurement
-            if len(meas) > 50:
-                # this is excessive in length, the input could be malicious
-                return [False, 
-                    {"error":"Measurement specs must be 50 characters or less.\n"
-                    + "One or more spec you have entered is too long."}]
-            # the measurement spec is valid
-            meas_list.append(meas)
-        # the input box was empty, omit this input
-        continue
-    # if here, the machine information can make a machine Object
-    machine = Machine(name = machine_name, measurements = meas_list, 
-        mapping_configurations = [], model = model)
-    # return the machine
-    return [True, machine]        
+    # read the DPG items and validate their values
+    return ConfigValidator.validateAddMachine(model, machine_name, 
+        [dpg.get_value(meas) for meas in measurements], getValidationIndex().machines)
 
 # validates the input of an EDITED machine
 def validateEditMachineInput(model, machine, new_name, prior_name, checks, inputs):
@@ -796,76 +476,10 @@ def validateEditMachineInput(model, machine, new_name, prior_name, checks, input
     
     -> [Boolean:result, machine|Error]
     """
-    # get the new_name value from the DPG Input item
-    new_name = dpg.get_value(new_name)
-    # check that a new name was entered
-    if (not new_name) or (new_name is None):
-        # no new name entered
-        return [False, 
-            {"error":"Machine names cannot be blank."}]
-    # some kind of new name was entered
-    else:
-        # create a regex to compare to (0-9, a-z, A-Z, space, and '-')
-        pattern = compile('^[a-zA-Z0-9\\- ]+$')
-        # if the entered name does not match
-        if not pattern.match(new_name):
-            # invalid new name entered
-            return [False, 
-                {"error":"Machine names must be alphanumeric (A-Z, 0-9). They may contain\n"
-                + "spaces ' ' and dashes '-' but no other special characters.\n"
-                + "You have included an invalid character in this name."}]
-        # valid name was entered
-        else:
-            # get the model's machine list
-            model_machines = model.machines
-            # check that the name is unique
-            for curr_machine in model_machines:
-                # if the machine names match
-                if curr_machine == new_name:
-                    # if the match is with the prior machine name
-                    if curr_machine == prior_name:
-                        # the match is okay, no edit was made to the machine name
-                        continue
-                    # the new name is another machine's name
-                    else:
-                        # overlapping names, not unique
-                        return [False, 
-                            {"error":"Machine names must be unique.\n"
-                            + "The Machine '" + new_name + "' for " + model.name
-                            + "\nhas already been assigned."
-                            + "\nChoose a different name for this Machine."}]
-    # create a list to hold valid measurements
-    meas_list = []
-    # hold a measurement index
-    index = 0
-    # for each checkbox on measurements
-    for check in checks:
-        # if the checkbox was selected
-        if dpg.get_value(check):
-            # get the measurement input box value
-            meas = dpg.get_value(inputs[index])
-            # check that there was a value entered
-            if meas and not ((meas is None) and (meas == "")):
-                # check the length of the measurement
-                if len(meas) > 50:
-                    # this is excessive in length, the input could be malicious
-                    return [False, 
-                        {"error":"Measurement specs must be 50 characters or less.\n"
-                        + "One or more spec you have entered is too long."}]
-            # the selected measurement spec input box was empty
-            else:
-                # this is invalid
-                return [False, 
-                    {"error":"Selected measurement specs must have a value.\n"
-                    + "One or more spec you have selected does not have a value."}]
-            # the measurement spec is valid
-            meas_list.append(meas)
-        # increment the index
-        index += 1
-    # if here, the machine information can make a machine Object
-    machine = Machine(name = new_name, measurements = meas_list)
-    # return the machine
-    return [True, machine]   
+    # read the DPG items and validate their values
+    return ConfigValidator.validateEditMachine(model, machine, dpg.get_value(new_name), prior_name, 
+        [dpg.get_value(check) for check in checks], 
+        [dpg.get_value(inp) for inp in inputs[:len(checks)]], getValidationIndex().machines)
 
 # validates the input of an ADDED model
 def validateAddModelInput(model_name, base_information):
@@ -880,61 +494,9 @@ def validateAddModelInput(model_name, base_information):
     
     -> [Boolean:result, model|Error]
     """
-    # check that a name was entered
-    if (not model_name) or (model_name is None):
-        # no name entered
-        return [False, 
-            {"error":"Model names cannot be blank."}]
-    # some kind of name was entered
-    else:
-        # check the name's length (MUST be exactly 3)
-        if not (len(model_name) == 3):
-            # model name is too short or long
-            return [False, 
-                {"error":"Model names must be 3 characters in length."}]
-        # create a regex to compare to (0-9, A-Z)
-        pattern = compile('^[A-Z0-9]+$')
-        # if the entered name does not match
-        if not pattern.match(model_name):
-            # invalid name entered
-            return [False, 
-                {"error":"Model names can only contain capital letters and digits.\n"
-                + "You have included an invalid character in this name."}]
-        # valid name was entered
-        else:
-            # get the model list
-            models = getModels(get_machines = False, get_configs = False)
-            # check that the name is unique
-            for curr_model in models:
-                # if the model names match
-                if curr_model.name == model_name:
-                    # overlapping names, not unique
-                    return [False, 
-                        {"error":"Model names must be unique.\n"
-                        + "The Model '" + model_name + "' has already been defined.\n"
-                        + "Choose a different name for this Model."}]
-    # create a list to hold valid base information headers
-    info_list = []
-    # validate the base information inputs
-    for info in base_information:
-        # get the base information input box value
-        info = dpg.get_value(info)
-        # check that there was a value entered
-        if info:
-            # check the length of the base information
-            if len(info) > 50:
-                # this is excessive in length, the input could be malicious
-                return [False, 
-                    {"error":"Base information headers must be 50 characters or less.\n"
-                    + "One or more header you have entered is too long."}]
-            # the base information is valid
-            info_list.append(info)
-        # the input box was empty, omit this input
-        continue
-    # if here, the model information can make a model Object
-    model = Model(name = model_name, base_information = info_list, machines = [])
-    # return the model
-    return [True, model]  
+    # read the DPG items and validate their values (names must be unique among the models)
+    return ConfigValidator.validateAddModel(getValidationIndex().models, 
+        model_name, [dpg.get_value(info) for info in base_information])
 
 # validates the input of an EDITED model
 def validateEditModelInput(model, new_name, prior_name, checks, inputs):
@@ -942,7 +504,7 @@ def validateEditModelInput(model, new_name, prior_name, checks, inputs):
     validateEditModelInput(model, new_name, prior_name, checks, inputs)
 
     model: model; model being edited.
-    new_name: DPG Input Item; the Inputbox holding the model's name after editing.
+    new_name: str; the model's name after editing.
     prior_name: str; name of the model before editing.
     checks: [DPG Checkboxes]; list of the DPG items used to select base information.
     inputs: [DPG Inputs]; list of the DPG items used to assign each model base 
@@ -952,110 +514,40 @@ def validateEditModelInput(model, new_name, prior_name, checks, inputs):
     
     -> [Boolean:result, model|Error]
     """
-    # check that a name was entered
-    if (not new_name) or (new_name is None):
-        # no name entered
-        return [False, 
-            {"error":"Model names cannot be blank."}]
-    # some kind of name was entered
-    else:
-        # check the name's length (MUST be exactly 3)
-        if not (len(new_name) == 3):
-            # model name is too short or long
-            return [False, 
-                {"error":"Model names must be 3 characters in length."}]
-        # create a regex to compare to (0-9, A-Z)
-        pattern = compile('^[A-Z0-9]+$')
-        # if the entered name does not match
-        if not pattern.match(new_name):
-            # invalid name entered
-            return [False, 
-                {"error":"Model names can only contain capital letters and digits.\n"
-                + "You have included an invalid character in this name."}]
-        # valid name was entered
-        else:
-            # get the model list
-            models = getModels(get_machines = True, get_configs = True)
-            # check that the name is unique
-            for curr_model in models:
-                # if the model names match
-                if curr_model.name == new_name:
-                    # if the match is with the prior model name
-                    if curr_model.name == prior_name:
-                        # this is okay, skip the match
-                        continue
-                    else:
-                        # overlapping names, not unique
-                        return [False, 
-                            {"error":"Model names must be unique.\n"
-                            + "The Model '" + new_name + "' has already been defined.\n"
-                            + "Choose a different name for this Model."}]
-    # create a list to hold valid base information headers
-    info_list = []
-    # hold a base information index
-    index = 0
-    # for each checkbox on base information
-    for check in checks:
-        # if the checkbox was selected
-        if dpg.get_value(check):
-            # get the base information input box value
-            info = dpg.get_value(inputs[index])
-            # check that there was a value entered
-            if info and not ((info is None) and (info == "")):
-                # check the length of the base information header
-                if len(info) > 50:
-                    # this is excessive in length, the input could be malicious
-                    return [False, 
-                        {"error":"Base Information headers must be 50 characters or less.\n"
-                        + "One or more header you have entered is too long."}]
-            # the selected base information header input box was empty
-            else:
-                # this is invalid
-                return [False, 
-                    {"error":"Selected Base Information headers must have a value.\n"
-                    + "One or more header you have selected does not have a value."}]
-            # the base information header is valid
-            info_list.append(info)
-        # increment the index
-        index += 1
-    # if here, the model information can make a model Object
-    model = Model(name = new_name, base_information = info_list, machines = model.machines)
-    # return the model
-    return [True, model]
-
+    # read the DPG items and validate their values (names must be unique among the models)
+    return ConfigValidator.validateEditModel(getValidationIndex().models, 
+        model, new_name, prior_name, [dpg.get_value(check) for check in checks], 
+        [dpg.get_value(inp) for inp in inputs[:len(checks)]])
 
 # currentAverageRuntime allows calculation of the current average runtime of the script
 def currentAverageRuntime():
     """currentAverageRuntime()
     
     Calculates the average runtime of the system based on the current information in runtime_log.txt.
+    Only the lines appended since the last call are parsed (see RuntimeStats).
     """
-    # open the runtime_log.txt file
-    log = os.path.join(sys_env_dir, "logs", "runtime_log.txt")
-    File = open(log, 'r')
-    # get lines from the file
-    lines = File.readlines()
-    # close log
-    File.close()
-    # initialize a count and a total
-    count = 0
-    total = 0
-    # for loop over the lines in runtime log
-    for line in lines:
-        # if line isnt blank
-        if line != '\n':
-            # get the tracked time of the run
-            runtime = line.split(' ')
-            # convert to a float value
-            runtime = float(runtime[3])
-            # add to total
-            total += runtime
-            # increment count
-            count += 1
-    # use total / count to calculate average
-    average_runtime = total / count
+    # get the running statistics
+    stats = Interface_Runtime_Stats.summary()
+    # no runs logged yet
+    if stats['mean'] is None:
+        return "No script calls logged yet"
     # output average
-    return ('{:f}'.format(average_runtime) + " seconds per script call")
+    return ('{:f}'.format(stats['mean']) + " seconds per script call")
+
+# currentRuntimeQuantiles shows the spread of the script runtimes
+def currentRuntimeQuantiles():
+    """currentRuntimeQuantiles()
+
+    Returns the p50/p95/p99 runtimes of the system (within 1%) from runtime_log.txt.
+    """
+    # get the running statistics
+    stats = Interface_Runtime_Stats.summary()
+    # no runs logged yet
+    if stats['count'] == 0:
+        return ""
+    # output the quantiles
+    return ("p50 " + '{:f}'.format(stats['p50']) + " / p95 " + '{:f}'.format(stats['p95'])
+        + " / p99 " + '{:f}'.format(stats['p99']) + " seconds")
 
 
 ### Callback Segment
@@ -1067,8 +559,11 @@ def closeProgram(sender, app_data, user_data):
     
     Callback that closes the program on invoke.
     """
-    # create a new backup
-    createConfigBackup()
+    # stop following results.txt
+    Interface_Results_Watcher.stop()
+    # fold the journal in, refresh the config file, back it up (waiting a bounded time for
+    # the backup) and close the changelog and store
+    Interface_Core.shutdown(Interface_Core.backup_exit_timeout)
     # exit the program
     dpg.destroy_context()
     raise SystemExit(1)
@@ -1145,23 +640,14 @@ def commitConfigEdits(sender, app_data, user_data):
     else:
         # input was valid, continue
         edited_config = validation[1]
-        # get the Interface config file
-        Interface_Config_File = openConfigFile()
-        # get the index of the edited config
-        config_index = machine.mapping_configurations.index(config)
-        # get the index of the Machine in the Model
-        machine_index = model.machines.index(machine)
-        # get the index of the Model in the config file
-        model_index = Interface_Config_File['models'].index(Model.modelToDict(model))
+        # the edited config keeps the identity of the config it replaces
+        edited_config.key = config.key
+        # commit the Config to the config file
+        commitConfigOperations([ConfigOperation.replace(
+            MappingConfiguration.configToDict(edited_config))], 
+            "Edit Configuration: " + str(machine) + "; " + str(edited_config))
         # update the Config in the Machine
-        machine.mapping_configurations[config_index] = edited_config
-        # update the Machine in the Model
-        model.machines[machine_index] = machine
-        # update the Model in the config file
-        Interface_Config_File['models'][model_index] = Model.modelToDict(model)
-        # overwrite the config file
-        overwriteConfigFile(Interface_Config_File, "Edit Configuration: " 
-            + str(machine) + "; " + str(edited_config))
+        machine.mapping_configurations[machine.mapping_configurations.index(config)] = edited_config
         # update the config Object in runtime memory
         config = edited_config
         # clear the Popup alias
@@ -1218,28 +704,12 @@ def commitConfigAdd(sender, app_data, user_data):
     else:
         # input was valid, continue
         new_config = validation[1]
-        # get the Interface config file
-        Interface_Config_File = openConfigFile()
-        # get the index of the Machine in the Model
-        machine_index = model.machines.index(machine)
-        # get the index of the Model in the config file
-        model_index = Interface_Config_File['models'].index(Model.modelToDict(model))
+        # commit the Config to the Machine in the config file
+        commitConfigOperations([ConfigOperation.add(machine.key, 
+            MappingConfiguration.configToDict(new_config))], 
+            "Add Configuration: " + str(machine) + "; " + str(new_config))
         # add the Config to the Machine
         machine.mapping_configurations.append(new_config)
-        # fix corrupt character writing
-        for curr_mapping in machine.mapping_configurations:
-            for curr_map in curr_mapping.mappings:
-                # save the current map
-                item = curr_map['item']
-                item = item.replace('Ã˜', 'Ø')
-                item = item.replace('Â±', '±')
-        # update the Machine in the Model
-        model.machines[machine_index] = machine
-        # update the Model in the config file
-        Interface_Config_File['models'][model_index] = Model.modelToDict(model)
-        # overwrite the config file
-        overwriteConfigFile(Interface_Config_File, "Add Configuration: " 
-            + str(machine) + "; " + str(new_config))
         # update the config Object in runtime memory
         config = new_config
         # clear the Popup alias
@@ -1277,54 +747,24 @@ def commitConfigDuplicate(sender, app_data, user_data):
     config = user_data[2]
     # get the ID
     dest_config_id = dpg.get_value(user_data[3])
-    # validate the config's ID
-    # create a regex to compare to (0-9 and '-')
-    pattern = compile('^[0-9\\-]+$')
-    # if the entered mapping ID does not match
-    if not pattern.match(dest_config_id):
-        # invalid ID entered
-        showWarningPopup("Mapping Configuration IDs can only contain digits (0-9) and dashes '-'."
-            + "\nYou have included an invalid character in this ID.")
+    # validate the config's ID (well-formed and unique in the machine)
+    error = ConfigValidator.validateConfigId(machine, dest_config_id, 
+        taken = getValidationIndex().configIds(machine.key))
+    # invalid ID entered
+    if error is not None:
+        showWarningPopup(error['error'])
         # destroy the popup
         clearWindow("duplicateConfigPopup")
         return
-    # valid ID was entered
-    else:
-        # check that it is unique
-        for config in machine.mapping_configurations:
-            # if the config IDs match
-            if config.id_num == dest_config_id:
-                # overlapping IDs, not unique
-                showWarningPopup("Mapping Configuration IDs must be unique.\n"
-                    + "The ID " + dest_config_id + " has already been assigned.\n"
-                    + "Choose a different Mapping Configuration ID for this new Configuration.")
-                # destroy the popup
-                clearWindow("duplicateConfigPopup")
-                return
-    # ID is acceptable, duplicate the config
-    dest_config = MappingConfiguration(dest_config_id, config.mappings, config.machine)
-    # open the interface config file
-    Interface_Config_File = openConfigFile()
-    # get the model index
-    model_index = Interface_Config_File['models'].index(Model.modelToDict(model))
-    # get the machine index
-    machine_index = model.machines.index(machine)
+    # ID is acceptable, duplicate the config (copy its mappings; the duplicate gets a new key)
+    dest_config = MappingConfiguration(dest_config_id, 
+        [dict(mapping) for mapping in config.mappings], config.machine)
+    # commit the new config to the machine in the config file
+    commitConfigOperations([ConfigOperation.add(machine.key, 
+        MappingConfiguration.configToDict(dest_config))], 
+        "Duplicate Config: copied " + config.id_num + " --> " + dest_config.id_num)
     # add the new config to the machine object
     machine.mapping_configurations.append(dest_config)
-    # fix corrupt character writing
-    for curr_mapping in machine.mapping_configurations:
-        for curr_map in curr_mapping.mappings:
-            # save the current map
-            item = curr_map['item']
-            item = item.replace('Ã˜', 'Ø')
-            item = item.replace('Â±', '±')
-    # update the machine in the model's list
-    model.machines[machine_index] = machine
-    # update the model in the config file
-    Interface_Config_File['models'][model_index] = Model.modelToDict(model)
-    # overwrite the KIM Interface config file
-    overwriteConfigFile(Interface_Config_File, "Duplicate Config: copied " + config.id_num 
-        + " --> " + dest_config.id_num)
     # clear the Popup alias
     clearWindow("confirmPopup")
     # create the confirmation popup
@@ -1352,27 +792,15 @@ def commitConfigRemove(sender, app_data, user_data):
 
     Commits the removal of a mapping configuration from the system environment.
     """
-    # get the model Object owning this config
-    model = user_data[0]
     # get the machine Object to be removed
     machine = user_data[1]
     # get the removed config
     config = user_data[2]
-    # open the interface config file
-    Interface_Config_File = openConfigFile()
-    # get the model index
-    model_index = Interface_Config_File['models'].index(Model.modelToDict(model))
-    # get the machine index
-    machine_index = model.machines.index(machine)
+    # commit the removal of the config from the config file
+    commitConfigOperations([ConfigOperation.remove(config.key)], 
+        "Remove Config: " + str(machine) + "; ID # " +  config.id_num)
     # remove the config from the Machine
-    machine.mapping_configurations.pop(machine.mapping_configurations.index(config))
-    # update the Machine in the Model
-    model.machines[machine_index] = machine
-    # update the model in the config file
-    Interface_Config_File['models'][model_index] = Model.modelToDict(model)
-    # overwrite the KIM Interface config file
-    overwriteConfigFile(Interface_Config_File, "Remove Config: " 
-        + str(machine) + "; ID # " +  config.id_num)
+    machine.mapping_configurations.remove(config)
     # clear the remove popup
     clearWindow("removeConfig")
     # clear the Popup alias
@@ -1391,6 +819,60 @@ def commitConfigRemove(sender, app_data, user_data):
         dpg.add_button(label = "Okay!", pos = [125, 100], width = 150, height = 25,
             callback = selectModel, user_data = ["removeConfig"])
 
+# updates the sheet/cluster occupancy of a config editor after an edit
+def updateMapOccupancy(sender, app_data, user_data):
+    """updateMapOccupancy(user_data = [occupancy, row, rows, status_text])
+
+    occupancy: ClusterOccupancy; the sheet/cluster claims of the editor's rows.
+    row: int; the edited row.
+    rows: [[DPG Checkbox, DPG Input, DPG Input]]; the check, sheet and cluster items of every row.
+    status_text: DPG Text; shows the number of conflicts.
+
+    Moves the claim of the edited row and re-themes only the rows whose conflict state
+    changed (rows sharing the old or new sheet/cluster); the cluster hint of the row
+    shows the next free cluster of its sheet.
+    """
+    # get the occupancy and the edited row
+    Occupancy = user_data[0]
+    row = user_data[1]
+    rows = user_data[2]
+    Check, SheetInput, ClusterInput = rows[row]
+    # move the row's claim
+    changed = Occupancy.update(row, dpg.get_value(SheetInput), dpg.get_value(ClusterInput), 
+        dpg.get_value(Check))
+    # mark the rows that conflict; clear the rows that no longer do
+    for changed_row in changed:
+        theme = conflictTheme() if Occupancy.conflicted(changed_row) else 0
+        dpg.bind_item_theme(rows[changed_row][1], theme)
+        dpg.bind_item_theme(rows[changed_row][2], theme)
+    # suggest the next free cluster of the row's sheet
+    free = Occupancy.nextFree(dpg.get_value(SheetInput))
+    dpg.configure_item(ClusterInput, hint = "" if free is None else "next: " + str(free))
+    # show the number of conflicts
+    dpg.set_value(user_data[3], "" if Occupancy.conflicts == 0 
+        else "! - " + str(Occupancy.conflicts) + " Sheet/Cluster #'s are used by more than one field.")
+
+# sets up the sheet/cluster occupancy of a config editor
+def trackMapOccupancy(rows, status_text):
+    """trackMapOccupancy(rows, status_text)
+
+    rows: [[DPG Checkbox, DPG Input, DPG Input]]; the check, sheet and cluster items of every row.
+    status_text: DPG Text; shows the number of conflicts.
+
+    Claims the entered sheet/cluster of every row once and sets every check and input
+    to update the occupancy when it is edited.
+    """
+    # create the occupancy
+    Occupancy = ClusterOccupancy()
+    for row in range(len(rows)):
+        user_data = [Occupancy, row, rows, status_text]
+        # claim the row's current map (marks existing conflicts)
+        updateMapOccupancy("", "", user_data)
+        # update the occupancy on every edit of the row
+        for item in rows[row]:
+            dpg.set_item_callback(item, updateMapOccupancy)
+            dpg.set_item_user_data(item, user_data)
+
 # add config flow
 def addConfig(sender, app_data, user_data):
     """
@@ -1484,6 +966,12 @@ def addConfig(sender, app_data, user_data):
             measurement_mappings.append(input_pair)
             # increment the position offset
             pos_offset += 1
+        # add a sheet/cluster conflict label
+        ConflictText = dpg.add_text("", color = [255, 150, 75], pos = [50, 590])
+        # highlight sheet/cluster conflicts as the maps are entered
+        trackMapOccupancy([[info_checkboxes[i]] + info_mappings[i] for i in range(len(info_checkboxes))]
+            + [[measurement_checkboxes[i]] + measurement_mappings[i] 
+            for i in range(len(measurement_checkboxes))], ConflictText)
         # add 'finalize' config button
         dpg.add_button(label = "Add Mapping Configuration", callback = commitConfigAdd, 
             user_data = [model, machine, NewConfigID, info_checkboxes, measurement_checkboxes, 
@@ -1602,6 +1090,10 @@ def editConfig(sender, app_data, user_data):
                     + "    remove it from the Configuration's mappings.\n"
                     + "    This should be avoided, if possible.", 
                     pos = [450, 225], color = [150, 150, 255])
+        # add a sheet/cluster conflict label
+        ConflictText = dpg.add_text("", color = [255, 150, 75], pos = [50, 570])
+        # highlight sheet/cluster conflicts (existing ones too) as the maps are edited
+        trackMapOccupancy([[checks[i]] + inputs[i] for i in range(len(checks))], ConflictText)
         # add a Finish Editing button
         dpg.add_button(label = "Finish Editing Configuration", width = 270, pos = [50, 600],
             callback = commitConfigEdits, user_data = 
@@ -1831,19 +1323,9 @@ def commitMachineEdits(sender, app_data, user_data):
             for i in removed_items:
                 # remove that item by index
                 config.mappings.pop(i)
-        # get the KIM Interface config file 
-        Interface_Config_File = openConfigFile()
-        # get the model index
-        model_index = Interface_Config_File['models'].index(Model.modelToDict(model))
-        # get the machine index
-        machine_index = model.machines.index(Machine.machineToDict(machine))
-        # update the machine in the model list
-        model.machines[machine_index] = Machine.machineToDict(edited_machine)
-        # update the model in the config file
-        Interface_Config_File['models'][model_index] = model
-        # overwrite the KIM Interface config file
-        overwriteConfigFile(Interface_Config_File, "Edit Machine: " + machine.name 
-            + " --> " + edited_machine.name)
+        # commit the machine to the config file
+        commitConfigOperations([ConfigOperation.replace(Machine.machineToDict(edited_machine))], 
+            "Edit Machine: " + machine.name + " --> " + edited_machine.name)
         # update the machine object in runtime 
         machine = edited_machine
         # clear the Popup alias
@@ -1887,16 +1369,11 @@ def commitMachineAdd(sender, app_data, user_data):
     else:
         # format the new machine information
         new_machine = validation[1]
-        # open KIM Interface config
-        Interface_Config_File = openConfigFile()
-        # get the index of the machine's model in KIM Interface config
-        model_index = Interface_Config_File['models'].index(Model.modelToDict(model))
+        # commit the new Machine to the Model in the config file
+        commitConfigOperations([ConfigOperation.add(model.key, 
+            Machine.machineToDict(new_machine))], "Add Machine: " + new_machine.name)
         # add the new Machine to the Model
         model.machines.append(new_machine)
-        # update the Model in the config file
-        Interface_Config_File['models'][model_index] = Model.modelToDict(model)
-        # overwrite the KIM Interface config file
-        overwriteConfigFile(Interface_Config_File, "Add Machine: " + new_machine.name)
         # clear the Popup alias
         clearWindow("confirmPopup")
         # create the confirmation popup
@@ -1922,20 +1399,11 @@ def commitMachineRemove(sender, app_data, user_data):
     machine: machine; machine being removed.
 
     Removes a machine from a model in the KIM Interface config."""
-    # get model
-    model = user_data[0]
     # get machine
     machine = user_data[1]
-    # get the KIM Interface config file
-    Interface_Config_File = openConfigFile()
-    # get the index of the model in the model list
-    model_index = Interface_Config_File['models'].index(
-        Model.modelToDict(model))
-    # update that model's machine list
-    Interface_Config_File['models'][model_index]['machines'].remove(
-        Machine.machineToDict(machine))
-    # overwrite the KIM Interface config file
-    overwriteConfigFile(Interface_Config_File, "Remove Machine: " + machine.name)
+    # commit the removal of the machine from its model's machine list
+    commitConfigOperations([ConfigOperation.remove(machine.key)], 
+        "Remove Machine: " + machine.name)
     # clear the remove popup
     clearWindow("removeMachine")
     # clear the Popup alias
@@ -2017,7 +1485,7 @@ def editMachineSubwindow(sender, app_data, user_data):
         # add a Finish Editing button
         dpg.add_button(label = "Finish Editing Machine", width = 270, pos = [75, 500],
             callback = commitMachineEdits, user_data = 
-            [model, machine, "machineNameInput", machine['name'], checks, inputs])
+            [model, machine, "machineNameInput", machine.name, checks, inputs])
 
 def updateMachineMidEdit(sender, app_data, user_data):
     """updateMachineMidEdit(user_data = [model, machine, new_spec])
@@ -2032,16 +1500,11 @@ def updateMachineMidEdit(sender, app_data, user_data):
     model = user_data[0]
     # get the machine
     machine = user_data[1]
-    # get the KIM Interface config file
-    Interface_Config_File = openConfigFile()
-    # find the machine in KIM Interface config
-    machine_index = Interface_Config_File['machines'].index(Machine.machineToDict(machine))
     # add the new spec to the machine
     machine.measurements.append(dpg.get_value(user_data[2]))
-    # update the machine in the KIM Interface config file
-    Interface_Config_File['machines'][machine_index] = Machine.machineToDict(machine)
-    # overwrite the KIM Interface config file
-    overwriteConfigFile(Interface_Config_File, "Edit Machine: " + machine.name)
+    # commit the machine to the KIM Interface config file
+    commitConfigOperations([ConfigOperation.replace(Machine.machineToDict(machine))], 
+        "Edit Machine: " + machine.name)
     # update the editMachineSubwindow
     editMachineSubwindow(sender = "", app_data = "", 
         user_data = [model, machine, [], []])
@@ -2375,20 +1838,17 @@ def commitModelEdits(sender, app_data, user_data):
     else:
         # input was valid, continue
         edited_model = validation[1]
-        # open the KIM Interface config file
-        Interface_Config_File = openConfigFile()
+        # the edited model keeps the identity of the model it replaces
+        edited_model.key = model.key
         # if the model name has been changed
         if edited_model.name != model.name:
             # update the machine names in the model machine list
-            for machine in edited_model:
+            for machine in edited_model.machines:
                 # change the first three characters to match the new model name
                 machine.name = edited_model.name + machine.name[3:]
-        # find the unedited model in the config file
-        model_index = Interface_Config_File['models'].index(Model.modelToDict(model))
-        # put the edited model in KIM Interface config
-        Interface_Config_File['models'][model_index] = Model.modelToDict(edited_model)
-        # overwrite the KIM Interface config file
-        overwriteConfigFile(Interface_Config_File, "Edit Model: " + str(edited_model.name))
+        # commit the edited model to KIM Interface config
+        commitConfigOperations([ConfigOperation.replace(Model.modelToDict(edited_model))], 
+            "Edit Model: " + str(edited_model.name))
         # update the model object in runtime memory
         model = edited_model
         # clear the Popup alias
@@ -2431,12 +1891,9 @@ def commitModelAdd(sender, app_data, user_data):
     else:
         # input was valid, continue
         new_model = validation[1]
-        # add the new model to the KIM Interface config file (open KIM Interface config)
-        Interface_Config_File = openConfigFile()
-        # add the new model to the models list
-        Interface_Config_File['models'].append(Model.modelToDict(new_model))
-        # overwrite the KIM Interface config file
-        overwriteConfigFile(Interface_Config_File, "Add Model: " + new_model.name)
+        # commit the new model to the models list of the KIM Interface config file
+        commitConfigOperations([ConfigOperation.add(None, Model.modelToDict(new_model))], 
+            "Add Model: " + new_model.name)
         # update model object in runtime memory
         model = new_model
         # clear the Popup alias
@@ -2465,12 +1922,8 @@ def commitModelRemove(sender, app_data, user_data):
     Removes a model in the KIM Interface config."""
     # get the removed model
     model = user_data[0]
-    # get the KIM Interface config file
-    Interface_Config_File = openConfigFile()
-    # remove that model from the list
-    Interface_Config_File['models'].remove(Model.modelToDict(model))
-    # overwrite the KIM Interface config file
-    overwriteConfigFile(Interface_Config_File, "Remove Model: " + model.name)
+    # commit the removal of that model from the list
+    commitConfigOperations([ConfigOperation.remove(model.key)], "Remove Model: " + model.name)
     # clear the remove popup
     clearWindow("removeModel")
     # clear the Popup alias
@@ -2568,20 +2021,9 @@ def updateModelMidEdit(sender, app_data, user_data):
     model = user_data[0]
     # add the new base information header to the model
     model.base_information.append(dpg.get_value(user_data[1]))
-    # convert the model to a dict
-    model_json = Model.modelToDict(model)
-    # get the KIM Interface config file
-    Interface_Config_File = openConfigFile()
-    # find the model in the config file
-    for i in range(len(Interface_Config_File['models'])):
-        # save the current model
-        curr_model = Interface_Config_File['models'][i]
-        # if the model names match
-        if curr_model['name'] == model.name:
-            # save the new model here
-            Interface_Config_File['models'][i] = model_json
-    # overwrite the KIM Interface config file
-    overwriteConfigFile(Interface_Config_File, "Edit Model: " + model.name)
+    # commit the model to the KIM Interface config file
+    commitConfigOperations([ConfigOperation.replace(Model.modelToDict(model))], 
+        "Edit Model: " + model.name)
     # update the editModelSubwindow
     editModelSubwindow(sender = "", app_data = "", user_data = [model, [], []])
     # delete the popup
@@ -2972,20 +2414,10 @@ def updateSelectedMachine(sender, app_data, user_data):
     machine_name = dpg.get_value(user_data[0])
     # set the machine text value
     dpg.set_value(user_data[2], machine_name)
-    # get the configuration objects
-    models = getModels(get_machines = True, get_configs = True)
-    # find the machine in the model list
-    for model in models:
-        # go through each machine 
-        for machine in model.machines:
-            # does the machine name match?
-            if machine.name == machine_name:
-                # save this machine's Configs
-                config_list = machine.mapping_configurations
-    # update the list to just hold IDs
-    for i in range(len(config_list)):
-        # set the current index of the list to just the ID
-        config_list[i] = config_list[i].id_num
+    # find the machine in the config index
+    machine = getConfigIndex().getMachine(machine_name)
+    # save this machine's Config IDs (new list; the machine is cached)
+    config_list = [config.id_num for config in machine.mapping_configurations]
     # show the mapping configuration selection list
     updateMappingConfigurationList(sender = "", app_data = "", user_data = [user_data[1], config_list])
 
@@ -2994,6 +2426,8 @@ def showResultsView(sender, app_data, user_data):
     """showResultsView(user_data = [])
 
     Creates a widget view that shows the most recent results.
+    The results watcher re-reads results.txt when it changes and the view is
+    updated from its queue between frames.
     """
     # is the informationWindow shown?
     if dpg.does_alias_exist("informationWindow"):
@@ -3005,45 +2439,174 @@ def showResultsView(sender, app_data, user_data):
             no_title_bar = False, pos = [dpg.get_viewport_width() - 575, 30])
         # add items to the Result View Window
         with ResultsViewWindow:
-            # get the results.txt file text
-            File = open(os.path.join(sys_env_dir, "results.txt"), 'r')
-            # read the file
-            results = File.read()
-            # close the file
-            File.close()
-            # replace invalid character readings
-            results = results.replace('Ã˜', 'Ø')
-            results = results.replace('Â±', '±')
-            # add a list of outputs
-            dpg.add_text(results)
+            # refresh rate and last-read latency
+            dpg.add_text("Waiting for results...", tag = "resultsViewStatus", color = [0, 255, 0])
+            # add a list of outputs (filled by the results watcher)
+            dpg.add_text("", tag = "resultsViewText")
+        # follow results.txt in the background
+        Interface_Results_Watcher.start()
     # the info window isnt open yet, open it with the Results window flag set
     else:
         informationWindow(sender = "", app_data = "", user_data = [False, True, False])
 
+# shows the current page of the log view
+def renderLogsView():
+    """renderLogsView()
+
+    Writes the rows on screen into the Logs View window's row items.
+    """
+    # the window is closed
+    if not dpg.does_alias_exist("logsViewWindow"):
+        return
+    # get the rows on screen
+    lines = Interface_Log_View.visibleLines()
+    # fill the row items (blank past the last line)
+    for i in range(Interface_Log_View.rows):
+        dpg.set_value("logsViewRow" + str(i), lines[i][1] if i < len(lines) else "")
+    # show the position
+    count = Interface_Log_View.rowCount()
+    status = ("Lines " + str(Interface_Log_View.top + 1 if count else 0) + "-" 
+        + str(Interface_Log_View.top + len(lines)) + " of " + str(count))
+    if Interface_Log_View.filter is not None:
+        status += " (filtered)"
+    dpg.set_value("logsViewStatus", status)
+    dpg.set_value("logsViewFollow", Interface_Log_View.follow)
+
+# callback to page through the log view
+def pageLogsView(sender, app_data, user_data):
+    """pageLogsView(user_data = [delta])
+
+    delta: int | "start" | "end"; the number of rows to move, or a jump.
+    """
+    # jump to the first page
+    if user_data[0] == "start":
+        Interface_Log_View.jumpStart()
+    # jump to the last page (and follow)
+    elif user_data[0] == "end":
+        Interface_Log_View.jumpEnd()
+    # move by rows
+    else:
+        Interface_Log_View.scroll(user_data[0])
+    # show the page
+    renderLogsView()
+
+# callback to scroll the log view with the mouse wheel
+def wheelLogsView(sender, app_data, user_data):
+    """wheelLogsView(app_data = wheel steps)
+
+    Scrolls the log view 3 rows per wheel step while the mouse is over its rows.
+    """
+    # only while the rows are hovered
+    if dpg.does_alias_exist("logsViewRows") and dpg.is_item_hovered("logsViewRows"):
+        Interface_Log_View.scroll(-int(app_data) * 3)
+        renderLogsView()
+
+# callback to turn following the log on or off
+def toggleLogsViewFollow(sender, app_data, user_data):
+    """toggleLogsViewFollow(app_data = follow)"""
+    # following starts at the end
+    if app_data:
+        Interface_Log_View.jumpEnd()
+    else:
+        Interface_Log_View.follow = False
+    # show the page
+    renderLogsView()
+
+# callback to filter the log view
+def filterLogsView(sender, app_data, user_data):
+    """filterLogsView(user_data = [])
+
+    Filters the log view by the text and date range inputs (all empty shows every line).
+    """
+    # apply the filter
+    Interface_Log_View.setFilter(text = dpg.get_value("logsViewFilterText").strip(),
+        date_from = dpg.get_value("logsViewFilterFrom").strip(),
+        date_to = dpg.get_value("logsViewFilterTo").strip())
+    # show the page
+    renderLogsView()
+
+# shows new results from the results watcher
+def pollResultsView():
+    """pollResultsView()
+
+    Puts the newest text read by the results watcher into the Results View window;
+    stops the watcher once the window is closed.
+    """
+    # the window is closed; stop watching
+    if not dpg.does_alias_exist("resultsViewWindow"):
+        Interface_Results_Watcher.stop()
+        return
+    # get the newest update (UI thread only)
+    update = Interface_Results_Watcher.latest()
+    if update is None:
+        return
+    # show the text and how it was read
+    dpg.set_value("resultsViewText", update['text'])
+    dpg.set_value("resultsViewStatus", "Refresh " + '{:.1f}'.format(1 / Interface_Results_Watcher.interval)
+        + "/s | last read " + '{:.2f}'.format(update['latency'] * 1000) + " ms at " 
+        + datetime.fromtimestamp(update['read_at']).strftime("%H:%M:%S"))
+
+# follows newly appended log lines
+def pollLogsView():
+    """pollLogsView()
+
+    Indexes lines appended to the runtime log while the Logs View window is open.
+    """
+    # the window is closed
+    if not dpg.does_alias_exist("logsViewWindow"):
+        return
+    # show the new lines
+    if Interface_Log_View.refresh():
+        renderLogsView()
+
 # callback to show the Logs View window
 def showLogsView(sender, app_data, user_data):
     """showLogsView(user_data = [])
 
     Creates a widget view that shows the logs from the system.
+    Only the rows on screen exist as DPG items; pages are read from the log
+    through its line-offset index, and new lines are followed as they arrive.
     """
     # is the informationWindow shown?
     if dpg.does_alias_exist("informationWindow"):
         # clear the showLogsView window
         clearWindow("logsViewWindow")
+        # index any lines appended since the view was last shown
+        Interface_Log_View.refresh()
         # create the widget view
         LogsViewWindow = dpg.window(tag = "logsViewWindow", label = "Current Log Entries", width = 300, 
             height = 415, no_move = False, no_close = False, no_collapse = True, no_resize = True, 
             no_title_bar = False, pos = [dpg.get_viewport_client_width() - 310, 280])
         # add items to the Log View Window
         with LogsViewWindow:
-            # get the runtime_log.txt file text
-            File = open(os.path.join(sys_env_dir, "logs", "runtime_log.txt"), 'r')
-            # read the file
-            logs = File.read()
-            # close the file
-            File.close()
-            # add a list of outputs
-            dpg.add_text(logs)
+            # paging buttons and the follow checkbox
+            with dpg.group(horizontal = True):
+                dpg.add_button(label = "Top", callback = pageLogsView, user_data = ["start"])
+                dpg.add_button(label = "Up", callback = pageLogsView, 
+                    user_data = [-Interface_Log_View.rows])
+                dpg.add_button(label = "Down", callback = pageLogsView, 
+                    user_data = [Interface_Log_View.rows])
+                dpg.add_button(label = "End", callback = pageLogsView, user_data = ["end"])
+                dpg.add_checkbox(label = "Follow", tag = "logsViewFollow", 
+                    default_value = Interface_Log_View.follow, callback = toggleLogsViewFollow)
+            # filter inputs
+            dpg.add_input_text(tag = "logsViewFilterText", hint = "Filter text", width = -1)
+            with dpg.group(horizontal = True):
+                dpg.add_input_text(tag = "logsViewFilterFrom", hint = "From YYYY-MM-DD", width = 105)
+                dpg.add_input_text(tag = "logsViewFilterTo", hint = "To YYYY-MM-DD", width = 105)
+                dpg.add_button(label = "Apply", callback = filterLogsView)
+            # position / count of the rows shown
+            dpg.add_text("", tag = "logsViewStatus", color = [0, 255, 0])
+            # the visible rows (reused for every page)
+            with dpg.child_window(tag = "logsViewRows", height = -1, horizontal_scrollbar = True):
+                for i in range(Interface_Log_View.rows):
+                    dpg.add_text("", tag = "logsViewRow" + str(i))
+        # scroll the rows with the mouse wheel (one handler for the session)
+        if not dpg.does_alias_exist("logsViewWheelHandler"):
+            with dpg.handler_registry():
+                dpg.add_mouse_wheel_handler(tag = "logsViewWheelHandler", callback = wheelLogsView)
+        # show the current page
+        renderLogsView()
     # the info window isnt open yet, open it with the Results window flag set
     else:
         informationWindow(sender = "", app_data = "", user_data = [False, False, True])
@@ -3123,6 +2686,42 @@ def informationWindow(sender, app_data, user_data):
         dpg.add_text("Current Average Runtime:", pos = [75, 300])
         # add the text object that holds the current runtime avg
         dpg.add_text(currentAverageRuntime(), color = [0, 255, 0], pos = [75, 325])
+        # add the text object that holds the runtime quantiles
+        dpg.add_text(currentRuntimeQuantiles(), color = [0, 255, 0], pos = [75, 345])
+        # add config cache label
+        dpg.add_text("Configuration Cache:", pos = [75, 375])
+        # get the cache counters
+        cache_stats = Interface_Core.cache.stats()
+        # add the text object that holds the cache hits/misses
+        dpg.add_text(str(cache_stats['hits']) + " hits / " + str(cache_stats['misses']) + " misses",
+            color = [0, 255, 0], pos = [75, 400])
+        # add last commit label
+        dpg.add_text("Last Configuration Commit:", pos = [75, 450])
+        # get the last commit report
+        report = Interface_Core.pipeline.last_report
+        # no commits yet this session
+        if report is None:
+            commit_text = "No commits this session"
+        # show the bytes written and wall time
+        else:
+            commit_text = (str(report['bytes']) + " bytes in " + '{:f}'.format(report['seconds'])
+                + " seconds")
+        # add the text object that holds the last commit report
+        dpg.add_text(commit_text, color = [0, 255, 0], pos = [75, 475])
+        # add last backup label
+        dpg.add_text("Last Configuration Backup:", pos = [75, 525])
+        # get the last backup report
+        report = Interface_Core.backup_worker.last_report
+        # no backup finished yet this session
+        if report is None:
+            backup_text = "No backups finished this session"
+        # show what was written and removed
+        else:
+            backup_text = (("unchanged" if report['skipped'] else str(report['bytes']) + " bytes written")
+                + " / " + str(report['removed']) + " old objects removed in "
+                + '{:f}'.format(report['seconds']) + " seconds")
+        # add the text object that holds the last backup report
+        dpg.add_text(backup_text, color = [0, 255, 0], pos = [75, 550])
         # get the configuration objects (Models & Machines, no configs)
         models = getModels(get_machines = True, get_configs = False)
         # create a machine List
@@ -3161,6 +2760,335 @@ def informationWindow(sender, app_data, user_data):
             showLogsView("", "", "")
 
 
+## IMPORT UI CALLBACKS
+# imports the machines and configs of a measurement sheet
+def commitSheetImport(sender, app_data, user_data):
+    """commitSheetImport(app_data = file dialog selection)
+
+    app_data: dict; the file dialog selection ('file_path_name' is the chosen sheet).
+
+    Streams a .csv/.xlsx measurement sheet into new machines (with their measurements)
+    and configs (with their sheet/cluster maps), then commits them as one transaction.
+    Nothing is committed if any row is rejected."""
+    # get the chosen sheet
+    path = app_data['file_path_name']
+    # stream the sheet into a batch
+    Batch = ConfigBatch(openConfigFile())
+    Importer = SheetImporter(Batch)
+    try:
+        Importer.importRecords(SheetReader(path).records())
+    # unreadable sheet
+    except (OSError, KeyError, ValueError, SyntaxError, BadZipFile) as error:
+        showWarningPopup("The sheet " + os.path.basename(path) + "\ncould not be read: " + str(error))
+        return
+    # rejected rows (the first 5)
+    if Batch.errors:
+        errors = sorted(Batch.errors, key = lambda error: error['row'])
+        showWarningPopup(str(len(errors)) + " rows of " + os.path.basename(path) + " were rejected:\n"
+            + "\n".join("Row " + str(error['row']) + ": " + error['error'].replace("\n", " ")
+            for error in errors[:5]))
+        return
+    # commit once
+    if Batch.operations:
+        commitConfigOperations(Batch.operations, "Import Sheet: " + os.path.basename(path))
+    # clear the Popup alias
+    clearWindow("confirmPopup")
+    # create the confirmation popup
+    Popup = dpg.window(tag = "confirmPopup", popup = True, no_open_over_existing_popup = True,
+        width = 400, height = 250, no_move = True, no_close = True, no_collapse = True, no_resize = True,
+        pos = [(dpg.get_viewport_client_width() / 2) - 200, (dpg.get_viewport_client_height() / 2) - 125],
+        modal = True)
+    # add items to the popup
+    with Popup:
+        # add a success message
+        dpg.add_text("Success:", color = [150, 150, 255])
+        dpg.add_text(os.path.basename(path) + " has been imported:\n" + str(Importer.machines) 
+            + " new machines, " + str(Importer.configs) + " new configs\n(" 
+            + str(len(Batch.operations)) + " changes from " + str(Batch.rows) + " rows).")
+        # add an Okay button
+        dpg.add_button(label = "Okay!", pos = [125, 100], width = 150, height = 25,
+            callback = deleteItem, user_data = ["confirmPopup"])
+
+# opens the file dialog of the sheet import
+def importSheet(sender, app_data, user_data):
+    """importSheet()
+
+    Opens a file dialog for a .csv/.xlsx measurement sheet to import."""
+    # clear the dialog alias
+    clearWindow("importSheetDialog")
+    # create the file dialog
+    with dpg.file_dialog(tag = "importSheetDialog", width = 600, height = 400, modal = True,
+            default_path = sys_env_dir, callback = commitSheetImport):
+        # sheet types
+        dpg.add_file_extension("Measurement Sheets (*.csv *.xlsx){.csv,.xlsx}")
+        dpg.add_file_extension(".csv")
+        dpg.add_file_extension(".xlsx")
+
+
+## LINT UI CALLBACKS
+# checks the configuration and lists the findings in the lint window
+def runConfigLint(sender, app_data, user_data):
+    """runConfigLint(user_data = [incremental])
+
+    incremental: Boolean; only re-check models changed since the last check.
+
+    Checks the whole configuration (see ConfigLinter) and lists the findings."""
+    # the window is closed
+    if not dpg.does_alias_exist("lintWindow"):
+        return
+    # check the configuration
+    report = Interface_Core.lintConfig(user_data[0])
+    # show the counts
+    dpg.set_value("lintStatus", str(len(report['findings'])) + " findings; " + str(report['checked']) 
+        + " of " + str(report['models']) + " models checked in " + '{:f}'.format(report['seconds']) + "s")
+    # replace the listed findings (the first 200)
+    dpg.delete_item("lintFindings", children_only = True)
+    for finding in report['findings'][:200]:
+        dpg.add_text(finding['check'] + ": " + finding['message'], parent = "lintFindings", 
+            color = [255, 150, 75])
+    # nothing found
+    if not report['findings']:
+        dpg.add_text("No problems found.", parent = "lintFindings", color = [0, 255, 0])
+
+# opens the lint window
+def lintWindow(sender, app_data, user_data):
+    """lintWindow()
+
+    Information Menu -> Check Configuration
+
+    Opens a panel that checks the whole configuration for maps of removed items,
+    clashing sheet/cluster maps and machine names without their model prefix."""
+    # clear the lint window
+    clearWindow("lintWindow")
+    # create the panel
+    LintWindow = dpg.window(tag = "lintWindow", label = "Check Configuration", width = 700, 
+        height = 415, no_move = False, no_close = False, no_collapse = True, no_resize = True, 
+        no_title_bar = False, pos = [(dpg.get_viewport_client_width() / 2) - 350, 150])
+    # add items to the panel
+    with LintWindow:
+        # full and incremental checks
+        with dpg.group(horizontal = True):
+            dpg.add_button(label = "Check All", callback = runConfigLint, user_data = [False])
+            dpg.add_button(label = "Check Changes", callback = runConfigLint, user_data = [True])
+        # counts of the last check
+        dpg.add_text("", tag = "lintStatus", color = [0, 255, 0])
+        # the findings
+        dpg.add_child_window(tag = "lintFindings", height = -1, horizontal_scrollbar = True)
+    # check the models changed since the last check
+    runConfigLint("", "", [True])
+
+
+## UNDO UI CALLBACKS
+# undoes the user's last commit (or redoes the last undone one)
+def undoLastCommit(sender, app_data, user_data):
+    """undoLastCommit(user_data = [redo])
+
+    redo: bool; redo the last undone commit instead.
+
+    Edit Menu -> Undo / Redo
+
+    Undoes the user's last change (or redoes the last undone one) as a new commit, then
+    returns to the main menu (open windows may show the objects as they were)."""
+    # get the commit to undo
+    redo = user_data[0]
+    entry = Interface_Core.undo_log.peek(redo)
+    if entry is None:
+        showWarningPopup("There is no change to " + ("redo" if redo else "undo") + ".")
+        return
+    # commit the reverse of its operations
+    try:
+        Interface_Core.undoCommit(redo)
+    # an object it changed is gone or changed since
+    except KeyError:
+        showWarningPopup("An object changed by '" + entry['action'] + "'\nwas changed or removed "
+            + "since, or its name is now taken.")
+        return
+    # the open windows may show the old objects
+    returnToStartup("", "", [])
+    pollUndoMenu()
+    # clear the Popup alias
+    clearWindow("confirmPopup")
+    # create the confirmation popup
+    Popup = dpg.window(tag = "confirmPopup", popup = True, no_open_over_existing_popup = False,
+        width = 400, height = 250, no_move = True, no_close = True, no_collapse = True, no_resize = True,
+        pos = [(dpg.get_viewport_client_width() / 2) - 200, (dpg.get_viewport_client_height() / 2) - 125],
+        modal = True)
+    # add items to the popup
+    with Popup:
+        # add a success message
+        dpg.add_text("Success:", color = [150, 150, 255])
+        dpg.add_text(("Redone: " if redo else "Undone: ") + entry['action'], wrap = 380)
+        # add an Okay button
+        dpg.add_button(label = "Okay!", pos = [125, 100], width = 150, height = 25,
+            callback = deleteItem, user_data = ["confirmPopup"])
+
+# names the commit the undo and redo menu items act on
+def pollUndoMenu():
+    """pollUndoMenu()
+
+    Labels the Undo and Redo items of the Edit menu with the change they reverse.
+    """
+    for tag, redo in [("undoMenuItem", False), ("redoMenuItem", True)]:
+        entry = Interface_Core.undo_log.peek(redo)
+        label = ("Redo" if redo else "Undo") + ("" if entry is None else " " + entry['action'])
+        # labels are cut short to fit the menu
+        dpg.configure_item(tag, label = label if len(label) <= 60 else label[:57] + "...")
+
+
+## BACKUP UI CALLBACKS
+# lists the changes from the current configuration to the chosen backup
+def compareBackup(sender, app_data, user_data):
+    """compareBackup(user_data = [entries])
+
+    entries: {str: dict}; the index entry of each backup listed in the backups window.
+
+    Lists the changes from the current configuration to the chosen backup, by model,
+    machine and config, each with a checkbox to restore it."""
+    # the window is closed or nothing is chosen
+    if not dpg.does_alias_exist("backupsWindow"):
+        return
+    entry = user_data[0].get(dpg.get_value("backupsList"))
+    if entry is None:
+        return
+    # compare (unchanged models are not read)
+    changes = Interface_Core.diffBackups(None, entry)
+    # show the count
+    dpg.set_value("backupsStatus", str(len(changes)) + " changes from the current configuration to "
+        + "the backup of " + entry['time'] + ("" if len(changes) <= 200 else " (the first 200 are listed)"))
+    # replace the listed changes (the first 200)
+    dpg.delete_item("backupsChanges", children_only = True)
+    checks = []
+    for change in changes[:200]:
+        lines = ConfigDiff.describe(change)
+        checks.append(dpg.add_checkbox(label = lines[0], parent = "backupsChanges"))
+        for line in lines[1:]:
+            dpg.add_text(line.strip(), parent = "backupsChanges", color = [150, 150, 255], indent = 30)
+    # nothing changed
+    if not changes:
+        dpg.add_text("The configuration matches this backup.", parent = "backupsChanges",
+            color = [0, 255, 0])
+    # the restore buttons act on this comparison
+    dpg.set_item_user_data("backupsRestoreSelected", [entry, changes[:200], checks, user_data[0]])
+    dpg.set_item_user_data("backupsRestoreAll", [entry, None, None, user_data[0]])
+
+# restores the compared backup (or its checked changes)
+def commitBackupRestore(sender, app_data, user_data):
+    """commitBackupRestore(user_data = [entry, changes, checks, entries])
+
+    entry: dict; the index entry of the compared backup.
+    changes: [change] | None; the listed changes (None restores the whole backup).
+    checks: [DPG Checkboxes] | None; the checkbox of each listed change.
+    entries: {str: dict}; the index entry of each backup listed in the backups window.
+
+    Restores the whole backup, or its checked changes, as one commit."""
+    # nothing compared yet
+    if (user_data is None) or (user_data[0] is None):
+        showWarningPopup("Choose a backup and compare it first.")
+        return
+    entry, changes, checks, entries = user_data
+    # the checked changes
+    if changes is not None:
+        changes = [change for change, check in zip(changes, checks) if dpg.get_value(check)]
+        if not changes:
+            showWarningPopup("Check the changes to restore first.")
+            return
+    # restore as one commit
+    try:
+        report = Interface_Core.restoreBackup(entry, changes)
+    # an object changed since the comparison
+    except KeyError:
+        showWarningPopup("The configuration changed since it was compared.\nCompare it again.")
+        return
+    # compare again and note the restore
+    compareBackup("", "", [entries])
+    dpg.set_value("backupsStatus", "Restored " + ("the backup" if changes is None else
+        str(len(changes)) + " changes of the backup") + " of " + entry['time'] + " ("
+        + str(report['bytes']) + " bytes written)")
+
+# opens the backups window
+def backupsWindow(sender, app_data, user_data):
+    """backupsWindow()
+
+    File Menu -> Backups...
+
+    Opens a panel that lists the configuration backups, compares one with the current
+    configuration and restores it (whole, or the checked changes)."""
+    # clear the backups window
+    clearWindow("backupsWindow")
+    # the backups, newest first
+    entries = {}
+    for entry in reversed(Interface_Core.backups.snapshots()):
+        entries[entry['time'] + " | " + entry['hash'][:12]] = entry
+    # create the panel
+    BackupsWindow = dpg.window(tag = "backupsWindow", label = "Backups", width = 900,
+        height = 500, no_move = False, no_close = False, no_collapse = True, no_resize = True,
+        no_title_bar = False, pos = [(dpg.get_viewport_client_width() / 2) - 450, 125])
+    # add items to the panel
+    with BackupsWindow:
+        with dpg.group(horizontal = True):
+            # the backups
+            dpg.add_listbox(items = list(entries), tag = "backupsList", width = 300, num_items = 20,
+                callback = compareBackup, user_data = [entries])
+            with dpg.group():
+                # restore buttons
+                with dpg.group(horizontal = True):
+                    dpg.add_button(label = "Restore Checked Changes", tag = "backupsRestoreSelected",
+                        callback = commitBackupRestore, user_data = None)
+                    dpg.add_button(label = "Restore Whole Backup", tag = "backupsRestoreAll",
+                        callback = commitBackupRestore, user_data = None)
+                # counts of the last comparison
+                dpg.add_text("Choose a backup to compare it with the current configuration.",
+                    tag = "backupsStatus", color = [0, 255, 0], wrap = 560)
+                # the changes
+                dpg.add_child_window(tag = "backupsChanges", height = -1, horizontal_scrollbar = True)
+
+
+## LIVE VIEW CALLBACKS
+# shows the progress of the background backup
+def pollBackupStatus():
+    """pollBackupStatus()
+
+    Shows the progress of the running backup (or the result of the last one) under the
+    Save & Exit button.
+    """
+    # the text of the running backup
+    progress = Interface_Core.backup_worker.progress()
+    if Interface_Core.backup_worker.busy():
+        text = "Backing up the configuration..."
+        if progress['total']:
+            text = ("Backing up the configuration (" + progress['stage'] + " " + str(progress['done'])
+                + "/" + str(progress['total']) + ")...")
+    # the text of the last backup
+    elif Interface_Core.backup_worker.error is not None:
+        text = "The configuration backup failed: " + str(Interface_Core.backup_worker.error)
+    elif Interface_Core.backup_worker.last_report is not None:
+        report = Interface_Core.backup_worker.last_report
+        text = ("Configuration unchanged since the latest backup" if report['skipped']
+            else "Configuration backed up (" + str(report['bytes']) + " bytes written)")
+    else:
+        text = ""
+    # show it
+    dpg.set_value("backupStatus", text)
+
+# polls the live views between frames
+def tickLiveViews(sender, app_data, user_data):
+    """tickLiveViews()
+
+    Frame callback that updates the open live views, then schedules itself again
+    30 frames later (frame callbacks run once).
+    """
+    # follow the runtime log
+    pollLogsView()
+    # show new results
+    pollResultsView()
+    # show the backup progress
+    pollBackupStatus()
+    # name the change the undo and redo items reverse
+    pollUndoMenu()
+    # run again in 30 frames
+    dpg.set_frame_callback(dpg.get_frame_count() + 30, tickLiveViews)
+
+
 ## HELP WINDOW UI CALLBACKS
 #__________________________________________________________________________________________________
 # open github repo page
@@ -3244,25 +3172,14 @@ def helpWindow(sender, app_data, user_data):
     # else use the current position of the window
     else:
         pos = dpg.get_item_pos("helpWindow")
-    # set the path to the folder of chapter pages in system files
-    temp = os.path.join(sys_env_dir, "assets", "help", "chap" + str(chapter))
-    # hold a list of the page images
-    pages = []
-    # add each image to the list of pages
-    for root, dirs, files in os.walk(top = temp, topdown = False):
-        # for each file in the directory
-        for file in files:
-            # pull the image from the folder
-            page = dpg.load_image(os.path.join(root, file))
-            # add the image to the pages list
-            pages.append(page)
-    # create a texture registry
-    with dpg.texture_registry():
-        # generate a texture from the page
-        Page = dpg.add_static_texture(width = pages[page_num][0], height = pages[page_num][1], 
-            default_value = pages[page_num][3])
-    # clear the subsequent aliases
+    # get the number of pages in the chapter
+    page_count = Interface_Help_Pages.pageCount(chapter)
+    # clear the subsequent aliases (before its texture can be freed)
     clearWindow("helpWindow")
+    # get the texture of the page (cached, prefetched or decoded now)
+    Page = Interface_Help_Pages.getTexture(chapter, page_num)
+    # decode the neighbouring pages and chapters in the background
+    Interface_Help_Pages.prefetch(chapter, page_num)
     # enable the helpWindow
     HelpWindow = dpg.window(tag = "helpWindow", label = ("> Chapter " + str(chapter) + " - " 
         + chapter_titles[chapter - 1]), pos = pos, width = 670, height = 660, no_move = False, 
@@ -3280,7 +3197,7 @@ def helpWindow(sender, app_data, user_data):
             dpg.add_button(label = "< pg", width = 40, pos = [290, 25], callback = helpWindow,
                 user_data = [chapter, page_num - 1, "update"])
         # add next page button if there is a next page
-        if page_num < (len(pages) - 1):
+        if page_num < (page_count - 1):
             # add the next button
             dpg.add_button(label = "pg >", width = 40, pos = [335, 25], callback = helpWindow,
                 user_data = [chapter, page_num + 1, "update"])
@@ -3295,53 +3212,12 @@ def helpWindow(sender, app_data, user_data):
 
 ### Main Function Segment
 #__________________________________________________________________________________________________
-# verify the config folder
-try:
-    # create the folder (first run)
-    os.mkdir(os.path.join(sys_env_dir, "config"))
-except Exception:
-    # folder exists
-    pass
-
-# verify the KIM_interface_configuration.json file
-try:
-    # make a dict object to format the empty config file
-    temp = {"timestamp":str(str(datetime.now()) + " | " + str(user)), "models":[]}
-    # format the dict as JSON
-    temp = dumps(temp, indent = 4)
-    # create the file (first run)
-    File = open(os.path.join(sys_env_dir, "config", "KIM_interface_configuration.json"), 'x')
-    # write the dict to the file
-    File.write(temp)
-    File.close()
-except Exception:
-    # file exists
-    pass
-
-# verify the config/backups folder
-try:
-    # create the backups folder
-    os.mkdir(os.path.join(sys_env_dir, "config", "backups"))
-except Exception:
-    # backup folder exists
-    try:
-        # create past backups folder
-        os.mkdir(os.path.join(sys_env_dir, "config", "backups", "past"))
-    except Exception:
-        # past folder exists
-        pass
-
-# verify the changelog.txt file
-try:
-    # create the file (first run)
-    File = open(os.path.join(sys_env_dir, "logs", "changelog.txt"), 'x')
-    File.close()
-except Exception:
-    # file exists
-    pass
+# verify the config folders, config file and changelog (first run)
+Interface_Core.verifyFolders()
 
-# create a backup
-createConfigBackup()
+# prepare the configuration (fill a new store, fold the journal in, refresh the config file
+# and the getvalue lookups, back it up in the background)
+Interface_Core.startup(background_backup = True)
 
 # add items to the StartupWindow
 with StartupWindow:
@@ -3391,6 +3267,8 @@ with StartupWindow:
     # add an exit manager button
     dpg.add_button(label = "Save & Exit", width = 300, height = 50, 
         pos = [10, 620], callback = closeProgram)
+    # add the backup status text (see pollBackupStatus)
+    dpg.add_text("", tag = "backupStatus", color = [0, 255, 0], pos = [10, 590])
 
 # create the menu bar
 MenuBar = dpg.viewport_menu_bar()
@@ -3415,6 +3293,8 @@ with MenuBar:
     with MainMenu:
         # add a main menu button
         dpg.add_menu_item(label = "Main Menu", callback = returnToStartup)
+        # add a backups button (compare and restore)
+        dpg.add_menu_item(label = "Backups...", callback = backupsWindow)
         # add a save and exit button
         dpg.add_menu_item(label = "Save & Exit", callback = closeProgram)
     with NewMenu:
@@ -3425,7 +3305,15 @@ with MenuBar:
             callback = selectModel, user_data = ["addMachine"])
         dpg.add_menu_item(label = "Model",
             callback = addModel)
+        dpg.add_menu_item(label = "Import from Sheet...",
+            callback = importSheet)
     with EditMenu:
+        # add the undo and redo items (labelled by pollUndoMenu)
+        dpg.add_menu_item(label = "Undo", tag = "undoMenuItem", callback = undoLastCommit,
+            user_data = [False])
+        dpg.add_menu_item(label = "Redo", tag = "redoMenuItem", callback = undoLastCommit,
+            user_data = [True])
+        dpg.add_separator()
         # add necessary items (config, machine, model)
         dpg.add_menu_item(label = "Mapping Configuration", 
             callback = selectModel, user_data = ["editConfig"])
@@ -3459,6 +3347,7 @@ with MenuBar:
             user_data = [False, True, False])
         dpg.add_menu_item(label = "Show Log View", callback = showLogsView,
             user_data = [False, False, True])
+        dpg.add_menu_item(label = "Check Configuration", callback = lintWindow)
     with HelpMenu:
         # add necessary items (open help chapters)
         Chap1 = dpg.add_menu_item(label = "System Environment", callback = helpWindow,
@@ -3492,5 +3381,7 @@ dpg.show_viewport()
 # set the primary window and maximize the view
 dpg.set_primary_window("startupWindow", True)
 dpg.maximize_viewport()
+# poll the live views every 30 frames
+dpg.set_frame_callback(30, tickLiveViews)
 # start dearpygui main loop
 dpg.start_dearpygui()
\ No newline at end of file
@@ -0,0 +1,276 @@
+### KIM_Interface_Standin.py
+# developed for Yamada North America, INC. Quality Assurance by Mason Ritchason
+"""KIM_Interface_Standin.py
+
+Local stand-in for the KIM Interface getvalue endpoint, for measuring the
+URLs generateURL produces without the plant server. Serves
+
+    GET /api/v1/getvalue/KIM_Interface?machine_name=...&mapping_config=...
+
+from the Manager's configuration (through the lookup artifact) and fills
+each mapping's value from a results file of "item: value" lines.
+
+The lookup artifact is recompiled whenever the config file is newer than it
+(checked every second), so edits saved in the Manager are served right away.
+
+    python KIM_Interface_Standin.py [--host 127.0.0.1] [--port 3000]
+        [--results results.txt | --fake-results PATH]
+"""
+
+
+### Libraries Segment
+#__________________________________________________________________________________________________
+import os as os
+import asyncio as asyncio
+from json import dumps
+from argparse import ArgumentParser
+from urllib.parse import urlsplit, parse_qs
+from classes.ConfigFileStore import ConfigFileStore as ConfigFileStore
+from classes.LookupArtifact import LookupArtifact as LookupArtifact
+
+
+### Global Definition Segmemt
+#__________________________________________________________________________________________________
+# the endpoint the i-Reporter forms call
+ENDPOINT = "/api/v1/getvalue/KIM_Interface"
+# seconds between checks of the config file
+REFRESH_INTERVAL = 1.0
+
+
+### Results Segment
+#__________________________________________________________________________________________________
+# holds the parsed results file, re-reading it only when it changes
+class ResultsFile:
+    # default constructor
+    def __init__(self, path):
+        self.path = path
+        self.signature = None
+        self.values = {}
+
+    # default print
+    def __str__(self):
+        return f"Results File {self.path} ({len(self.values)} values)"
+
+    def getValues(self):
+        """Returns the item -> value Dict of the results file (empty if there is no file)."""
+        # no results file
+        if not os.path.isfile(self.path):
+            return {}
+        # is the parsed file still current?
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self.signature:
+            return self.values
+        # read the results ("item: value" per line)
+        values = {}
+        File = open(self.path, 'r', encoding = 'utf-8', errors = 'replace')
+        for line in File:
+            if ':' in line:
+                item, value = line.split(':', 1)
+                values[item.strip()] = value.strip()
+        File.close()
+        # save the parsed file
+        self.values = values
+        self.signature = signature
+        # return the values
+        return self.values
+
+# writes a fake results file covering every item of a config
+def writeFakeResults(path, document):
+    """writeFakeResults(path, document)
+
+    path: str; the results file to write.
+    document: config Dict; every base information and measurement item gets a value.
+
+    -> int; the number of values written.
+    """
+    # collect every item once, in config order
+    items = {}
+    for model in document['models']:
+        for item in model['base_information']:
+            items.setdefault(str(item), "BASE")
+        for machine in model['machines']:
+            for i, item in enumerate(machine['measurements']):
+                items.setdefault(str(item), "%.3f" % (10 + (i * 0.125)))
+    # write one "item: value" line per item
+    File = open(path, 'w', encoding = 'utf-8')
+    for item in items:
+        File.write(item + ": " + items[item] + "\n")
+    File.close()
+    # return the number of values written
+    return len(items)
+
+
+### Server Segment
+#__________________________________________________________________________________________________
+# answers one getvalue request
+def answerRequest(target, Lookup, Results):
+    """answerRequest(target, Lookup, Results)
+
+    target: str; the request target (path and query).
+    Lookup: LookupArtifact; the compiled mapping lookups.
+    Results: ResultsFile; the values to fill the mappings with.
+
+    -> (status, body)
+    """
+    # split the target
+    parts = urlsplit(target)
+    if parts.path != ENDPOINT:
+        return 404, {"error":"unknown endpoint"}
+    # read the query
+    query = parse_qs(parts.query)
+    machine_name = query.get("machine_name", [""])[0]
+    mapping_config = query.get("mapping_config", [""])[0]
+    if (not machine_name) or (not mapping_config):
+        return 400, {"error":"machine_name and mapping_config are required"}
+    # find the mapping list
+    mappings = Lookup.lookup(machine_name, mapping_config)
+    if mappings is None:
+        return 404, {"error":"unknown machine_name / mapping_config"}
+    # fill each mapping with its result
+    values = Results.getValues()
+    filled = [dict(mapping, value = values.get(str(mapping['item']), mapping['value']))
+        for mapping in mappings]
+    # return the filled mappings
+    return 200, {"machine_name":machine_name, "mapping_config":mapping_config, "mappings":filled}
+
+# serves one keep-alive connection
+async def handleConnection(reader, writer, Lookup, Results):
+    """handleConnection(reader, writer, Lookup, Results)
+
+    Reads HTTP/1.1 requests from one connection until the client closes it.
+    """
+    try:
+        while True:
+            # read the request line
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            # read the headers (only Connection matters; requests have no body)
+            keep_alive = True
+            while True:
+                header = await reader.readline()
+                if header in (b"\r\n", b"\n", b""):
+                    break
+                if header.lower().startswith(b"connection:") and (b"close" in header.lower()):
+                    keep_alive = False
+            # answer the request
+            fields = request_line.decode('latin-1').split()
+            if (len(fields) < 2) or (fields[0] != "GET"):
+                status, body = 405, {"error":"only GET is supported"}
+            else:
+                status, body = answerRequest(fields[1], Lookup, Results)
+            data = dumps(body).encode('utf-8')
+            writer.write(("HTTP/1.1 " + str(status) + " " + ("OK" if status == 200 else "Error")
+                + "\r\nContent-Type: application/json\r\nContent-Length: " + str(len(data))
+                + "\r\n" + ("" if keep_alive else "Connection: close\r\n") + "\r\n").encode('latin-1')
+                + data)
+            await writer.drain()
+            if not keep_alive:
+                break
+    # the client went away mid-request
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    # close the connection
+    writer.close()
+
+# recompiles the lookups when the config is newer
+def refreshLookups(config_path, lookup_path, memo):
+    """refreshLookups(config_path, lookup_path, memo)
+
+    config_path: str; the single config file.
+    lookup_path: str; the lookup artifact.
+    memo: dict; payloads of earlier builds (see LookupArtifact.build).
+
+    Recompiles the lookup artifact if it is missing or older than the config.
+
+    -> bool; True if the artifact was recompiled.
+    """
+    # the Manager compiles the artifact when it opens and closes; saves in between are caught here
+    if os.path.isfile(lookup_path) and (os.path.getmtime(lookup_path) >= os.path.getmtime(config_path)):
+        return False
+    # compile and replace the artifact (the server re-maps it on its next request)
+    LookupArtifact.write(lookup_path, ConfigFileStore(config_path).read(), memo)
+    return True
+
+# keeps the lookups current while the server runs
+async def watchConfig(config_path, lookup_path, memo, interval = REFRESH_INTERVAL):
+    """watchConfig(config_path, lookup_path, memo, interval = REFRESH_INTERVAL)
+
+    Checks the config file every interval seconds and recompiles the lookups when it
+    changed (requests keep the last artifact until then).
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            refreshLookups(config_path, lookup_path, memo)
+        # the config is being replaced or cannot be read; try again next time
+        except (OSError, ValueError):
+            pass
+
+# compiles the lookups (if needed) and starts the server
+async def startStandin(host, port, config_path, lookup_path, results_path):
+    """startStandin(host, port, config_path, lookup_path, results_path)
+
+    Recompiles the lookup artifact if it is missing or older than the config,
+    starts watching the config for changes, then starts listening.
+
+    -> asyncio.Server
+    """
+    # compile the lookups if they are missing or stale
+    memo = {}
+    refreshLookups(config_path, lookup_path, memo)
+    # open the lookups and the results
+    Lookup = LookupArtifact(lookup_path)
+    Results = ResultsFile(results_path)
+    # recompile the lookups as the config changes (held by the server for its lifetime)
+    Server = await asyncio.start_server(lambda reader, writer: handleConnection(reader, writer,
+        Lookup, Results), host, port)
+    Server.watcher = asyncio.ensure_future(watchConfig(config_path, lookup_path, memo))
+    # return the server
+    return Server
+
+# parses the command line and runs the server
+def main(argv = None):
+    """main(argv = None)
+
+    argv: (optional) [str]; the command line arguments (defaults to sys.argv).
+
+    -> int; the exit code.
+    """
+    # environment directory
+    sys_env_dir = os.path.abspath(os.path.join(os.getcwd()))
+    # build the command line
+    parser = ArgumentParser(prog = "KIM_Interface_Standin",
+        description = "Serve the KIM Interface getvalue endpoint locally.")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = 3000)
+    parser.add_argument("--config", default = os.path.join(sys_env_dir, "config",
+        "KIM_interface_configuration.json"))
+    parser.add_argument("--lookup", default = os.path.join(sys_env_dir, "config",
+        "KIM_interface_lookup.bin"))
+    parser.add_argument("--results", default = os.path.join(sys_env_dir, "results.txt"))
+    parser.add_argument("--fake-results", default = None, metavar = "PATH",
+        help = "write a results file with a value for every configured item and serve it")
+    args = parser.parse_args(argv)
+    # write the fake results (never over the real results file unless asked by path)
+    if args.fake_results:
+        count = writeFakeResults(args.fake_results, ConfigFileStore(args.config).read())
+        print("Wrote " + str(count) + " fake results to " + args.fake_results)
+        args.results = args.fake_results
+    # run the server until interrupted
+    async def run():
+        Server = await startStandin(args.host, args.port, args.config, args.lookup, args.results)
+        print("Serving http://" + args.host + ":" + str(args.port) + ENDPOINT)
+        async with Server:
+            await Server.serve_forever()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    # success
+    return 0
+
+# run as a script
+if __name__ == "__main__":
+    raise SystemExit(main())
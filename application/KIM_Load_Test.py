@@ -0,0 +1,194 @@
+### KIM_Load_Test.py
+# developed for Yamada North America, INC. Quality Assurance by Mason Ritchason
+"""KIM_Load_Test.py
+
+Load generator for the KIM Interface getvalue endpoint. Replays a
+machine / mapping configuration mix taken from the Manager's configuration
+(a few machines hot, most cold, like a shift of i-Reporter forms) at a
+set concurrency and reports latency percentiles and requests per second.
+
+    python KIM_Load_Test.py [--url http://127.0.0.1:3000] [--concurrency 16]
+        [--requests 5000] [--skew 1.2] [--standin [--fake-results PATH]]
+"""
+
+
+### Libraries Segment
+#__________________________________________________________________________________________________
+import os as os
+import random as random
+import asyncio as asyncio
+from time import perf_counter
+from argparse import ArgumentParser
+from urllib.parse import urlsplit, quote
+from classes.ConfigFileStore import ConfigFileStore as ConfigFileStore
+from KIM_Interface_Standin import ENDPOINT, startStandin, writeFakeResults
+
+
+### Load Segment
+#__________________________________________________________________________________________________
+# builds the request mix
+def buildMix(document, count, skew, seed = 0):
+    """buildMix(document, count, skew, seed = 0)
+
+    document: config Dict; the machines and configs to request.
+    count: int; the number of requests.
+    skew: float; the Zipf exponent of machine popularity (0 is uniform).
+
+    -> [str]; request targets, in the form generateURL writes them.
+    """
+    # list every (machine, config) pair, grouped by machine
+    machines = [(machine['name'], [config['id'] for config in machine['mapping_configurations']])
+        for model in document['models'] for machine in model['machines']
+        if machine['mapping_configurations']]
+    if not machines:
+        raise ValueError("The configuration has no machines with mapping configurations.")
+    # a shuffled popularity rank per machine
+    generator = random.Random(seed)
+    generator.shuffle(machines)
+    weights = [1.0 / ((rank + 1) ** skew) for rank in range(len(machines))]
+    # draw the requests
+    targets = []
+    for name, config_ids in generator.choices(machines, weights = weights, k = count):
+        targets.append(ENDPOINT + "?machine_name=" + quote(name.replace(' ', '_'))
+            + "&mapping_config=" + quote(generator.choice(config_ids)))
+    # return the targets
+    return targets
+
+# sends requests over one keep-alive connection
+async def worker(host, port, queue, latencies, failures):
+    """worker(host, port, queue, latencies, failures)
+
+    Takes targets from the queue until it is empty, recording each latency (seconds).
+    """
+    # open the connection
+    reader, writer = await asyncio.open_connection(host, port)
+    while True:
+        # next request
+        try:
+            target = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        # send it and time the full response
+        start = perf_counter()
+        writer.write(("GET " + target + " HTTP/1.1\r\nHost: " + host + "\r\n\r\n").encode('latin-1'))
+        status = int((await reader.readline()).split()[1])
+        length = 0
+        while True:
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            if header.lower().startswith(b"content-length:"):
+                length = int(header.split(b":", 1)[1])
+        await reader.readexactly(length)
+        latencies.append(perf_counter() - start)
+        # count failed lookups
+        if status != 200:
+            failures.append(target)
+    # close the connection
+    writer.close()
+
+# returns a percentile of sorted samples
+def percentile(samples, fraction):
+    """percentile(samples, fraction)
+
+    samples: [float]; sorted samples.
+    fraction: float; 0.5 for p50, 0.99 for p99.
+
+    -> float (nearest rank)
+    """
+    # no samples
+    if not samples:
+        return 0.0
+    # nearest rank
+    return samples[min(len(samples) - 1, max(0, int(round(fraction * len(samples))) - 1))]
+
+# runs the load test
+async def runLoad(url, targets, concurrency):
+    """runLoad(url, targets, concurrency)
+
+    -> {"requests", "failures", "seconds", "rps", "p50", "p95", "p99"} (latencies in ms)
+    """
+    # the server to load
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    # queue every request
+    queue = asyncio.Queue()
+    for target in targets:
+        queue.put_nowait(target)
+    # run the workers
+    latencies, failures = [], []
+    start = perf_counter()
+    await asyncio.gather(*[worker(host, port, queue, latencies, failures)
+        for i in range(concurrency)])
+    seconds = perf_counter() - start
+    # summarize
+    latencies.sort()
+    return {"requests":len(latencies), "failures":len(failures), "seconds":seconds,
+        "rps":len(latencies) / seconds if seconds else 0.0,
+        "p50":percentile(latencies, 0.50) * 1000, "p95":percentile(latencies, 0.95) * 1000,
+        "p99":percentile(latencies, 0.99) * 1000}
+
+# parses the command line and runs the load test
+def main(argv = None):
+    """main(argv = None)
+
+    argv: (optional) [str]; the command line arguments (defaults to sys.argv).
+
+    -> int; the exit code (1 if any request failed).
+    """
+    # environment directory
+    sys_env_dir = os.path.abspath(os.path.join(os.getcwd()))
+    # build the command line
+    parser = ArgumentParser(prog = "KIM_Load_Test",
+        description = "Load test the KIM Interface getvalue endpoint.")
+    parser.add_argument("--url", default = "http://127.0.0.1:3000")
+    parser.add_argument("--config", default = os.path.join(sys_env_dir, "config",
+        "KIM_interface_configuration.json"))
+    parser.add_argument("--concurrency", type = int, default = 16)
+    parser.add_argument("--requests", type = int, default = 5000)
+    parser.add_argument("--skew", type = float, default = 1.2)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--standin", action = "store_true",
+        help = "start the local stand-in server at --url for the run")
+    parser.add_argument("--lookup", default = os.path.join(sys_env_dir, "config",
+        "KIM_interface_lookup.bin"))
+    parser.add_argument("--results", default = os.path.join(sys_env_dir, "results.txt"))
+    parser.add_argument("--fake-results", default = None, metavar = "PATH",
+        help = "with --standin, write and serve a fake results file")
+    args = parser.parse_args(argv)
+    # build the request mix from the config
+    document = ConfigFileStore(args.config).read()
+    targets = buildMix(document, args.requests, args.skew, args.seed)
+    # run the load (with the stand-in in the same event loop if asked)
+    async def run():
+        Server = None
+        if args.standin:
+            results_path = args.results
+            if args.fake_results:
+                writeFakeResults(args.fake_results, document)
+                results_path = args.fake_results
+            parts = urlsplit(args.url)
+            Server = await startStandin(parts.hostname, parts.port or 80, args.config,
+                args.lookup, results_path)
+        try:
+            return await runLoad(args.url, targets, args.concurrency)
+        finally:
+            if Server is not None:
+                Server.watcher.cancel()
+                Server.close()
+                await Server.wait_closed()
+    report = asyncio.run(run())
+    # print the report
+    print("requests     " + str(report['requests']) + " (" + str(report['failures']) + " failed)")
+    print("concurrency  " + str(args.concurrency))
+    print("seconds      %.3f" % report['seconds'])
+    print("rps          %.1f" % report['rps'])
+    print("p50 ms       %.3f" % report['p50'])
+    print("p95 ms       %.3f" % report['p95'])
+    print("p99 ms       %.3f" % report['p99'])
+    # fail the run if any request failed
+    return 1 if report['failures'] else 0
+
+# run as a script
+if __name__ == "__main__":
+    raise SystemExit(main())
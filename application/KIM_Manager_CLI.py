@@ -0,0 +1,590 @@
+### KIM_Manager_CLI.py
+# developed for Yamada North America, INC. Quality Assurance by Mason Ritchason
+"""KIM_Manager_CLI.py
+
+kim-manager: the Models, Machines and Mapping Configurations of the KIM
+Interface configuration from the command line, without the GUI. Every change
+(one operation or a whole CSV/JSON batch) is validated like the GUI dialogs
+validate it and is committed as one transaction: one timestamp, one changelog
+entry and one write.
+
+    python KIM_Manager_CLI.py list [models|machines|configs] [--model M] [--machine M] [--json]
+    python KIM_Manager_CLI.py add model --model 3D4 --values "Program" "Operator"
+    python KIM_Manager_CLI.py add machine --model 3D4 --machine "3D4 LATHE" --values "OD" "ID"
+    python KIM_Manager_CLI.py add config --machine "3D4 LATHE" --id 1-1 --map "OD:1:2" "Program:1:1"
+    python KIM_Manager_CLI.py edit machine --machine "3D4 LATHE" --new "3D4 LATHE 2"
+    python KIM_Manager_CLI.py remove config --machine "3D4 LATHE" --id 1-1
+    python KIM_Manager_CLI.py duplicate --machine "3D4 LATHE" --id 1-1 --new 1-2
+    python KIM_Manager_CLI.py batch operations.csv [--dry-run]
+    python KIM_Manager_CLI.py import-sheet measurements.xlsx [--sheet NAME] [--dry-run]
+    python KIM_Manager_CLI.py lint [--incremental] [--workers N] [--json]
+    python KIM_Manager_CLI.py backups [--export HASH PATH] [--diff HASH [HASH]]
+    python KIM_Manager_CLI.py backups --restore HASH [--changes N [N ...]]
+    python KIM_Manager_CLI.py history [--since 2026-10-01] [--until T] [--user U] [--model M] [--machine M] [--id ID] [--json]
+    python KIM_Manager_CLI.py undo [--redo]
+    python KIM_Manager_CLI.py export PATH
+    python KIM_Manager_CLI.py import PATH
+
+Batch files hold one operation per row: CSV with the columns
+op,model,machine,id,new,values,mappings (values "a|b|c", mappings
+"item:sheet:cluster|..."), or a JSON list of objects with the same fields
+(values and mappings as lists). Operations: add-model, edit-model,
+remove-model, add-machine, edit-machine, remove-machine, add-config,
+edit-config, remove-config, duplicate-config.
+
+Measurement sheets (CSV or XLSX, streamed a row at a time) have the columns
+model, machine, item, config, sheet, cluster: one row per measurement (or
+base information field) of a machine, with the config, sheet and cluster it
+maps to if it is mapped.
+
+lint checks the whole configuration: maps of items that are no longer base
+information or measurements, items mapped twice, maps sharing a sheet/cluster,
+machine names without their model prefix and duplicate names/IDs. Large
+configurations are checked in a process pool; --incremental only re-checks
+the models that changed since the last run. It exits with 1 if anything is found.
+
+backups lists the snapshots of the backup store (config/backups: an index plus
+gzip-compressed objects named by their hash); --export writes the configuration
+of a snapshot (a hash prefix or a time from the list) to a JSON file.
+--diff lists the numbered changes from the current configuration to a snapshot
+(or from one snapshot to another) by model, machine and config: added and
+removed objects, renames, base information, measurements and maps. --restore
+applies a snapshot as one commit, or only the --changes numbered by --diff.
+
+history lists the commits in the changelog (logs/changelog: one record per
+commit with its user, time, changed objects and before/after patch), filtered
+by time, user and object; a machine's history includes its configs and a
+model's includes its machines. Only the changelog segments indexed for the
+filter are read.
+
+Commands that only read the configuration (list, lint, history, export,
+backups without --restore and --dry-run batches and sheets) skip the session
+start and end work: folding the journal, refreshing the single config file and
+the getvalue lookups, and taking a backup.
+
+undo reverses the user's last change (or --redo the last undone one) as a new
+commit. Each user keeps the patches of their last 50 changes (undo_depth) in
+config/undo; replacing the whole configuration (import, a whole backup
+restore) drops them.
+"""
+
+
+### Libraries Segment
+#__________________________________________________________________________________________________
+import os as os
+import csv as csv
+import getpass as getpass
+from json import loads, dumps
+from time import perf_counter
+from argparse import ArgumentParser
+from classes.ConfigBatch import ConfigBatch as ConfigBatch
+from classes.ConfigDiff import ConfigDiff as ConfigDiff
+from classes.InterfaceCore import InterfaceCore as InterfaceCore
+from classes.SheetReader import SheetReader as SheetReader
+from classes.SheetImporter import SheetImporter as SheetImporter
+
+
+### Batch Segment
+#__________________________________________________________________________________________________
+# splits a mappings field into (item, sheet, cluster) triples
+def parseMappings(field):
+    """parseMappings(field)
+
+    field: str | list; "item:sheet:cluster|..." or a list of [item, sheet, cluster] /
+        {"item", "sheet", "cluster"}.
+
+    -> [(item, sheet, cluster)] | None (empty field)
+    """
+    # nothing entered
+    if (field is None) or (field == ""):
+        return None
+    # JSON lists
+    if isinstance(field, list):
+        return [(mapping['item'], mapping['sheet'], mapping['cluster']) if isinstance(mapping, dict)
+            else tuple(mapping) for mapping in field]
+    # CSV text (items may contain ':'; sheet and cluster are the last two fields)
+    mappings = []
+    for mapping in str(field).split("|"):
+        parts = mapping.rsplit(":", 2)
+        if len(parts) != 3:
+            raise ValueError("Mappings are written item:sheet:cluster, not '" + mapping + "'.")
+        mappings.append((parts[0].strip(), parts[1].strip(), parts[2].strip()))
+    return mappings
+
+# splits a values field into a list
+def parseValues(field):
+    """parseValues(field)
+
+    field: str | list; "a|b|c" or a list of strings.
+
+    -> [str] | None (empty field)
+    """
+    # nothing entered
+    if (field is None) or (field == ""):
+        return None
+    # JSON lists
+    if isinstance(field, list):
+        return [str(value) for value in field]
+    # CSV text
+    return [value.strip() for value in str(field).split("|")]
+
+# reads the rows of a batch file one at a time
+def readBatch(path):
+    """readBatch(path)
+
+    path: str; a .csv or .json batch file.
+
+    Yields batch rows ({"op", "model", "machine", "id", "new", "values", "mappings"}).
+    CSV files are read a row at a time.
+    """
+    # JSON: a list of rows (or {"operations": [...]})
+    if path.lower().endswith(".json"):
+        File = open(path, 'r', encoding = 'utf-8')
+        rows = loads(File.read())
+        File.close()
+        if isinstance(rows, dict):
+            rows = rows.get('operations', [])
+    # CSV: one row per line, with a header
+    else:
+        File = open(path, 'r', encoding = 'utf-8-sig', newline = "")
+        rows = csv.DictReader(File)
+    # normalize the fields
+    for row in rows:
+        try:
+            yield {"op":row.get('op'), "model":row.get('model') or None,
+                "machine":row.get('machine') or None, "id":row.get('id') or None,
+                "new":row.get('new') or None, "values":parseValues(row.get('values')),
+                "mappings":parseMappings(row.get('mappings'))}
+        # an unreadable field rejects the row
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            yield {"op":row.get('op') if isinstance(row, dict) else None,
+                "error":"Invalid row: " + str(error)}
+    # release the CSV file
+    if not path.lower().endswith(".json"):
+        File.close()
+
+# validates rows into one batch and commits it
+def runBatch(Core, rows, action, dry_run = False):
+    """runBatch(Core, rows, action, dry_run = False)
+
+    Core: InterfaceCore; the configuration to change.
+    rows: iterable of batch rows.
+    action: str; the changelog entry of the batch.
+    dry_run: (optional) bool; only validate.
+
+    Validates every row against a working copy of the configuration, then commits all
+    of their operations as one transaction (nothing is committed if any row fails).
+
+    -> int; the exit code.
+    """
+    # start the clock
+    start = perf_counter()
+    # validate the rows in order (later rows see the earlier ones)
+    Batch = ConfigBatch(Core.openConfigFile())
+    Batch.validate(rows)
+    # commit the batch
+    return commitBatch(Core, Batch, action, start, dry_run)
+
+# validates a measurement sheet into one batch and commits it
+def runSheet(Core, path, sheet = None, dry_run = False):
+    """runSheet(Core, path, sheet = None, dry_run = False)
+
+    Core: InterfaceCore; the configuration to change.
+    path: str; a .csv or .xlsx sheet with the columns model, machine, item, config,
+        sheet and cluster (see SheetImporter).
+    sheet: (optional) str; the worksheet to read (the first by default).
+    dry_run: (optional) bool; only validate.
+
+    Streams the sheet into machines and configs and commits them as one transaction.
+
+    -> int; the exit code.
+    """
+    # start the clock
+    start = perf_counter()
+    # stream the sheet into a batch
+    Batch = ConfigBatch(Core.openConfigFile())
+    Importer = SheetImporter(Batch)
+    Importer.importRecords(SheetReader(path, sheet).records())
+    print(str(Importer.machines) + " new machines, " + str(Importer.configs) + " new configs from "
+        + str(Batch.rows) + " rows")
+    # commit the batch
+    return commitBatch(Core, Batch, "Import Sheet: " + os.path.basename(path), start, dry_run)
+
+# commits a validated batch
+def commitBatch(Core, Batch, action, start, dry_run = False):
+    """commitBatch(Core, Batch, action, start, dry_run = False)
+
+    Core: InterfaceCore; the configuration to change.
+    Batch: ConfigBatch; the validated batch.
+    action: str; the changelog entry of the batch.
+    start: float; perf_counter() when the batch was started.
+    dry_run: (optional) bool; only report the validation.
+
+    Commits every operation of the batch as one transaction (nothing is committed if any
+    row failed) and reports the throughput.
+
+    -> int; the exit code.
+    """
+    validated = perf_counter()
+    # report rejected rows (the first 50); the batch is all or nothing
+    if Batch.errors:
+        for error in sorted(Batch.errors, key = lambda error: error['row'])[:50]:
+            print("Row " + str(error['row']) + ": " + error['error'].replace("\n", " "))
+        print(str(len(Batch.errors)) + " errors in " + str(Batch.rows) + " rows; nothing was committed.")
+        return 1
+    # nothing to do
+    if (not Batch.operations) or dry_run:
+        print(str(len(Batch.operations)) + " operations validated"
+            + (" (dry run; nothing was committed)." if dry_run else "."))
+        return 0
+    # commit once
+    report = Core.commitOperations(Batch.operations, action)
+    elapsed = perf_counter() - start
+    # report the throughput
+    print("Committed " + str(len(Batch.operations)) + " operations in " + '{:f}'.format(elapsed)
+        + "s (" + '{:.1f}'.format(len(Batch.operations) / max(elapsed, 1e-9)) + " ops/s; validate "
+        + '{:f}'.format(validated - start) + "s, commit " + '{:f}'.format(report['seconds'])
+        + "s, " + str(report['bytes']) + " bytes)")
+    # success
+    return 0
+
+
+### Command Segment
+#__________________________________________________________________________________________________
+# prints the models, machines or configs
+def listConfig(Core, kind, model = None, machine = None, as_json = False):
+    """listConfig(Core, kind, model = None, machine = None, as_json = False)
+
+    Prints the models, machines (of a model) or configs (of a machine).
+
+    -> int; the exit code.
+    """
+    # collect the rows
+    rows = []
+    for curr_model in Core.openConfigFile()['models']:
+        if (model is not None) and (curr_model['name'] != model):
+            continue
+        if kind == "models":
+            rows.append({"model":curr_model['name'], "base_information":curr_model['base_information'],
+                "machines":len(curr_model['machines'])})
+            continue
+        for curr_machine in curr_model['machines']:
+            if (machine is not None) and (curr_machine['name'] != machine):
+                continue
+            if kind == "machines":
+                rows.append({"model":curr_model['name'], "machine":curr_machine['name'],
+                    "measurements":curr_machine['measurements'],
+                    "configs":len(curr_machine['mapping_configurations'])})
+                continue
+            for config in curr_machine['mapping_configurations']:
+                rows.append({"machine":curr_machine['name'], "id":config['id'],
+                    "mappings":[mapping['item'] + ":" + str(mapping['sheet']) + ":"
+                        + str(mapping['cluster']) for mapping in config['mappings']]})
+    # print them
+    if as_json:
+        print(dumps(rows, indent = 4, ensure_ascii = False))
+    else:
+        for row in rows:
+            print(" | ".join(("|".join(value) if isinstance(value, list) else str(value))
+                for value in row.values()))
+    # success
+    return 0
+
+# checks the whole configuration
+def lintConfig(Core, incremental = False, workers = None, as_json = False):
+    """lintConfig(Core, incremental = False, workers = None, as_json = False)
+
+    Prints the findings of the linter (see ConfigLinter) and how many models were checked.
+
+    -> int; the exit code (1 if anything was found).
+    """
+    # set the process pool size
+    if workers:
+        Core.linter.workers = workers
+    # check the configuration
+    report = Core.lintConfig(incremental)
+    # print the findings
+    if as_json:
+        print(dumps(report, indent = 4, ensure_ascii = False))
+    else:
+        for finding in report['findings']:
+            print(finding['check'] + ": " + finding['message'])
+        print(str(len(report['findings'])) + " findings; " + str(report['checked']) + " of "
+            + str(report['models']) + " models checked" + (" in a process pool" if report['parallel']
+            else "") + " (" + str(report['reused']) + " unchanged) in " + '{:f}'.format(report['seconds'])
+            + "s")
+    # findings fail the run
+    return 1 if report['findings'] else 0
+
+# lists, exports, compares or restores the backups
+def listBackups(Core, export = None, diff = None, restore = None, changes = None):
+    """listBackups(Core, export = None, diff = None, restore = None, changes = None)
+
+    export: (optional) [str, str]; the snapshot (hash prefix or time) and the path to
+        write its configuration to.
+    diff: (optional) [str] | [str, str]; the snapshot to compare the current configuration
+        with (or the two snapshots to compare).
+    restore: (optional) str; the snapshot to restore.
+    changes: (optional) [int]; the numbers (see diff) of the changes to restore.
+
+    Prints the snapshots of the backup store, oldest first, or exports, compares or
+    restores them.
+
+    -> int; the exit code.
+    """
+    # print the index
+    if (export is None) and (diff is None) and (restore is None):
+        for entry in Core.backups.snapshots():
+            print(entry['time'] + " | " + entry['hash'][:12] + " | " + str(entry['timestamp']))
+        return 0
+    # find the snapshots
+    references = export[:1] if export else (diff if diff else [restore])
+    entries = [Core.backups.find(reference) for reference in references]
+    for reference, entry in zip(references, entries):
+        if entry is None:
+            print("No backup matches " + reference + ".")
+            return 1
+    # write its configuration
+    if export is not None:
+        File = open(export[1], 'w', encoding = 'utf-8')
+        File.write(dumps(Core.backups.read(entries[0]), indent = 4))
+        File.close()
+        print("Exported the backup of " + entries[0]['time'] + " to " + export[1])
+        return 0
+    # the changes from the current configuration to the snapshot (or between snapshots)
+    found = Core.diffBackups(*(entries if len(entries) == 2 else [None, entries[0]]))
+    if diff is not None:
+        for number, change in enumerate(found, 1):
+            lines = ConfigDiff.describe(change)
+            print(str(number) + ". " + "\n".join(lines))
+        print(str(len(found)) + " changes")
+        return 0
+    # restore the snapshot (or the chosen changes)
+    if changes:
+        if not all(1 <= number <= len(found) for number in changes):
+            print("Changes are numbered 1 to " + str(len(found)) + ".")
+            return 1
+        found = [found[number - 1] for number in changes]
+    report = Core.restoreBackup(entries[0], found if changes else None)
+    print("Restored " + (str(len(found)) + " changes of " if changes else "")
+        + "the backup of " + entries[0]['time'] + " (" + str(report['bytes']) + " bytes)")
+    return 0
+
+# prints the commits of the changelog
+def showHistory(Core, since = None, until = None, user = None, model = None, machine = None,
+        config_id = None, as_json = False):
+    """showHistory(Core, since = None, until = None, user = None, model = None, machine = None,
+        config_id = None, as_json = False)
+
+    Prints the changelog records in a time range, of a user and of a model, machine or
+    config (by their current name or ID), oldest first.
+
+    -> int; the exit code.
+    """
+    # the key of the object (by its current name)
+    key = None
+    Index = Core.getValidationIndex()
+    if config_id is not None:
+        key = Index.configIds(Index.machines.get(str(machine))).get(str(config_id))
+    elif machine is not None:
+        key = Index.machines.get(str(machine))
+    elif model is not None:
+        key = Index.models.get(str(model))
+    if ((model, machine, config_id) != (None, None, None)) and (key is None):
+        print("No such model, machine or config in the current configuration.")
+        return 1
+    # find the records
+    records = Core.changeHistory(since, until, user, key)
+    # print them
+    if as_json:
+        print(dumps(records, indent = 4, ensure_ascii = False))
+    else:
+        for record in records:
+            print(record['time'] + " | " + record['user'] + " | " + record['action'])
+        print(str(len(records)) + " commits")
+    # success
+    return 0
+
+# undoes the user's last change
+def undoChange(Core, redo = False):
+    """undoChange(Core, redo = False)
+
+    Undoes the user's last change (or redoes the last undone one) as one commit.
+
+    -> int; the exit code.
+    """
+    # the change to reverse
+    entry = Core.undo_log.peek(redo)
+    if entry is None:
+        print("There is no change to " + ("redo." if redo else "undo."))
+        return 1
+    # reverse it
+    try:
+        report = Core.undoCommit(redo)
+    # an object it changed is gone or changed since
+    except KeyError as error:
+        print("Could not " + ("redo" if redo else "undo") + " '" + entry['action'] + "': "
+            + str(error.args[0]))
+        return 1
+    print(report['action'] + " (" + str(report['bytes']) + " bytes)")
+    # success
+    return 0
+
+# parses the command line and runs the command
+def main(argv = None):
+    """main(argv = None)
+
+    argv: (optional) [str]; the command line arguments (defaults to sys.argv).
+
+    -> int; the exit code.
+    """
+    # build the command line
+    parser = ArgumentParser(prog = "kim-manager",
+        description = "Manage the KIM Interface configuration without the GUI.")
+    parser.add_argument("--dir", default = os.path.abspath(os.getcwd()),
+        help = "the KIM Interface Manager folder (holding KIM_interface_manager_config.json)")
+    parser.add_argument("--user", default = os.getenv('username') or getpass.getuser(),
+        help = "the user signature of commits")
+    commands = parser.add_subparsers(dest = "command", required = True)
+    # list
+    command = commands.add_parser("list", help = "list models, machines or configs")
+    command.add_argument("kind", nargs = "?", default = "models",
+        choices = ["models", "machines", "configs"])
+    command.add_argument("--model")
+    command.add_argument("--machine")
+    command.add_argument("--json", action = "store_true", help = "print JSON")
+    # add / edit / remove
+    for verb in ["add", "edit", "remove"]:
+        command = commands.add_parser(verb, help = verb + " a model, machine or config")
+        command.add_argument("kind", choices = ["model", "machine", "config"])
+        command.add_argument("--model", help = "model name")
+        command.add_argument("--machine", help = "machine name")
+        command.add_argument("--id", help = "mapping configuration ID")
+        if verb != "remove":
+            command.add_argument("--values", nargs = "+",
+                help = "base information headers (model) or measurement specs (machine)")
+            command.add_argument("--map", nargs = "+", dest = "mappings",
+                help = "config maps as item:sheet:cluster")
+        if verb == "edit":
+            command.add_argument("--new", help = "the new name or ID")
+    # duplicate
+    command = commands.add_parser("duplicate", help = "duplicate a config under a new ID")
+    command.add_argument("--machine", required = True)
+    command.add_argument("--id", required = True)
+    command.add_argument("--new", required = True)
+    # batch
+    command = commands.add_parser("batch", help = "apply a CSV/JSON batch as one commit")
+    command.add_argument("path")
+    command.add_argument("--dry-run", action = "store_true", help = "only validate the batch")
+    # measurement sheets
+    command = commands.add_parser("import-sheet",
+        help = "create machines and configs from a CSV/XLSX measurement sheet as one commit")
+    command.add_argument("path")
+    command.add_argument("--sheet", help = "the worksheet to read (the first by default)")
+    command.add_argument("--dry-run", action = "store_true", help = "only validate the sheet")
+    # lint
+    command = commands.add_parser("lint", help = "check the whole configuration for broken maps and names")
+    command.add_argument("--incremental", action = "store_true",
+        help = "only re-check the models changed since the last run")
+    command.add_argument("--workers", type = int, help = "the process pool size (1 checks in-process)")
+    command.add_argument("--json", action = "store_true", help = "print JSON")
+    # backups
+    command = commands.add_parser("backups", help = "list the configuration backups or export one")
+    command.add_argument("--export", nargs = 2, metavar = ("HASH", "PATH"),
+        help = "write the configuration of a backup (hash prefix or time) to a JSON file")
+    command.add_argument("--diff", nargs = "+", metavar = "HASH",
+        help = "list the changes from the current configuration to a backup (or between two)")
+    command.add_argument("--restore", metavar = "HASH", help = "restore a backup as one commit")
+    command.add_argument("--changes", nargs = "+", type = int, metavar = "N",
+        help = "only restore these changes (numbered by --diff)")
+    # history
+    command = commands.add_parser("history", help = "list the commits in the changelog")
+    command.add_argument("--since", help = "the earliest time (e.g. 2026-10-01)")
+    command.add_argument("--until", help = "the time to stop before")
+    command.add_argument("--user", dest = "author", help = "the user who committed")
+    command.add_argument("--model")
+    command.add_argument("--machine")
+    command.add_argument("--id", help = "a config ID (of --machine)")
+    command.add_argument("--json", action = "store_true", help = "print JSON (with the patches)")
+    # undo / redo
+    command = commands.add_parser("undo", help = "undo your last change")
+    command.add_argument("--redo", action = "store_true", help = "redo your last undone change")
+    # export / import
+    command = commands.add_parser("export", help = "write the configuration to a JSON file")
+    command.add_argument("path")
+    command = commands.add_parser("import", help = "replace the configuration with a JSON file")
+    command.add_argument("path")
+    args = parser.parse_args(argv)
+    # commands that only read the configuration do not need a session
+    read_only = (args.command in ["list", "lint", "history", "export"]) \
+        or ((args.command == "backups") and (args.restore is None)) or getattr(args, 'dry_run', False)
+    # open the configuration for the session (a new sharded or SQLite store is filled first)
+    Core = InterfaceCore.fromManagerConfig(args.dir, args.user)
+    Core.verifyFolders()
+    if (not read_only) or (not Core.store.exists()):
+        read_only = False
+        Core.startup()
+    try:
+        # list
+        if args.command == "list":
+            return listConfig(Core, args.kind, args.model, args.machine, args.json)
+        # lint
+        if args.command == "lint":
+            return lintConfig(Core, args.incremental, args.workers, args.json)
+        # history
+        if args.command == "history":
+            return showHistory(Core, args.since, args.until, args.author, args.model, args.machine,
+                args.id, args.json)
+        # undo
+        if args.command == "undo":
+            return undoChange(Core, args.redo)
+        # backups
+        if args.command == "backups":
+            if args.diff and (len(args.diff) > 2):
+                print("--diff compares at most 2 backups.")
+                return 1
+            return listBackups(Core, args.export, args.diff, args.restore, args.changes)
+        # export the current configuration
+        if args.command == "export":
+            File = open(args.path, 'w', encoding = 'utf-8')
+            File.write(dumps(Core.openConfigFile(), indent = 4))
+            File.close()
+            print("Exported the configuration to " + args.path)
+            return 0
+        # replace the configuration
+        if args.command == "import":
+            File = open(args.path, 'r', encoding = 'utf-8')
+            document = loads(File.read())
+            File.close()
+            if not isinstance(document.get('models'), list):
+                print(args.path + " is not a KIM Interface configuration (no models list).")
+                return 1
+            report = Core.commit(document, "Import Configuration: " + os.path.basename(args.path))
+            print("Imported " + str(len(document['models'])) + " models (" + str(report['bytes'])
+                + " bytes)")
+            return 0
+        # a measurement sheet
+        if args.command == "import-sheet":
+            return runSheet(Core, args.path, args.sheet, args.dry_run)
+        # a batch file
+        if args.command == "batch":
+            return runBatch(Core, readBatch(args.path),
+                "Batch: " + os.path.basename(args.path), args.dry_run)
+        # one operation (a batch of one)
+        op = "duplicate-config" if args.command == "duplicate" else args.command + "-" + args.kind
+        row = {"op":op, "model":getattr(args, 'model', None), "machine":args.machine, "id":args.id,
+            "new":getattr(args, 'new', None), "values":getattr(args, 'values', None),
+            "mappings":parseMappings("|".join(args.mappings)) if getattr(args, 'mappings', None) else None}
+        target = (str(args.machine) + "; " + str(args.id)) if op.endswith("config") \
+            else (args.machine if "machine" in op else args.model)
+        return runBatch(Core, [row], op.replace("-", " ").title() + ": " + str(target))
+    # release the configuration (ending the session if it was started)
+    finally:
+        if read_only:
+            Core.close()
+        else:
+            Core.shutdown()
+
+# run as a script
+if __name__ == "__main__":
+    raise SystemExit(main())
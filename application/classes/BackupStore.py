@@ -0,0 +1,307 @@
+"""Backup Stores keep snapshots of the KIM Interface configuration as compressed, content-addressed objects, so unchanged models and identical snapshots are stored once."""
+
+import os as os
+import gzip as gzip
+import hashlib as hashlib
+from json import loads, dumps
+from datetime import datetime, timedelta
+
+# KIM Interface Backup Store Class
+class BackupStore:
+    # the name of the index (oldest snapshot first)
+    INDEX = "index.json"
+
+    # default constructor
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, BackupStore.INDEX)
+        # gzip-compressed objects named by the hash of their contents (models and manifests)
+        self.objects_dir = os.path.join(directory, "objects")
+        # the loaded index ([{"time", "timestamp", "hash"}], oldest first)
+        self.entries = None
+        self.object_writes = 0
+
+    # default print
+    def __str__(self):
+        return f"Backup Store {self.directory} ({len(self.snapshots())} snapshots)"
+
+    @staticmethod
+    def digest(data):
+        """Returns the hex SHA-256 hash of serialized bytes (the name of their object)."""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def serialize(value):
+        """Serializes a Dict compactly (the same contents always give the same bytes)."""
+        return dumps(value, separators = (",", ":")).encode("utf-8")
+
+    def objectPath(self, name):
+        """Returns the path of the object with the passed hash (fanned out by its first 2
+        characters, so no folder gets too large)."""
+        return os.path.join(self.objects_dir, name[:2], name + ".json.gz")
+
+    def writeObject(self, data):
+        """writeObject(data)
+
+        data: bytes; serialized contents.
+
+        Compresses and stores contents under their hash, unless an object with that hash
+        is already stored.
+
+        -> (str, int); the hash and the number of bytes written (0 if it was stored).
+        """
+        name = BackupStore.digest(data)
+        path = self.objectPath(name)
+        # stored by an earlier snapshot
+        if os.path.isfile(path):
+            return (name, 0)
+        # write the temporary file, then move it into place (readers never see half an object)
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        compressed = gzip.compress(data, compresslevel = 6, mtime = 0)
+        File = open(path + ".tmp", 'wb')
+        File.write(compressed)
+        File.close()
+        os.replace(path + ".tmp", path)
+        # count the write
+        self.object_writes += 1
+        return (name, len(compressed))
+
+    def readObject(self, name):
+        """Returns the parsed contents of the object with the passed hash."""
+        File = open(self.objectPath(name), 'rb')
+        data = gzip.decompress(File.read())
+        File.close()
+        return loads(data)
+
+    def snapshots(self):
+        """Returns the index of snapshots, oldest first (read once per session).
+
+        -> [{"time", "timestamp", "hash"}]
+        """
+        if self.entries is None:
+            try:
+                File = open(self.index_path, 'r')
+                self.entries = loads(File.read())
+                File.close()
+            # no snapshot yet
+            except FileNotFoundError:
+                self.entries = []
+        return self.entries
+
+    def latest(self):
+        """Returns the newest index entry on disk (None if there is no snapshot), without
+        touching the loaded index (the backup worker may be using it).
+
+        -> {"time", "timestamp", "hash"} | None
+        """
+        try:
+            File = open(self.index_path, 'r')
+            entries = loads(File.read())
+            File.close()
+        # no snapshot yet
+        except FileNotFoundError:
+            return None
+        return entries[-1] if entries else None
+
+    def saveIndex(self):
+        """Writes the index to a temporary file, then swaps it in."""
+        File = open(self.index_path + ".tmp", 'w')
+        File.write(dumps(self.snapshots(), indent = 4))
+        File.close()
+        os.replace(self.index_path + ".tmp", self.index_path)
+
+    @staticmethod
+    def prepare(document):
+        """prepare(document)
+
+        document: dict; the configuration to back up.
+
+        Serializes a configuration for store (in memory only, so the caller gets a consistent
+        copy to hand to another thread while it keeps editing the configuration).
+
+        -> {"timestamp", "fields", "models":[bytes]}
+        """
+        # the manifest holds everything but the models and the timestamp
+        fields = dict((field, value) for field, value in document.items()
+            if field not in ("timestamp", "models"))
+        return {"timestamp":document.get('timestamp'), "fields":loads(dumps(fields)),
+            "models":[BackupStore.serialize(model) for model in document['models']]}
+
+    def store(self, prepared, time = None, progress = None):
+        """store(prepared, time = None, progress = None)
+
+        prepared: dict; a configuration serialized by prepare.
+        time: (optional) str; when the snapshot was taken (defaults to now).
+        progress: (optional) function(stage, done, total); called after each object.
+
+        Stores each model as its own object and the snapshot as a manifest of model hashes
+        plus the other top-level fields (its hash names the snapshot; the config timestamp
+        is kept in the index, so the same contents always hash the same). Models that an
+        earlier snapshot stored are not written again, and a snapshot identical to the
+        latest one is skipped.
+
+        -> {"hash", "skipped", "objects", "bytes"}
+        """
+        # hash each model (written only if no snapshot stored it yet)
+        size = 0
+        objects = 0
+        models = []
+        for data in prepared['models']:
+            name, written = self.writeObject(data)
+            models.append(name)
+            size += written
+            objects += 1 if written else 0
+            if progress is not None:
+                progress("snapshot", len(models), len(prepared['models']))
+        manifest = BackupStore.serialize({"fields":prepared['fields'], "models":models})
+        # nothing changed since the latest snapshot (the index is re-read; another
+        # process may have added to it)
+        self.entries = None
+        entries = self.snapshots()
+        if entries and (entries[-1]['hash'] == BackupStore.digest(manifest)):
+            return {"hash":entries[-1]['hash'], "skipped":True, "objects":objects, "bytes":size}
+        # store the manifest and index the snapshot
+        name, written = self.writeObject(manifest)
+        size += written
+        objects += 1 if written else 0
+        entries.append({"time":time or str(datetime.now()), "timestamp":prepared['timestamp'],
+            "hash":name})
+        self.saveIndex()
+        # return what was written
+        return {"hash":name, "skipped":False, "objects":objects, "bytes":size}
+
+    def snapshot(self, document, time = None):
+        """Stores a snapshot of a configuration (see prepare and store).
+
+        -> {"hash", "skipped", "objects", "bytes"}
+        """
+        return self.store(BackupStore.prepare(document), time)
+
+    def find(self, reference):
+        """Returns the newest index entry whose hash starts with, or whose time equals, the
+        passed reference (None if there is none)."""
+        for entry in reversed(self.snapshots()):
+            if entry['hash'].startswith(str(reference)) or (entry['time'] == reference):
+                return entry
+        return None
+
+    def read(self, entry):
+        """read(entry)
+
+        entry: dict; an index entry (see snapshots and find).
+
+        Assembles the configuration of a snapshot.
+
+        -> {"timestamp", "models"}
+        """
+        manifest = self.readObject(entry['hash'])
+        # the timestamp leads, like in the config file
+        document = {"timestamp":entry['timestamp']}
+        document.update(manifest['fields'])
+        document['models'] = [self.readObject(name) for name in manifest['models']]
+        return document
+
+    def models(self, entry):
+        """Returns the hashes of the models of a snapshot, in order (only its manifest is read)."""
+        return self.readObject(entry['hash'])['models']
+
+    def retain(self, count = None, days = None, size = None, progress = None):
+        """retain(count = None, days = None, size = None, progress = None)
+
+        count: (optional) int; the most snapshots to keep.
+        days: (optional) float; drop snapshots taken longer ago than this.
+        size: (optional) int; the most bytes of objects to keep.
+        progress: (optional) function(stage, done, total); called after each snapshot.
+
+        Keeps the newest snapshots within every limit in one pass (newest first; a
+        snapshot's size is that of the objects no newer snapshot uses), drops the rest and
+        removes the objects that no kept snapshot uses. The objects are listed once. The
+        latest snapshot is always kept.
+
+        -> int; the number of objects removed.
+        """
+        # the index is re-read (another process may have added to it)
+        self.entries = None
+        entries = self.snapshots()
+        # the stored objects and their sizes (one listing, also used to remove them)
+        stored = {}
+        if os.path.isdir(self.objects_dir):
+            for folder in os.scandir(self.objects_dir):
+                for item in os.scandir(folder.path):
+                    if item.name.endswith(".json.gz"):
+                        stored[item.name[:-len(".json.gz")]] = (item.path, item.stat().st_size)
+        # snapshots taken before this are too old
+        oldest = (datetime.now() - timedelta(days = days)) if days else None
+        # walk the snapshots newest first, keeping each one while every limit holds
+        live = set()
+        total = 0
+        kept = 0
+        for entry in reversed(entries):
+            if kept > 0:
+                # too many
+                if count and (kept >= count):
+                    break
+                # too old (snapshots without a readable time are kept)
+                try:
+                    if (oldest is not None) and (datetime.fromisoformat(entry['time']) < oldest):
+                        break
+                except ValueError:
+                    pass
+            # the objects only this and older snapshots use
+            names = [name for name in [entry['hash']] + self.readObject(entry['hash'])['models']
+                if name not in live]
+            added = sum(stored[name][1] for name in set(names) if name in stored)
+            # too large
+            if (kept > 0) and size and (total + added > size):
+                break
+            live.update(names)
+            total += added
+            kept += 1
+            if progress is not None:
+                progress("retention", kept, len(entries))
+        # within every limit
+        if kept == len(entries):
+            return 0
+        # drop the oldest entries first (the index never names a missing object)
+        del entries[:len(entries) - kept]
+        self.saveIndex()
+        # remove the objects no kept snapshot uses
+        removed = 0
+        for name, (path, object_size) in stored.items():
+            if name not in live:
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def importLegacy(self, backups_dir):
+        """importLegacy(backups_dir)
+
+        backups_dir: str; the folder of the older latest.json and past/<timestamp>.json copies.
+
+        Stores the older full-copy backups as snapshots (oldest first) and removes the
+        copies.
+
+        -> int; the number of copies imported.
+        """
+        past_dir = os.path.join(backups_dir, "past")
+        # the past copies are named by their timestamp; the latest copy is the newest
+        paths = [os.path.join(past_dir, name) for name in sorted(os.listdir(past_dir))
+            if name.endswith(".json")] if os.path.isdir(past_dir) else []
+        if os.path.isfile(os.path.join(backups_dir, "latest.json")):
+            paths.append(os.path.join(backups_dir, "latest.json"))
+        imported = 0
+        for path in paths:
+            try:
+                File = open(path, 'r')
+                document = loads(File.read())
+                File.close()
+            # leave unreadable copies where they are
+            except ValueError:
+                continue
+            self.snapshot(document, str(document.get('timestamp', "")).split(" | ")[0])
+            os.remove(path)
+            imported += 1
+        # the past folder is no longer used
+        if os.path.isdir(past_dir) and (not os.listdir(past_dir)):
+            os.rmdir(past_dir)
+        return imported
@@ -0,0 +1,89 @@
+"""Backup Workers run configuration backups and their retention on a background thread and report their progress to the UI."""
+
+from queue import Queue
+from threading import Thread, Lock, Condition
+from time import perf_counter
+
+# KIM Interface Backup Worker Class
+class BackupWorker:
+    # default constructor
+    def __init__(self):
+        self.jobs = Queue()
+        self.thread = None
+        # guards the progress and the report
+        self.lock = Lock()
+        # signalled whenever the last queued job is done
+        self.idle = Condition()
+        self.pending = 0
+        # {"stage", "done", "total"} of the running job
+        self.state = {"stage":"idle", "done":0, "total":0}
+        # the result of the last job ({"seconds"} plus what the job returned) and its error
+        self.last_report = None
+        self.error = None
+
+    # default print
+    def __str__(self):
+        return f"Backup Worker {self.pending} pending ({self.state['stage']})"
+
+    def busy(self):
+        """Returns True while a job is queued or running."""
+        with self.idle:
+            return self.pending > 0
+
+    def submit(self, job):
+        """submit(job)
+
+        job: function(progress) -> dict; the backup to run (progress: function(stage, done, total)).
+
+        Queues a job; jobs run one at a time, in the order they were submitted.
+        """
+        with self.idle:
+            self.pending += 1
+        self.jobs.put(job)
+        # start the worker thread once
+        if self.thread is None:
+            self.thread = Thread(target = self.run, name = "ConfigBackup", daemon = True)
+            self.thread.start()
+
+    def report(self, stage, done, total):
+        """Notes the progress of the running job (worker thread)."""
+        with self.lock:
+            self.state = {"stage":stage, "done":done, "total":total}
+
+    def progress(self):
+        """Returns the {"stage", "done", "total"} of the running job ("idle" when there is none)."""
+        with self.lock:
+            return dict(self.state)
+
+    def run(self):
+        """Worker thread: runs the queued jobs; a failed job is reported, not raised."""
+        while True:
+            job = self.jobs.get()
+            start = perf_counter()
+            try:
+                report = job(self.report)
+                error = None
+            # keep the error for the UI (there is nobody to raise it to)
+            except Exception as exception:
+                report = None
+                error = exception
+            with self.lock:
+                self.last_report = None if report is None else dict(report, seconds = perf_counter() - start)
+                self.error = error
+                self.state = {"stage":"idle", "done":0, "total":0}
+            # wake whoever waits for the queue to drain
+            with self.idle:
+                self.pending -= 1
+                self.idle.notify_all()
+
+    def wait(self, timeout = None):
+        """wait(timeout = None)
+
+        timeout: (optional) float; the most seconds to wait (None waits until done).
+
+        Waits for every queued job to finish.
+
+        -> bool; True if no job is left.
+        """
+        with self.idle:
+            return self.idle.wait_for(lambda: self.pending == 0, timeout)
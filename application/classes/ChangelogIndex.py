@@ -0,0 +1,224 @@
+"""Changelog Indexes find the changelog records of a time range, user or object by reading only the compressed segments that hold them."""
+
+import os as os
+import gzip as gzip
+from json import loads, dumps
+
+# KIM Interface Changelog Index Class
+class ChangelogIndex:
+    # version of the index (older indexes are rebuilt)
+    VERSION = 1
+    # the segment being appended to
+    CURRENT = "current.jsonl"
+
+    # default constructor
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self.current_path = os.path.join(directory, ChangelogIndex.CURRENT)
+        # the loaded index (see load) and the signature of the file it was read from
+        self.data = None
+        self.signature = None
+
+    # default print
+    def __str__(self):
+        return f"Changelog Index {self.directory} ({len(self.load()['segments'])} segments)"
+
+    @staticmethod
+    def empty():
+        """Returns an index of no segments.
+
+        -> {"version", "segments":[{"file", "first", "last", "records"}],
+            "users":{user:[segment]}, "keys":{key:[segment]}, "legacy"}
+        """
+        return {"version":ChangelogIndex.VERSION, "segments":[], "users":{}, "keys":{}, "legacy":False}
+
+    def load(self):
+        """Returns the index of the closed segments (read again only when another process
+        rewrote it; rebuilt if it is unreadable or of another version)."""
+        # the signature of the index file (None if there is none)
+        try:
+            stat = os.stat(self.index_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+        if (self.data is None) or (signature != self.signature):
+            self.signature = signature
+            try:
+                File = open(self.index_path, 'r')
+                self.data = loads(File.read())
+                File.close()
+            # no segment closed yet
+            except (OSError, ValueError):
+                self.data = None
+            if (self.data is None) or (self.data.get('version') != ChangelogIndex.VERSION):
+                self.data = self.rebuild()
+        return self.data
+
+    def save(self):
+        """Writes the index to a temporary file, then swaps it in."""
+        File = open(self.index_path + ".tmp", 'w')
+        File.write(dumps(self.data, separators = (",", ":")))
+        File.close()
+        os.replace(self.index_path + ".tmp", self.index_path)
+        # the written index is current
+        stat = os.stat(self.index_path)
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+
+    def indexSegment(self, data, name, records):
+        """Adds one segment and its records to an index in memory."""
+        number = len(data['segments'])
+        data['segments'].append({"file":name, "first":records[0]['time'], "last":records[-1]['time'],
+            "records":len(records)})
+        # each user and object lists the segments that hold its records (once each)
+        for record in records:
+            for postings in [data['users'].setdefault(record['user'], [])] \
+                    + [data['keys'].setdefault(key, []) for key in record['keys']]:
+                if (not postings) or (postings[-1] != number):
+                    postings.append(number)
+
+    def rebuild(self):
+        """Indexes the segments on disk again (the index was lost or is of another version).
+
+        -> index
+        """
+        data = ChangelogIndex.empty()
+        names = sorted(name for name in os.listdir(self.directory) if name.endswith(".jsonl.gz")) \
+            if os.path.isdir(self.directory) else []
+        for name in names:
+            records = self.readSegment(name)
+            if records:
+                self.indexSegment(data, name, records)
+        # a segment of the old text changelog means it was imported
+        data['legacy'] = any(name.endswith("legacy.jsonl.gz") for name in names)
+        return data
+
+    @staticmethod
+    def parse(lines):
+        """Parses record lines (a torn final line is ignored).
+
+        -> [record]
+        """
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                records.append(loads(line))
+            # the last record was only partially written
+            except ValueError:
+                break
+        return records
+
+    def readSegment(self, name):
+        """Returns the records of a closed (compressed) segment."""
+        File = gzip.open(os.path.join(self.directory, name), 'rt', encoding = 'utf-8')
+        records = ChangelogIndex.parse(File)
+        File.close()
+        return records
+
+    def readCurrent(self):
+        """Returns the records of the segment being appended to."""
+        if not os.path.isfile(self.current_path):
+            return []
+        File = open(self.current_path, 'r', encoding = 'utf-8')
+        records = ChangelogIndex.parse(File)
+        File.close()
+        return records
+
+    def addSegment(self, records, name = None):
+        """addSegment(records, name = None)
+
+        records: [record]; the records of the segment, oldest first.
+        name: (optional) str; the segment file name (numbered by default).
+
+        Compresses the records into a closed segment and indexes it.
+
+        -> str | None; the segment name (None if there were no records).
+        """
+        if not records:
+            return None
+        data = self.load()
+        # segments are numbered in order
+        if name is None:
+            name = '{:06d}'.format(len(data['segments']) + 1) + ".jsonl.gz"
+        # write the compressed segment, then swap it in
+        path = os.path.join(self.directory, name)
+        File = gzip.open(path + ".tmp", 'wt', encoding = 'utf-8')
+        File.write("".join(dumps(record, separators = (",", ":")) + "\n" for record in records))
+        File.close()
+        os.replace(path + ".tmp", path)
+        # index it
+        self.indexSegment(data, name, records)
+        self.save()
+        return name
+
+    @staticmethod
+    def matches(record, start, end, user, key):
+        """Returns True if a record is in the time range and of the user and object (None
+        matches any)."""
+        return (((start is None) or (record['time'] >= start)) and ((end is None) or (record['time'] < end))
+            and ((user is None) or (record['user'] == user)) and ((key is None) or (key in record['keys'])))
+
+    def query(self, start = None, end = None, user = None, key = None):
+        """query(start = None, end = None, user = None, key = None)
+
+        start: (optional) str; the earliest time ("2026-10-01" or a full time).
+        end: (optional) str; the time to stop before.
+        user: (optional) str; the user signature of the commits.
+        key: (optional) str; the key of a model, machine or config (the records of the
+            machines and configs below it match too).
+
+        Finds the records of the closed segments that the index lists for the user and
+        object and that overlap the time range (no other segment is read), then those of
+        the segment being appended to.
+
+        -> [record]; oldest first.
+        """
+        data = self.load()
+        # the segments of the user and object
+        numbers = set(range(len(data['segments'])))
+        if user is not None:
+            numbers &= set(data['users'].get(user, []))
+        if key is not None:
+            numbers &= set(data['keys'].get(key, []))
+        # the segments that overlap the time range
+        records = []
+        for number in sorted(numbers):
+            segment = data['segments'][number]
+            if ((start is not None) and (segment['last'] < start)) or ((end is not None) and (segment['first'] >= end)):
+                continue
+            records += [record for record in self.readSegment(segment['file'])
+                if ChangelogIndex.matches(record, start, end, user, key)]
+        # the records not in a closed segment yet
+        records += [record for record in self.readCurrent()
+            if ChangelogIndex.matches(record, start, end, user, key)]
+        return records
+
+    def importLegacy(self, path):
+        """importLegacy(path)
+
+        path: str; the old text changelog ('datetime | user | action' lines).
+
+        Stores the lines of the old text changelog as the first records (once; the text
+        file is left as it is).
+
+        -> int; the number of records imported.
+        """
+        data = self.load()
+        # imported already (or nothing to import)
+        if data['legacy'] or (not os.path.isfile(path)):
+            return 0
+        records = []
+        File = open(path, 'r', encoding = 'utf-8', errors = 'replace')
+        for line in File:
+            parts = line.rstrip("\n").split(" | ", 2)
+            if len(parts) == 3:
+                records.append({"time":parts[0], "user":parts[1], "action":parts[2], "type":"legacy",
+                    "keys":[], "patch":None})
+        File.close()
+        # the old records sort first (also when the index is rebuilt)
+        self.addSegment(sorted(records, key = lambda record: record['time']), "000000-legacy.jsonl.gz")
+        data['legacy'] = True
+        self.save()
+        return len(records)
@@ -0,0 +1,82 @@
+"""Changelog Writers keep the changelog open for the session, append a structured record per commit and rotate full segments into compressed, indexed ones."""
+
+import os as os
+from json import dumps
+from datetime import datetime
+from classes.ChangelogIndex import ChangelogIndex as ChangelogIndex
+
+# KIM Interface Changelog Writer Class
+class ChangelogWriter:
+    # default constructor
+    def __init__(self, directory, user, segment_bytes = 1048576, buffer_size = 65536):
+        self.directory = directory
+        self.user = user
+        # the segment being appended to is compressed and indexed once it passes this size
+        self.segment_bytes = segment_bytes
+        self.buffer_size = buffer_size
+        self.index = ChangelogIndex(directory)
+        self.path = self.index.current_path
+        self.File = None
+
+    # default print
+    def __str__(self):
+        return f"Changelog {self.directory}"
+
+    def writeEntry(self, action, when = None, patch = None, keys = None):
+        """writeEntry(action, when = None, patch = None, keys = None)
+
+        action: str; a plaintext description of the commit.
+        when: (optional) datetime; the time of the commit (defaults to now).
+        patch: (optional) [str]; the before/after patch of each operation, encoded as soon
+            as it was taken (see encode; None for a commit of a whole configuration).
+        keys: (optional) iterable of str; the models, machines and configs the commit changed.
+
+        Buffers one record (a JSON line); call flush() to push it to disk.
+
+        -> {"time", "user", "action", "type", "keys"}; the record without its patch.
+        """
+        # open the changelog once per session
+        if self.File is None:
+            os.makedirs(self.directory, exist_ok = True)
+            self.File = open(self.path, 'a', encoding = 'utf-8', buffering = self.buffer_size)
+        # default to the current time
+        if when is None:
+            when = datetime.now()
+        # buffer the record (the encoded patches are written as they are)
+        record = {"time":str(when), "user":str(self.user), "action":str(action),
+            "type":"commit" if patch is None else "operations", "keys":sorted(set(keys or []))}
+        self.File.write(dumps(record, separators = (",", ":"))[:-1] + ',"patch":'
+            + ("null" if patch is None else "[" + ",".join(patch) + "]") + "}\n")
+        return record
+
+    @staticmethod
+    def encode(patch):
+        """Encodes the patch of one operation (taken before the next operation changes the
+        objects it holds)."""
+        return dumps(patch, separators = (",", ":"))
+
+    def flush(self):
+        """Pushes the buffered records to disk, then rotates the segment if it is full."""
+        if self.File is not None:
+            self.File.flush()
+            if self.File.tell() >= self.segment_bytes:
+                self.rotate()
+
+    def rotate(self):
+        """Compresses and indexes the segment being appended to, then starts a new one.
+
+        -> str | None; the name of the closed segment.
+        """
+        self.close()
+        # close the segment
+        name = self.index.addSegment(self.index.readCurrent())
+        # start a new one
+        File = open(self.path, 'w')
+        File.close()
+        return name
+
+    def close(self):
+        """Flushes and closes the changelog."""
+        if self.File is not None:
+            self.File.close()
+            self.File = None
@@ -0,0 +1,114 @@
+"""Cluster Occupancies track which rows of a config editor claim each sheet/cluster, so conflicts and free clusters are known after every edit."""
+
+# KIM Interface Cluster Occupancy Class
+class ClusterOccupancy:
+    # default constructor
+    def __init__(self):
+        # row -> (sheet, cluster) it claims (rows that are unselected or incomplete claim nothing)
+        self.rows = {}
+        # (sheet, cluster) -> set of rows claiming it
+        self.claims = {}
+        # sheet -> set of claimed clusters
+        self.sheets = {}
+        # sheet -> lowest cluster that may be free (nothing below it is)
+        self.free = {}
+        # the number of (sheet, cluster) targets claimed by more than one row
+        self.conflicts = 0
+
+    # default print
+    def __str__(self):
+        return f"Cluster Occupancy {len(self.rows)} maps / {self.conflicts} conflicts"
+
+    @staticmethod
+    def target(sheet, cluster, selected = True):
+        """Returns the (sheet, cluster) a row claims, or None if it is unselected or either
+        number is missing or not a whole number."""
+        # unselected rows claim nothing
+        if not selected:
+            return None
+        # both numbers must be entered
+        sheet = str(sheet).strip()
+        cluster = str(cluster).strip()
+        if not (sheet.isdigit() and cluster.isdigit()):
+            return None
+        return (int(sheet), int(cluster))
+
+    def release(self, row):
+        """Drops the claim of a row.
+
+        -> set; the rows whose conflict state may have changed.
+        """
+        target = self.rows.pop(row, None)
+        # nothing claimed
+        if target is None:
+            return set()
+        claimants = self.claims[target]
+        # the target was in conflict
+        if len(claimants) == 2:
+            self.conflicts -= 1
+        claimants.discard(row)
+        # the target is free again
+        if not claimants:
+            del self.claims[target]
+            self.sheets[target[0]].discard(target[1])
+            self.free[target[0]] = min(self.free.get(target[0], 1), target[1])
+        # the row and whoever still claims the target
+        return claimants | {row}
+
+    def claim(self, row, target):
+        """Claims a target for a row (the row must hold no claim).
+
+        -> set; the rows whose conflict state may have changed.
+        """
+        # nothing to claim
+        if target is None:
+            return set()
+        self.rows[row] = target
+        claimants = self.claims.setdefault(target, set())
+        claimants.add(row)
+        self.sheets.setdefault(target[0], set()).add(target[1])
+        # the target is now in conflict
+        if len(claimants) == 2:
+            self.conflicts += 1
+        # the row and the other claimants
+        return set(claimants)
+
+    def update(self, row, sheet, cluster, selected = True):
+        """update(row, sheet, cluster, selected = True)
+
+        row: hashable; the row of the editor.
+        sheet: str | int; the entered sheet #.
+        cluster: str | int; the entered cluster #.
+        selected: (optional) bool; whether the row is included in the config.
+
+        Moves the claim of one row (only the rows sharing its old or new target are touched).
+
+        -> set; the rows whose conflict state may have changed.
+        """
+        target = ClusterOccupancy.target(sheet, cluster, selected)
+        # unchanged claim
+        if (row in self.rows) and (self.rows[row] == target):
+            return set()
+        # move the claim
+        return self.release(row) | self.claim(row, target)
+
+    def conflicted(self, row):
+        """Returns True if another row claims the same sheet/cluster as this row."""
+        target = self.rows.get(row)
+        return (target is not None) and (len(self.claims[target]) > 1)
+
+    def nextFree(self, sheet):
+        """Returns the lowest cluster # no row claims on a sheet (None if the sheet # is not
+        a whole number)."""
+        sheet = str(sheet).strip()
+        if not sheet.isdigit():
+            return None
+        sheet = int(sheet)
+        # start at the lowest cluster that may be free
+        claimed = self.sheets.get(sheet, set())
+        cluster = self.free.get(sheet, 1)
+        while cluster in claimed:
+            cluster += 1
+        # nothing below it is free
+        self.free[sheet] = cluster
+        return cluster
@@ -0,0 +1,184 @@
+"""Commit Pipelines journal, stamp and write the KIM Interface configuration."""
+
+from time import perf_counter
+from datetime import datetime
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+
+# KIM Interface Commit Pipeline Class
+class CommitPipeline:
+    # default constructor
+    def __init__(self, store, cache, changelog, journal, user):
+        self.store = store
+        self.cache = cache
+        self.changelog = changelog
+        self.journal = journal
+        self.user = user
+        # keys of the objects changed since the last snapshot: each target, everything above it
+        # and everything below a replaced list of children (None until the first snapshot)
+        self.dirty = None
+        self.last_report = None
+        # the encoded patches of the last commit of operations (for the undo log) and the keys
+        # of the objects it changed (None for a whole configuration)
+        self.last_patches = []
+        self.last_keys = None
+        self.commits = 0
+        self.bytes_written = 0
+        self.seconds = 0.0
+
+    # default print
+    def __str__(self):
+        return f"Commit Pipeline {self.commits} commits / {self.bytes_written} bytes"
+
+    def stamp(self, document, when):
+        """Updates the timestamp of a config Dict in memory."""
+        document.update({"timestamp":str(str(when) + " | " + str(self.user))})
+
+    def writeSnapshot(self, document, dirty = None):
+        """Writes the config Dict to its store once and empties the journal.
+
+        dirty: (optional) set; keys of the objects changed since the last snapshot
+            (None rewrites every model).
+
+        -> int; the number of bytes written.
+        """
+        # write once
+        try:
+            size = self.store.write(document, dirty)
+        # the write failed; the cache may hold unsaved edits
+        except Exception:
+            # force a re-read (snapshot + journal) on the next access
+            self.cache.invalidate()
+            raise
+        # the snapshot now holds every journaled commit
+        self.journal.truncate()
+        # the cache now holds the written config (its keys are on disk)
+        self.cache.prime(document)
+        self.cache.keys_assigned = False
+        # nothing has changed since this snapshot
+        self.dirty = set()
+        # return the number of bytes written
+        return size
+
+    def report(self, action, size, start, compacted):
+        """Records and returns the report of one commit.
+
+        -> {"action", "bytes", "seconds", "compacted"}
+        """
+        # build the commit report
+        report = {"action":action, "bytes":size, "seconds":perf_counter() - start,
+            "compacted":compacted}
+        # update the session totals
+        self.last_report = report
+        self.commits += 1
+        self.bytes_written += report['bytes']
+        self.seconds += report['seconds']
+        # return the report
+        return report
+
+    def commit(self, document, action):
+        """Stamps a whole config Dict in memory, writes it once and logs the action.
+
+        -> {"action", "bytes", "seconds", "compacted"}
+        """
+        # start the commit clock
+        start = perf_counter()
+        # stamp the config in memory
+        when = datetime.now()
+        self.stamp(document, when)
+        # write the snapshot
+        size = self.writeSnapshot(document)
+        # log the commit with the same time as the stamp (a whole configuration has no patch)
+        self.changelog.writeEntry(action, when)
+        self.changelog.flush()
+        self.last_keys = None
+        # report the commit
+        return self.report(action, size, start, True)
+
+    def commitOperations(self, operations, action, expected = None):
+        """commitOperations(operations, action, expected = None)
+
+        expected: (optional) [dict]; for each operation, the decoded patch whose result
+            the operation's target must still hold (an undo is checked against the commit
+            it reverses; see ConfigOperation.matches).
+
+        Applies keyed operations to the cached config, appends one journal record and
+        only rewrites the snapshot once the journal passes its compaction threshold. A
+        KeyError is raised and nothing is written if a target is gone, or if an expected
+        patch no longer matches or its names are taken by another object.
+
+        -> {"action", "bytes", "seconds", "compacted"}
+        """
+        # start the commit clock
+        start = perf_counter()
+        # get the current config, its key -> position map and its unique names and IDs
+        document = self.cache.getDocument()
+        positions = self.cache.getPositions()
+        validation = self.cache.getValidationIndex()
+        # the before/after patch of each operation and the objects they change (for the changelog)
+        patches = []
+        keys = set()
+        # apply each operation in memory
+        for i, operation in enumerate(operations):
+            # the target changed since the expected patch (or its names were taken since)
+            if (expected is not None) and ((not ConfigOperation.matches(document, expected[i], positions))
+                    or validation.conflicts(document, operation, positions)):
+                # drop the partially applied commit
+                self.cache.invalidate()
+                raise KeyError("The object being changed has changed since: " + str(operation['key']))
+            # note what the operation changes (read before it changes the document)
+            patch, patch_keys = ConfigOperation.patch(document, operation, positions)
+            patches.append(self.changelog.encode(patch))
+            keys.update(patch_keys)
+            # note the objects the next snapshot rewrites
+            if self.dirty is not None:
+                self.dirty.update(patch_keys)
+                # a replaced list of children rewrites everything in it
+                if (patch is not None) and (patch['op'] == ConfigOperation.REPLACE):
+                    self.dirty.update(ConfigOperation.descendantKeys(patch['after']))
+            # keep the names and IDs current (read before the operation changes the document)
+            validation.update(document, operation, positions)
+            # the target is gone (config changed on disk since it was shown)
+            if not ConfigOperation.apply(document, operation, positions):
+                # drop the partially applied commit
+                self.cache.invalidate()
+                raise KeyError("The object being changed is no longer in the KIM Interface "
+                    + "configuration: " + str(operation['key']))
+        # stamp the config in memory
+        when = datetime.now()
+        self.stamp(document, when)
+        # append the commit to the journal (small; proportional to the change), unless every
+        # commit goes straight to the snapshot
+        size = 0
+        if not self.journal.writeThrough():
+            size = self.journal.append({"timestamp":document['timestamp'], "user":str(self.user),
+                "action":action, "operations":operations})
+        # fold the journal into a new snapshot once it is large enough (or new keys need saving)
+        compacted = self.journal.writeThrough() or self.journal.needsCompaction() or self.cache.keys_assigned
+        if compacted:
+            # newly assigned keys touch every model
+            size += self.writeSnapshot(document, None if self.cache.keys_assigned else self.dirty)
+        # otherwise the commit lives in the journal and the cache
+        else:
+            self.cache.prime(document, positions, validation)
+        # log the commit with the same time as the stamp
+        self.changelog.writeEntry(action, when, patches, keys)
+        self.changelog.flush()
+        self.last_patches = patches
+        self.last_keys = keys
+        # report the commit
+        return self.report(action, size, start, compacted)
+
+    def compact(self):
+        """Folds the journal (and any newly assigned keys) into a new snapshot.
+
+        -> int; the number of bytes written (0 if there was nothing to fold).
+        """
+        # get the current config (snapshot + journal)
+        document = self.cache.getDocument()
+        # nothing to fold
+        if (self.journal.size() == 0) and (not self.cache.keys_assigned):
+            # the store already matches the config
+            self.dirty = set()
+            return 0
+        # write the snapshot
+        return self.writeSnapshot(document)
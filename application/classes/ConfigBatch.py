@@ -0,0 +1,354 @@
+"""Config Batches validate bulk operations against a working copy of the configuration and collect them as keyed operations that commit at once."""
+
+from json import loads, dumps
+from classes.Model import Model as Model
+from classes.Machine import Machine as Machine
+from classes.MappingConfiguration import MappingConfiguration as MappingConfiguration
+from classes.ConfigIndex import ConfigIndex as ConfigIndex
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+from classes.ConfigValidator import ConfigValidator as ConfigValidator
+from classes.ValidationIndex import ValidationIndex as ValidationIndex
+
+# KIM Interface Config Batch Class
+class ConfigBatch:
+    # batch row operations and the method that applies each
+    OPERATIONS = {"add-model":"addModel", "edit-model":"editModel", "remove-model":"removeModel",
+        "add-machine":"addMachine", "edit-machine":"editMachine", "remove-machine":"removeMachine",
+        "add-config":"addConfig", "edit-config":"editConfig", "remove-config":"removeConfig",
+        "duplicate-config":"duplicateConfig"}
+
+    # default constructor
+    def __init__(self, document):
+        # a working copy (the cached config is only changed by the commit)
+        self.working = loads(dumps(document))
+        self.positions = ConfigIndex.mapPositions(self.working)
+        # model names, machine names and config IDs (kept current as each operation is recorded,
+        # so every uniqueness check of the batch is a hash lookup)
+        self.index = ValidationIndex(self.working)
+        # the keyed operations of the batch and the errors of its rows
+        self.operations = []
+        self.errors = []
+        self.rows = 0
+
+    # default print
+    def __str__(self):
+        return f"Config Batch {len(self.operations)} operations / {len(self.errors)} errors"
+
+    ### Working copy
+    def locate(self, key):
+        """Returns the Dict with a key in the working copy (None if it is not there)."""
+        # find the position of the key
+        position = self.positions.get(key)
+        if position is None:
+            return None
+        # walk the model -> machine -> config lists
+        found = self.working['models'][position[0]]
+        if len(position) > 1:
+            found = found['machines'][position[1]]
+        if len(position) > 2:
+            found = found['mapping_configurations'][position[2]]
+        # return the Dict
+        return found
+
+    def model(self, name):
+        """Returns the model Dict with a name in the working copy, or None."""
+        return self.locate(self.index.models.get(name))
+
+    def machine(self, name):
+        """Returns the machine Dict with a name in the working copy, or None."""
+        return self.locate(self.index.machines.get(name))
+
+    def config(self, machine, id_num):
+        """Returns the config Dict with an ID in a machine Dict, or None."""
+        return self.locate(self.index.configIds(machine['key']).get(str(id_num)))
+
+    def modelObject(self, model):
+        """Wraps a model Dict for the validators (its machines stay Dicts)."""
+        return Model(model['name'], model['base_information'], model['machines'], key = model['key'])
+
+    def machineObject(self, machine, model = None):
+        """Wraps a machine Dict for the validators (its configs stay Dicts)."""
+        return Machine(machine['name'], machine['measurements'], machine['mapping_configurations'],
+            model, key = machine['key'])
+
+    def fail(self, message):
+        """Records the error of the current row.
+
+        -> False
+        """
+        self.errors.append({"row":self.rows, "error":message})
+        return False
+
+    def record(self, operation):
+        """Applies an operation to the working copy and adds it to the batch.
+
+        -> bool
+        """
+        # the names of the operation (read before the working copy changes)
+        self.index.update(self.working, operation, self.positions)
+        # the working copy gets its own Dicts (later rows may change them)
+        if not ConfigOperation.apply(self.working, loads(dumps(operation)), self.positions):
+            return self.fail("The object being changed is no longer in the configuration.")
+        # the operation is part of the batch
+        self.operations.append(operation)
+        return True
+
+    def mappings(self, model, machine, mappings):
+        """Validates the named (item, sheet, cluster) maps of a config against the base
+        information of its model and the measurements of its machine.
+
+        -> [Boolean:result, [mapping]|Error]
+        """
+        # the sheet/cluster of each named item (an item maps to one place)
+        named = {}
+        for item, sheet, cluster in mappings:
+            if item in named:
+                return [False, {"error":"Item '" + str(item) + "' is mapped more than once in a config of "
+                    + machine['name'] + "."}]
+            named[item] = (sheet, cluster)
+        # every item must be a base information field or a measurement
+        unknown = set(named) - set(model['base_information']) - set(machine['measurements'])
+        if unknown:
+            return [False, {"error":"Not a base information field or measurement of "
+                + machine['name'] + ": " + ", ".join(sorted(unknown))}]
+        # validate the maps in GUI order (base information, then measurements)
+        maps = []
+        for items, section in [(model['base_information'], "Model Base Information fields"),
+            (machine['measurements'], "Machine Measurements fields")]:
+            result = ConfigValidator.validateMaps(items, [item in named for item in items],
+                [named.get(item, ("", "")) for item in items], section)
+            if not result[0]:
+                return result
+            maps += result[1]
+        # no two maps may share a sheet/cluster
+        error = ConfigValidator.validateTargets(maps)
+        if error is not None:
+            return [False, error]
+        # return the maps
+        return [True, maps]
+
+    ### Operations
+    def addModel(self, name, values = None):
+        """Adds a model with base information headers."""
+        # validate the model
+        result = ConfigValidator.validateAddModel(self.index.models, name, values or [])
+        if not result[0]:
+            return self.fail(result[1]['error'])
+        # add it
+        return self.record(ConfigOperation.add(None, Model.modelToDict(result[1])))
+
+    def editModel(self, model, new = None, values = None):
+        """Renames a model (and the name prefix of its machines) and/or replaces its base
+        information headers."""
+        # find the model
+        found = self.model(model)
+        if found is None:
+            return self.fail("No model named " + str(model) + ".")
+        new_name = new or found['name']
+        values = found['base_information'] if values is None else values
+        # validate the edits
+        result = ConfigValidator.validateEditModel(self.index.models, self.modelObject(found),
+            new_name, found['name'], [True] * len(values), values)
+        if not result[0]:
+            return self.fail(result[1]['error'])
+        # copy the model; a renamed model renames its machines
+        data = loads(dumps(found))
+        data.update({"name":new_name, "base_information":result[1].base_information})
+        if new_name != found['name']:
+            for machine in data['machines']:
+                machine['name'] = new_name + machine['name'][3:]
+        # replace it
+        return self.record(ConfigOperation.replace(data))
+
+    def removeModel(self, model):
+        """Removes a model with its machines and configs."""
+        # find the model
+        found = self.model(model)
+        if found is None:
+            return self.fail("No model named " + str(model) + ".")
+        # remove it
+        return self.record(ConfigOperation.remove(found['key']))
+
+    def addMachine(self, model, name, values = None):
+        """Adds a machine with measurement specs to a model."""
+        # find the model
+        found = self.model(model)
+        if found is None:
+            return self.fail("No model named " + str(model) + ".")
+        # validate the machine (machine names are unique everywhere)
+        result = ConfigValidator.validateAddMachine(self.modelObject(found), name, values or [],
+            self.index.machines)
+        if not result[0]:
+            return self.fail(result[1]['error'])
+        # add it
+        return self.record(ConfigOperation.add(found['key'], Machine.machineToDict(result[1])))
+
+    def editMachine(self, machine, new = None, values = None):
+        """Renames a machine and/or replaces its measurement specs (maps of removed
+        measurements are dropped from its configs)."""
+        # find the machine
+        found = self.machine(machine)
+        if found is None:
+            return self.fail("No machine named " + str(machine) + ".")
+        model = self.working['models'][self.positions[found['key']][0]]
+        new_name = new or found['name']
+        values = found['measurements'] if values is None else values
+        # validate the edits (machine names are unique everywhere)
+        result = ConfigValidator.validateEditMachine(self.modelObject(model),
+            self.machineObject(found), new_name, found['name'], [True] * len(values), values,
+            self.index.machines)
+        if not result[0]:
+            return self.fail(result[1]['error'])
+        # copy the machine without the maps of removed measurements
+        data = loads(dumps(found))
+        removed = set(found['measurements']) - set(result[1].measurements)
+        data.update({"name":new_name, "measurements":result[1].measurements})
+        for config in data['mapping_configurations']:
+            config['mappings'] = [mapping for mapping in config['mappings']
+                if mapping['item'] not in removed]
+        # replace it
+        return self.record(ConfigOperation.replace(data))
+
+    def removeMachine(self, machine):
+        """Removes a machine with its configs."""
+        # find the machine
+        found = self.machine(machine)
+        if found is None:
+            return self.fail("No machine named " + str(machine) + ".")
+        # remove it
+        return self.record(ConfigOperation.remove(found['key']))
+
+    def addConfig(self, machine, id_num, mappings = None):
+        """Adds a config with (item, sheet, cluster) maps to a machine."""
+        # find the machine and its model
+        found = self.machine(machine)
+        if found is None:
+            return self.fail("No machine named " + str(machine) + ".")
+        model = self.working['models'][self.positions[found['key']][0]]
+        # validate the ID and maps
+        error = ConfigValidator.validateConfigId(self.machineObject(found), id_num,
+            taken = self.index.configIds(found['key']))
+        if error is not None:
+            return self.fail(error['error'])
+        maps = self.mappings(model, found, mappings or [])
+        if not maps[0]:
+            return self.fail(maps[1]['error'])
+        # add it
+        config = MappingConfiguration(id_num, maps[1], None)
+        return self.record(ConfigOperation.add(found['key'], MappingConfiguration.configToDict(config)))
+
+    def editConfig(self, machine, id_num, new = None, mappings = None):
+        """Changes the ID and/or replaces the (item, sheet, cluster) maps of a config."""
+        # find the machine, its model and the config
+        found = self.machine(machine)
+        if found is None:
+            return self.fail("No machine named " + str(machine) + ".")
+        model = self.working['models'][self.positions[found['key']][0]]
+        config = self.config(found, id_num)
+        if config is None:
+            return self.fail("No config " + str(id_num) + " in " + found['name'] + ".")
+        new_id = new or config['id']
+        # validate the ID (it may stay the same) and the maps
+        error = ConfigValidator.validateConfigId(self.machineObject(found), new_id, config['id'],
+            self.index.configIds(found['key']))
+        if error is not None:
+            return self.fail(error['error'])
+        if mappings is None:
+            maps = [True, loads(dumps(config['mappings']))]
+        else:
+            maps = self.mappings(model, found, mappings)
+        if not maps[0]:
+            return self.fail(maps[1]['error'])
+        # replace it (same identity)
+        return self.record(ConfigOperation.replace({"key":config['key'], "id":str(new_id),
+            "mappings":maps[1]}))
+
+    def removeConfig(self, machine, id_num):
+        """Removes a config from a machine."""
+        # find the machine and the config
+        found = self.machine(machine)
+        if found is None:
+            return self.fail("No machine named " + str(machine) + ".")
+        config = self.config(found, id_num)
+        if config is None:
+            return self.fail("No config " + str(id_num) + " in " + found['name'] + ".")
+        # remove it
+        return self.record(ConfigOperation.remove(config['key']))
+
+    def duplicateConfig(self, machine, id_num, new):
+        """Copies a config of a machine under a new ID (and a new key)."""
+        # find the machine and the config
+        found = self.machine(machine)
+        if found is None:
+            return self.fail("No machine named " + str(machine) + ".")
+        config = self.config(found, id_num)
+        if config is None:
+            return self.fail("No config " + str(id_num) + " in " + found['name'] + ".")
+        # validate the new ID
+        error = ConfigValidator.validateConfigId(self.machineObject(found), new,
+            taken = self.index.configIds(found['key']))
+        if error is not None:
+            return self.fail(error['error'])
+        # add the copy
+        duplicate = MappingConfiguration(new, loads(dumps(config['mappings'])), None)
+        return self.record(ConfigOperation.add(found['key'],
+            MappingConfiguration.configToDict(duplicate)))
+
+    ### Rows
+    def validate(self, rows):
+        """validate(rows)
+
+        rows: iterable of batch rows (see apply).
+
+        Validates every row in order (later rows see the operations of earlier ones) and
+        keeps going past rejected rows, so every error of the batch is found in one pass.
+
+        -> [{"row", "error"}]; the errors of the batch (empty if every row was accepted).
+        """
+        for row in rows:
+            self.apply(row)
+        return self.errors
+
+    def apply(self, row):
+        """apply(row)
+
+        row: dict; one batch row: {"op", "model", "machine", "id", "new", "values", "mappings"}
+            (only the fields the operation uses), or {"error"} if it could not be read.
+            values is a list of base information headers or measurement specs;
+            mappings a list of (item, sheet, cluster).
+
+        Validates one row against the working copy and adds its operation to the batch.
+
+        -> bool; False if the row was rejected (see errors).
+        """
+        # count the row
+        self.rows += 1
+        # the row could not be read
+        if row.get('error'):
+            return self.fail(row['error'])
+        # find the operation
+        method = ConfigBatch.OPERATIONS.get(str(row.get('op', "")).strip().lower())
+        if method is None:
+            return self.fail("Unknown operation '" + str(row.get('op')) + "' (expected one of "
+                + ", ".join(ConfigBatch.OPERATIONS) + ").")
+        # pass the fields the operation takes
+        try:
+            if method in ["addModel", "editModel", "removeModel"]:
+                arguments = [row.get('model') or row.get('name')]
+            elif method == "addMachine":
+                arguments = [row.get('model'), row.get('machine') or row.get('name')]
+            elif method in ["editMachine", "removeMachine"]:
+                arguments = [row.get('machine') or row.get('name')]
+            else:
+                arguments = [row.get('machine'), row.get('id')]
+            keywords = {}
+            if method in ["editModel", "editMachine", "editConfig", "duplicateConfig"]:
+                keywords['new'] = row.get('new')
+            if method in ["addModel", "editModel", "addMachine", "editMachine"]:
+                keywords['values'] = row.get('values')
+            if method in ["addConfig", "editConfig"]:
+                keywords['mappings'] = row.get('mappings')
+            return getattr(self, method)(*arguments, **keywords)
+        # a field of the wrong type
+        except (TypeError, ValueError) as error:
+            return self.fail("Invalid row: " + str(error))
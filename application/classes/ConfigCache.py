@@ -0,0 +1,137 @@
+"""Config Caches hold the parsed KIM Interface configuration in memory between navigation steps."""
+
+from classes.ConfigIndex import ConfigIndex as ConfigIndex
+from classes.ValidationIndex import ValidationIndex as ValidationIndex
+
+# KIM Interface Config Cache Class
+class ConfigCache:
+    # default constructor
+    def __init__(self, store, journal = None):
+        self.store = store
+        self.journal = journal
+        self.signature = None
+        self.document = None
+        self.graphs = {}
+        self.index = None
+        self.positions = None
+        self.validation = None
+        self.keys_assigned = False
+        self.hits = 0
+        self.misses = 0
+
+    # default print
+    def __str__(self):
+        return f"Config Cache {self.hits} hits / {self.misses} misses"
+
+    def currentSignature(self):
+        """Returns the signature of the store and the journal on disk (commits journaled by
+        another Manager change it too)."""
+        return (self.store.signature(), None if self.journal is None else self.journal.signature())
+
+    def getDocument(self):
+        """Returns the parsed configuration Dict, re-reading the store only if it or the
+        journal changed on disk."""
+        # get the current signature of the store and the journal
+        signature = self.currentSignature()
+        # is the cached document still current?
+        if (self.document is not None) and (signature == self.signature):
+            # count the hit
+            self.hits += 1
+            # return the cached document
+            return self.document
+        # count the miss
+        self.misses += 1
+        # read the KIM Interface config from its store
+        self.document = self.store.read()
+        # give any new (hand-edited or pre-key) objects a persistent key
+        self.keys_assigned = ConfigIndex.assignKeys(self.document) > 0
+        # fold in the commits that are only in the journal so far
+        if self.journal is not None:
+            self.journal.replay(self.document)
+        # save the signature the document was read at
+        self.signature = signature
+        # the hydrated objects, indexes and positions belong to the old document
+        self.graphs = {}
+        self.index = None
+        self.positions = None
+        self.validation = None
+        # return the new document
+        return self.document
+
+    def getModels(self, get_machines, get_configs, hydrate):
+        """Returns the hydrated model list for the current document, building it once per load.
+
+        hydrate: function(document, get_machines, get_configs); builds the model list.
+        """
+        # revalidate the document (drops stale graphs if the file changed)
+        document = self.getDocument()
+        # each flag combination is hydrated separately
+        flags = (get_machines, get_configs)
+        # build the graph if it has not been built for this document yet
+        if flags not in self.graphs:
+            self.graphs[flags] = hydrate(document, get_machines, get_configs)
+        # return the cached graph
+        return self.graphs[flags]
+
+    def getIndex(self, hydrate):
+        """Returns the lookup index of the fully hydrated models, building it once per load.
+
+        hydrate: function(document, get_machines, get_configs); builds the model list.
+        """
+        # get the fully hydrated models (drops a stale index if the file changed)
+        models = self.getModels(True, True, hydrate)
+        # build the index if it has not been built for this document yet
+        if self.index is None:
+            self.index = ConfigIndex(models)
+        # return the cached index
+        return self.index
+
+    def getPositions(self):
+        """Returns the key -> position map of the current document, building it once per load."""
+        # revalidate the document (drops stale positions if the file changed)
+        document = self.getDocument()
+        # build the map if it has not been built for this document yet
+        if self.positions is None:
+            self.positions = ConfigIndex.mapPositions(document)
+        # return the cached map
+        return self.positions
+
+    def getValidationIndex(self):
+        """Returns the unique names and IDs of the current document, building them once per load."""
+        # revalidate the document (drops a stale index if the file changed)
+        document = self.getDocument()
+        # build the index if it has not been built for this document yet
+        if self.validation is None:
+            self.validation = ValidationIndex(document)
+        # return the cached index
+        return self.validation
+
+    def prime(self, document, positions = None, validation = None):
+        """Replaces the cached document with one that was just committed.
+
+        positions: (optional) dict; the key -> position map, if it was kept current.
+        validation: (optional) ValidationIndex; the unique names and IDs, if they were kept current.
+        """
+        # store the committed document
+        self.document = document
+        # take the signature of the store and the journal (with this commit in it)
+        self.signature = self.currentSignature()
+        # the hydrated objects and index belong to the old document
+        self.graphs = {}
+        self.index = None
+        self.positions = positions
+        self.validation = validation
+
+    def invalidate(self):
+        """Drops the cached document so the next access re-reads the store."""
+        self.store.invalidate()
+        self.document = None
+        self.signature = None
+        self.graphs = {}
+        self.index = None
+        self.positions = None
+        self.validation = None
+
+    def stats(self):
+        """Returns the hit/miss counters of the cache."""
+        return {"hits":self.hits, "misses":self.misses}
@@ -0,0 +1,238 @@
+"""Config Diffs compare two KIM Interface configurations by model, machine and config identity, and turn the differences into keyed operations."""
+
+from collections import Counter
+from classes.ConfigIndex import ConfigIndex as ConfigIndex
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+
+# KIM Interface Config Diff Class
+class ConfigDiff:
+    # change names
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+    @staticmethod
+    def change(change, kind, model, machine = None, config = None, details = None, operation = None):
+        """Creates one change of a model, machine or config.
+
+        kind: str; "model", "machine" or "config".
+        details: (optional) [detail]; what changed (see detail).
+        operation: (optional) ConfigOperation; turns the old object into the new one.
+
+        -> {"change", "kind", "model", "machine", "config", "details", "operation"}
+        """
+        return {"change":change, "kind":kind, "model":model, "machine":machine, "config":config,
+            "details":details or [], "operation":operation}
+
+    @staticmethod
+    def detail(change, field, item = None, old = None, new = None):
+        """Creates one detail of a change.
+
+        field: str; "name", "id", "base_information", "measurement" or "mapping".
+
+        -> {"change", "field", "item", "old", "new"}
+        """
+        return {"change":change, "field":field, "item":item, "old":old, "new":new}
+
+    @staticmethod
+    def match(old, new, label):
+        """match(old, new, label)
+
+        old: [dict]; the old models, machines or configs.
+        new: [dict]; the new ones.
+        label: str; the field that names them ("name" or "id").
+
+        Pairs old and new objects by key, then the rest by name (or ID), so snapshots
+        taken before objects had keys still line up.
+
+        -> ([(old, new)], [old removed], [new added])
+        """
+        # pair by key first
+        keys = dict((data['key'], data) for data in old if data.get('key'))
+        pairs = []
+        added = []
+        paired = set()
+        for data in new:
+            match = keys.get(data.get('key')) if data.get('key') else None
+            if (match is not None) and (id(match) not in paired):
+                pairs.append((match, data))
+                paired.add(id(match))
+            else:
+                added.append(data)
+        # pair the rest by name (or ID)
+        names = dict((str(data[label]), data) for data in old if id(data) not in paired)
+        unmatched = []
+        for data in added:
+            match = names.pop(str(data[label]), None)
+            if match is not None:
+                pairs.append((match, data))
+                paired.add(id(match))
+            else:
+                unmatched.append(data)
+        # return the pairs, the removed and the added objects
+        return (pairs, [data for data in old if id(data) not in paired], unmatched)
+
+    @staticmethod
+    def listDetails(field, old, new):
+        """Returns the added and removed entries of a list (base information or measurements)."""
+        old_set = set(old)
+        new_set = set(new)
+        return ([ConfigDiff.detail(ConfigDiff.REMOVED, field, item) for item in old if item not in new_set]
+            + [ConfigDiff.detail(ConfigDiff.ADDED, field, item) for item in new if item not in old_set])
+
+    @staticmethod
+    def withKeys(data):
+        """Gives an added object (and everything below it) keys, if it was backed up without them."""
+        if 'base_information' in data:
+            ConfigIndex.assignKeys({"models":[data]})
+        elif 'measurements' in data:
+            ConfigIndex.assignKeys({"models":[{"key":"-", "machines":[data]}]})
+        elif not data.get('key'):
+            ConfigIndex.assignKeys({"models":[{"key":"-", "machines":[{"key":"-",
+                "mapping_configurations":[data]}]}]})
+        return data
+
+    @staticmethod
+    def compareConfigs(model, machine, old, new, changes):
+        """Adds the changes between the configs of two versions of a machine."""
+        pairs, removed, added = ConfigDiff.match(old['mapping_configurations'],
+            new['mapping_configurations'], 'id')
+        for old_config, new_config in pairs:
+            # equal configs are skipped
+            if old_config == new_config:
+                continue
+            details = []
+            if str(old_config['id']) != str(new_config['id']):
+                details.append(ConfigDiff.detail(ConfigDiff.CHANGED, "id", None, old_config['id'],
+                    new_config['id']))
+            # maps are identified by their item
+            old_maps = dict((mapping['item'], mapping) for mapping in old_config['mappings'])
+            new_maps = dict((mapping['item'], mapping) for mapping in new_config['mappings'])
+            for item, mapping in old_maps.items():
+                if item not in new_maps:
+                    details.append(ConfigDiff.detail(ConfigDiff.REMOVED, "mapping", item, mapping))
+                elif new_maps[item] != mapping:
+                    details.append(ConfigDiff.detail(ConfigDiff.CHANGED, "mapping", item, mapping,
+                        new_maps[item]))
+            for item, mapping in new_maps.items():
+                if item not in old_maps:
+                    details.append(ConfigDiff.detail(ConfigDiff.ADDED, "mapping", item, None, mapping))
+            # the new config under the old key
+            changes.append(ConfigDiff.change(ConfigDiff.CHANGED, "config", model, machine,
+                new_config['id'], details, ConfigOperation.replace(dict(new_config, key = old_config['key']))))
+        for config in removed:
+            changes.append(ConfigDiff.change(ConfigDiff.REMOVED, "config", model, machine, config['id'],
+                operation = ConfigOperation.remove(config['key'])))
+        for config in added:
+            changes.append(ConfigDiff.change(ConfigDiff.ADDED, "config", model, machine, config['id'],
+                operation = ConfigOperation.add(old['key'], ConfigDiff.withKeys(config))))
+
+    @staticmethod
+    def compareMachines(model, old, new, changes):
+        """Adds the changes between the machines of two versions of a model."""
+        pairs, removed, added = ConfigDiff.match(old['machines'], new['machines'], 'name')
+        for old_machine, new_machine in pairs:
+            # equal machines are skipped
+            if old_machine == new_machine:
+                continue
+            # the name and measurements (the configs are compared on their own)
+            details = ConfigDiff.listDetails("measurement", old_machine['measurements'],
+                new_machine['measurements'])
+            if old_machine['name'] != new_machine['name']:
+                details.insert(0, ConfigDiff.detail(ConfigDiff.CHANGED, "name", None, old_machine['name'],
+                    new_machine['name']))
+            if details:
+                # the new fields under the old key, with the old configs
+                changes.append(ConfigDiff.change(ConfigDiff.CHANGED, "machine", model, new_machine['name'],
+                    details = details, operation = ConfigOperation.replace(dict(new_machine,
+                    key = old_machine['key'], mapping_configurations = old_machine['mapping_configurations']))))
+            ConfigDiff.compareConfigs(model, new_machine['name'], old_machine, new_machine, changes)
+        for machine in removed:
+            changes.append(ConfigDiff.change(ConfigDiff.REMOVED, "machine", model, machine['name'],
+                operation = ConfigOperation.remove(machine['key'])))
+        for machine in added:
+            changes.append(ConfigDiff.change(ConfigDiff.ADDED, "machine", model, machine['name'],
+                operation = ConfigOperation.add(old['key'], ConfigDiff.withKeys(machine))))
+
+    @staticmethod
+    def compare(old, new, load = None):
+        """compare(old, new, load = None)
+
+        old: [(str, dict | None)]; the hash and model Dict of every model of the old
+            configuration (None if it is not loaded).
+        new: [(str, dict | None)]; the same for the new configuration.
+        load: (optional) function(hash) -> dict; loads a model that is not loaded.
+
+        Compares two configurations by model, machine and config identity. Models with
+        the same hash on both sides are skipped without being loaded; machines and
+        configs that are equal are skipped without being compared further. Each change
+        holds the operation that turns the old object into the new one (applied to the
+        old configuration, the operations of every change give the new one).
+
+        -> [change]
+        """
+        # models with the same hash are equal (each hash pairs once)
+        old_left = Counter(name for name, model in old)
+        new_left = Counter(name for name, model in new)
+        for name in list(old_left):
+            equal = min(old_left[name], new_left.get(name, 0))
+            old_left[name] -= equal
+            new_left[name] -= equal
+        # load the rest
+        old_models = []
+        for name, model in old:
+            if old_left[name] > 0:
+                old_left[name] -= 1
+                old_models.append(model if model is not None else load(name))
+        new_models = []
+        for name, model in new:
+            if new_left[name] > 0:
+                new_left[name] -= 1
+                new_models.append(model if model is not None else load(name))
+        # compare them
+        changes = []
+        pairs, removed, added = ConfigDiff.match(old_models, new_models, 'name')
+        for old_model, new_model in pairs:
+            # the name and base information (the machines are compared on their own)
+            details = ConfigDiff.listDetails("base_information", old_model['base_information'],
+                new_model['base_information'])
+            if old_model['name'] != new_model['name']:
+                details.insert(0, ConfigDiff.detail(ConfigDiff.CHANGED, "name", None, old_model['name'],
+                    new_model['name']))
+            if details:
+                # the new fields under the old key, with the old machines
+                changes.append(ConfigDiff.change(ConfigDiff.CHANGED, "model", new_model['name'],
+                    details = details, operation = ConfigOperation.replace(dict(new_model,
+                    key = old_model['key'], machines = old_model['machines']))))
+            ConfigDiff.compareMachines(new_model['name'], old_model, new_model, changes)
+        for model in removed:
+            changes.append(ConfigDiff.change(ConfigDiff.REMOVED, "model", model['name'],
+                operation = ConfigOperation.remove(model['key'])))
+        for model in added:
+            changes.append(ConfigDiff.change(ConfigDiff.ADDED, "model", model['name'],
+                operation = ConfigOperation.add(None, ConfigDiff.withKeys(model))))
+        # return the changes
+        return changes
+
+    @staticmethod
+    def describe(change):
+        """Returns the lines that describe a change (the change, then one line per detail)."""
+        # the object that changed
+        target = {"model":"Model " + str(change['model']),
+            "machine":"Machine " + str(change['machine']) + " of " + str(change['model']),
+            "config":"Config " + str(change['config']) + " of " + str(change['machine'])}[change['kind']]
+        lines = [target + " " + change['change']]
+        # what changed about it
+        for detail in change['details']:
+            if detail['field'] in ("name", "id"):
+                lines.append("    " + detail['field'] + ": " + str(detail['old']) + " -> " + str(detail['new']))
+            elif detail['field'] == "mapping":
+                place = lambda mapping: ("sheet " + str(mapping['sheet']) + " cluster " + str(mapping['cluster'])
+                    ) if mapping is not None else ""
+                lines.append("    mapping " + str(detail['item']) + " " + detail['change'] + ": "
+                    + place(detail['old']) + (" -> " if detail['change'] == ConfigDiff.CHANGED else "")
+                    + place(detail['new']))
+            else:
+                lines.append("    " + detail['field'].replace("_", " ") + " " + detail['change'] + ": "
+                    + str(detail['item']))
+        return lines
@@ -0,0 +1,110 @@
+"""Config File Stores keep the KIM Interface configuration in a single JSON file."""
+
+import os as os
+from json import loads, dumps
+
+# KIM Interface Config File Store Class
+class ConfigFileStore:
+    # default constructor
+    def __init__(self, path):
+        self.path = path
+        # model key -> (model Dict, its text) of the last write (unchanged models are not
+        # serialized again)
+        self.texts = {}
+
+    # default print
+    def __str__(self):
+        return f"Config File Store {self.path}"
+
+    def exists(self):
+        """Returns True if the config file exists."""
+        return os.path.isfile(self.path)
+
+    def signature(self):
+        """Returns the (mtime, size, inode) signature of the config file on disk."""
+        # stat the configuration file
+        stat = os.stat(self.path)
+        # the signature changes whenever the file is rewritten or replaced
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def read(self):
+        """Reads and parses the whole config file.
+
+        -> {"timestamp", "models"}
+        """
+        # open the KIM Interface config file
+        File = open(self.path, 'r')
+        # read and parse the file
+        document = loads(File.read())
+        # close
+        File.close()
+        # return the config Dict
+        return document
+
+    def serialize(self, document, dirty = None):
+        """Serializes the config Dict the way dumps(document, indent = 4) does, reusing the
+        text of every model that is not dirty and is the same Dict as at the last write.
+
+        dirty: (optional) set; keys of the objects changed since the last write (with the
+            key of every changed model; None serializes every model).
+
+        -> str
+        """
+        parts = []
+        texts = {}
+        for field, value in document.items():
+            # each model is serialized on its own, then indented into the models list
+            if (field == "models") and value:
+                models = []
+                for model in value:
+                    key = model.get('key')
+                    cached = self.texts.get(key)
+                    if (dirty is not None) and (key not in dirty) and (cached is not None) and (cached[0] is model):
+                        text = cached[1]
+                    else:
+                        text = dumps(model, indent = 4).replace("\n", "\n        ")
+                    if key is not None:
+                        texts[key] = (model, text)
+                    models.append(text)
+                text = "[\n        " + ",\n        ".join(models) + "\n    ]"
+            else:
+                text = dumps(value, indent = 4).replace("\n", "\n    ")
+            parts.append(dumps(field) + ": " + text)
+        # keep only the models of this write
+        self.texts = texts
+        return ("{\n    " + ",\n    ".join(parts) + "\n}") if parts else "{}"
+
+    def write(self, document, dirty = None):
+        """Serializes the config Dict once and writes it once (to a temporary file that
+        replaces the config file, so readers never see half a file).
+
+        dirty: (optional) set; keys of the objects changed since the last write (only the
+            changed models are serialized again; None serializes every model).
+
+        -> int; the number of bytes written.
+        """
+        # serialize once (unchanged models reuse their text)
+        try:
+            text = self.serialize(document, dirty)
+        # a failed write keeps no text
+        except Exception:
+            self.invalidate()
+            raise
+        # write once, to a temporary file
+        File = open(self.path + ".tmp", 'w')
+        File.write(text)
+        # save the number of bytes written
+        size = File.tell()
+        File.close()
+        # replace the old file in one step (a crash mid-write leaves the old snapshot whole)
+        os.replace(self.path + ".tmp", self.path)
+        # return the number of bytes written
+        return size
+
+    def invalidate(self):
+        """Drops the text of the last write (the next write serializes every model)."""
+        self.texts = {}
+
+    def close(self):
+        """Releases the store (nothing is kept open for a single file)."""
+        pass
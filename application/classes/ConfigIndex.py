@@ -0,0 +1,106 @@
+"""Config Indexes map names, IDs and keys to the objects of one KIM Interface configuration load."""
+
+from uuid import uuid4
+
+# KIM Interface Config Index Class
+class ConfigIndex:
+    # default constructor
+    def __init__(self, models):
+        # model name -> model
+        self.models = {}
+        # machine name -> (model, machine)
+        self.machines = {}
+        # (machine name, config id) -> config
+        self.configs = {}
+        # config id -> config (unscoped lookups)
+        self.config_ids = {}
+        # index every model, machine and config once (first match wins, like the linear scans)
+        for model in models:
+            self.models.setdefault(str(model.name), model)
+            for machine in model.machines:
+                self.machines.setdefault(str(machine.name), (model, machine))
+                for config in machine.mapping_configurations:
+                    self.configs.setdefault((str(machine.name), str(config.id_num)), config)
+                    self.config_ids.setdefault(str(config.id_num), config)
+
+    # default print
+    def __str__(self):
+        return (f"Config Index {len(self.models)} models / {len(self.machines)} machines"
+            + f" / {len(self.configs)} configs")
+
+    def getModel(self, name):
+        """Returns the model with the passed name, or None."""
+        return self.models.get(str(name))
+
+    def getMachine(self, name, model = None):
+        """Returns the machine with the passed name, or None.
+
+        model: (optional) Model; limits the lookup to machines of this model.
+        """
+        # look up the machine
+        entry = self.machines.get(str(name))
+        # no machine by that name
+        if entry is None:
+            return None
+        # the machine belongs to another model than the one searched
+        if (model is not None) and (str(entry[0].name) != str(model.name)):
+            return None
+        # return the machine
+        return entry[1]
+
+    def getConfig(self, config_id, machine = None):
+        """Returns the config with the passed ID, or None.
+
+        machine: (optional) Machine; limits the lookup to configs of this machine.
+        """
+        # no machine limiter; search all configs
+        if machine is None:
+            return self.config_ids.get(str(config_id))
+        # look up the config under its machine
+        return self.configs.get((str(machine.name), str(config_id)))
+
+    @staticmethod
+    def assignKeys(document):
+        """Gives every model, machine and config in a config Dict a persistent key if it has none.
+
+        Keys are written back into the Dict, so they are saved with the next commit.
+
+        -> int; the number of keys assigned.
+        """
+        # count the assigned keys
+        assigned = 0
+        # walk every model, machine and config once
+        for model in document['models']:
+            # missing keys are added in place
+            if not model.get('key'):
+                model.update({"key":uuid4().hex})
+                assigned += 1
+            for machine in model['machines']:
+                if not machine.get('key'):
+                    machine.update({"key":uuid4().hex})
+                    assigned += 1
+                for config in machine['mapping_configurations']:
+                    if not config.get('key'):
+                        config.update({"key":uuid4().hex})
+                        assigned += 1
+        # return the number of keys assigned
+        return assigned
+
+    @staticmethod
+    def mapPositions(document):
+        """Maps the key of every model, machine and config in a config Dict to its position.
+
+        -> {key: (model_index,) | (model_index, machine_index) | 
+            (model_index, machine_index, config_index)}
+        """
+        # create a dictionary to hold the positions
+        positions = {}
+        # walk every model, machine and config once
+        for i, model in enumerate(document['models']):
+            positions[model['key']] = (i,)
+            for j, machine in enumerate(model['machines']):
+                positions[machine['key']] = (i, j)
+                for k, config in enumerate(machine['mapping_configurations']):
+                    positions[config['key']] = (i, j, k)
+        # return the positions
+        return positions
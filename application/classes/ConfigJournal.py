@@ -0,0 +1,118 @@
+"""Config Journals are append-only write-ahead logs of the commits made to the KIM Interface configuration."""
+
+import os as os
+from json import loads, dumps
+from classes.ConfigIndex import ConfigIndex as ConfigIndex
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+
+# KIM Interface Config Journal Class
+class ConfigJournal:
+    # default constructor
+    def __init__(self, path, compaction_bytes):
+        self.path = path
+        self.compaction_bytes = compaction_bytes
+
+    # default print
+    def __str__(self):
+        return f"Config Journal {self.path}"
+
+    def size(self):
+        """Returns the size of the journal in bytes (0 if there is no journal)."""
+        # no journal file yet
+        if not os.path.isfile(self.path):
+            return 0
+        # return the size of the journal
+        return os.path.getsize(self.path)
+
+    def signature(self):
+        """Returns the (mtime, size) signature of the journal on disk (None if there is none)."""
+        # stat the journal
+        try:
+            stat = os.stat(self.path)
+        # no journal file yet
+        except OSError:
+            return None
+        # the signature changes whenever a record is appended or the journal is emptied
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def writeThrough(self):
+        """Returns True if commits go straight to the snapshot (no compaction threshold)."""
+        return self.compaction_bytes <= 0
+
+    def needsCompaction(self):
+        """Returns True once the journal has passed its compaction threshold."""
+        return self.size() >= self.compaction_bytes
+
+    def append(self, record):
+        """Appends one commit record (a single JSON line) and forces it to disk.
+
+        -> int; the number of bytes appended.
+        """
+        # one compact line per commit
+        line = dumps(record, separators = (',', ':')) + "\n"
+        # append the line
+        File = open(self.path, 'a')
+        File.write(line)
+        # make sure the record survives a crash before the commit is reported
+        File.flush()
+        os.fsync(File.fileno())
+        File.close()
+        # return the size of the record (JSON output is ASCII)
+        return len(line)
+
+    def readRecords(self):
+        """Returns the commit records in the journal, oldest first.
+        A torn final line (crash mid-append) is ignored.
+
+        -> [record]
+        """
+        # no journal file yet
+        if not os.path.isfile(self.path):
+            return []
+        # create a list to hold the records
+        records = []
+        # read the journal line by line
+        File = open(self.path, 'r')
+        for line in File:
+            # skip blank lines
+            if not line.strip():
+                continue
+            # parse the record
+            try:
+                records.append(loads(line))
+            # the last record was only partially written
+            except ValueError:
+                break
+        File.close()
+        # return the records
+        return records
+
+    def replay(self, document):
+        """Applies every journaled commit to a config Dict loaded from the snapshot.
+
+        -> int; the number of records replayed.
+        """
+        # get the records
+        records = self.readRecords()
+        # nothing to replay
+        if not records:
+            return 0
+        # map the keys of the snapshot
+        positions = ConfigIndex.mapPositions(document)
+        # apply each record's operations in order
+        for record in records:
+            for operation in record['operations']:
+                ConfigOperation.apply(document, operation, positions)
+            # the document carries the stamp of its latest commit
+            document.update({"timestamp":record['timestamp']})
+        # return the number of records replayed
+        return len(records)
+
+    def truncate(self):
+        """Empties the journal once its records are folded into a snapshot."""
+        # nothing to fold (write-through commits never create the journal)
+        if self.size() == 0:
+            return
+        # recreate the journal as an empty file
+        File = open(self.path, 'w')
+        File.close()
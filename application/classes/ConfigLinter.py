@@ -0,0 +1,271 @@
+"""Config Linters check a whole KIM Interface configuration for broken maps, clashing sheet/cluster targets and drifted names, one model at a time."""
+
+import os as os
+from json import loads, dumps
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+
+# KIM Interface Config Linter Class
+class ConfigLinter:
+    # version of the saved findings (older state is ignored)
+    VERSION = 1
+    # configs to check before the models are sharded across a process pool
+    PARALLEL_CONFIGS = 20000
+    # shards per worker (smaller shards even out models of different sizes)
+    SHARDS_PER_WORKER = 4
+
+    # default constructor
+    def __init__(self, state_path, workers = None):
+        # the findings of every model at the last run (for incremental runs)
+        self.state_path = state_path
+        # the keys of the models commits have changed since the last run, one per line
+        # ("*" after a commit that replaced the whole configuration)
+        self.touched_path = os.path.splitext(state_path)[0] + ".touched"
+        # the process pool size (1 checks in this process)
+        self.workers = workers or os.cpu_count() or 1
+        self.last_report = None
+
+    # default print
+    def __str__(self):
+        return f"Config Linter {self.state_path} ({self.workers} workers)"
+
+    @staticmethod
+    def finding(check, message, model, machine = None, config = None, key = None):
+        """Creates one finding.
+
+        check: str; the check that failed (see lintModel and lintNames).
+
+        -> {"check", "message", "model", "machine", "config", "key"}
+        """
+        return {"check":check, "message":message, "model":model, "machine":machine,
+            "config":config, "key":key}
+
+    @staticmethod
+    def lintModel(model):
+        """lintModel(model)
+
+        model: dict; one model of the configuration.
+
+        Checks every machine and config of a model in one pass:
+            prefix-drift: a machine name does not start with its model's name
+                (renaming the model rewrites the first 3 characters of its machines).
+            duplicate-id: two configs of a machine have the same ID.
+            unknown-item: a map names an item that is neither a base information field
+                of the model nor a measurement of the machine.
+            duplicate-item: a config maps the same item twice.
+            target-clash: two maps of a config target the same sheet and cluster.
+
+        -> [finding]
+        """
+        findings = []
+        name = model['name']
+        base_information = set(model['base_information'])
+        for machine in model['machines']:
+            # the machine name must carry the model prefix
+            if not machine['name'].startswith(name):
+                findings.append(ConfigLinter.finding("prefix-drift", "Machine " + machine['name']
+                    + " does not start with its model name " + name + ".", name, machine['name'],
+                    key = machine['key']))
+            # the items a config of this machine may map
+            items = base_information.union(machine['measurements'])
+            ids = set()
+            for config in machine['mapping_configurations']:
+                # config IDs are unique within the machine
+                if config['id'] in ids:
+                    findings.append(ConfigLinter.finding("duplicate-id", "Machine " + machine['name']
+                        + " has more than one config " + config['id'] + ".", name, machine['name'],
+                        config['id'], config['key']))
+                ids.add(config['id'])
+                # item -> map and (sheet, cluster) -> item of the config
+                mapped = set()
+                targets = {}
+                for mapping in config['mappings']:
+                    item = mapping['item']
+                    # the item must still exist
+                    if item not in items:
+                        findings.append(ConfigLinter.finding("unknown-item", "Config " + config['id']
+                            + " of " + machine['name'] + " maps " + str(item) + ", which is not a "
+                            + "base information field or measurement.", name, machine['name'],
+                            config['id'], config['key']))
+                    # each item is mapped once
+                    if item in mapped:
+                        findings.append(ConfigLinter.finding("duplicate-item", "Config " + config['id']
+                            + " of " + machine['name'] + " maps " + str(item) + " more than once.",
+                            name, machine['name'], config['id'], config['key']))
+                    mapped.add(item)
+                    # each sheet/cluster is written by one item
+                    target = (mapping['sheet'], mapping['cluster'])
+                    if target in targets:
+                        findings.append(ConfigLinter.finding("target-clash", "Config " + config['id']
+                            + " of " + machine['name'] + " maps " + str(targets[target]) + " and "
+                            + str(item) + " to sheet " + str(target[0]) + " cluster "
+                            + str(target[1]) + ".", name, machine['name'], config['id'], config['key']))
+                    else:
+                        targets[target] = item
+        # return the findings
+        return findings
+
+    @staticmethod
+    def lintShard(models):
+        """Checks a shard of models (run in a worker process).
+
+        -> [(model key, [finding])]
+        """
+        return [(model['key'], ConfigLinter.lintModel(model)) for model in models]
+
+    @staticmethod
+    def lintNames(document):
+        """lintNames(document)
+
+        Checks the names that must be unique across models (always re-checked; one pass):
+            duplicate-model: two models have the same name.
+            duplicate-machine: two machines have the same name (lookups by name find one).
+
+        -> [finding]
+        """
+        findings = []
+        models = set()
+        machines = {}
+        for model in document['models']:
+            # model names are unique
+            if model['name'] in models:
+                findings.append(ConfigLinter.finding("duplicate-model", "More than one model is named "
+                    + model['name'] + ".", model['name'], key = model['key']))
+            models.add(model['name'])
+            # machine names are unique everywhere
+            for machine in model['machines']:
+                if machine['name'] in machines:
+                    findings.append(ConfigLinter.finding("duplicate-machine", "Machine "
+                        + machine['name'] + " of " + model['name'] + " has the same name as a machine of "
+                        + machines[machine['name']] + ".", model['name'], machine['name'],
+                        key = machine['key']))
+                else:
+                    machines[machine['name']] = model['name']
+        # return the findings
+        return findings
+
+    def touch(self, model_keys):
+        """touch(model_keys)
+
+        model_keys: iterable of str | None; the keys of the models a commit changed
+            (None: the commit replaced the whole configuration).
+
+        Notes the models to re-check on the next incremental run (called by every commit,
+        so commits of any process are seen).
+        """
+        File = open(self.touched_path, 'a')
+        File.write("*\n" if model_keys is None else "".join(str(key) + "\n" for key in model_keys if key))
+        File.close()
+
+    def loadTouched(self):
+        """Returns the set of model keys changed since the last run (None if every model
+        must be re-checked)."""
+        try:
+            File = open(self.touched_path, 'r')
+            touched = set(line.strip() for line in File if line.strip())
+            File.close()
+        # nothing committed since the last run
+        except FileNotFoundError:
+            return set()
+        # a whole configuration was committed
+        return None if "*" in touched else touched
+
+    def loadState(self):
+        """Returns the {model key: [finding]} of the last run (empty if there is none)."""
+        try:
+            File = open(self.state_path, 'r')
+            state = loads(File.read())
+            File.close()
+        # no saved run (or an unreadable one)
+        except (OSError, ValueError):
+            return {}
+        # ignore state written by another version
+        if state.get('version') != ConfigLinter.VERSION:
+            return {}
+        return state.get('models', {})
+
+    def saveState(self, models):
+        """Saves the findings of every model for the next incremental run and forgets the
+        models touched before it."""
+        # write to a temporary file, then swap it in
+        temp = self.state_path + ".tmp"
+        File = open(temp, 'w')
+        File.write(dumps({"version":ConfigLinter.VERSION, "models":models}))
+        File.close()
+        os.replace(temp, self.state_path)
+        # every model is current
+        if os.path.exists(self.touched_path):
+            os.remove(self.touched_path)
+
+    def shards(self, models):
+        """Splits models into shards of about the same number of configs (largest first).
+
+        -> [[model]]
+        """
+        # the number of configs of each model
+        sizes = [(sum(len(machine['mapping_configurations']) for machine in model['machines']), model)
+            for model in models]
+        sizes.sort(key = lambda entry: entry[0], reverse = True)
+        # each model goes to the smallest shard so far
+        count = min(len(models), self.workers * ConfigLinter.SHARDS_PER_WORKER)
+        shards = [[] for i in range(count)]
+        totals = [0] * count
+        for size, model in sizes:
+            smallest = totals.index(min(totals))
+            shards[smallest].append(model)
+            totals[smallest] += size
+        # return the shards
+        return shards
+
+    def lint(self, document, incremental = False):
+        """lint(document, incremental = False)
+
+        document: dict; the configuration to check.
+        incremental: (optional) bool; only re-check the models that commits touched since
+            the last run, and new models (the findings of the others are reused).
+
+        Checks the whole configuration. Large configurations are checked in a process pool,
+        a shard of models per task. The findings of every model are saved for the next
+        incremental run. Hand edits of the config file are not seen by touch(); a full
+        run checks them.
+
+        -> {"findings", "models", "checked", "reused", "parallel", "seconds"}
+        """
+        start = perf_counter()
+        # the findings of the last run and the models touched since (a whole new
+        # configuration is checked in full)
+        state = self.loadState() if incremental else {}
+        touched = self.loadTouched() if state else None
+        if touched is None:
+            state = {}
+        # the models to check (touched or new)
+        pending = [model for model in document['models']
+            if (model['key'] not in state) or (model['key'] in touched)]
+        # check the pending models (in a process pool if there are many configs)
+        configs = sum(len(machine['mapping_configurations']) for model in pending
+            for machine in model['machines'])
+        parallel = (self.workers > 1) and (len(pending) > 1) and (configs >= ConfigLinter.PARALLEL_CONFIGS)
+        if parallel:
+            Pool = ProcessPoolExecutor(max_workers = self.workers)
+            try:
+                results = [entry for shard in Pool.map(ConfigLinter.lintShard, self.shards(pending))
+                    for entry in shard]
+            finally:
+                Pool.shutdown()
+        else:
+            results = ConfigLinter.lintShard(pending)
+        checked = dict(results)
+        # collect the findings in document order (reusing unchanged models)
+        findings = ConfigLinter.lintNames(document)
+        models = {}
+        for model in document['models']:
+            models[model['key']] = checked[model['key']] if model['key'] in checked \
+                else state[model['key']]
+            findings += models[model['key']]
+        # save this run
+        self.saveState(models)
+        # report the run
+        self.last_report = {"findings":findings, "models":len(document['models']),
+            "checked":len(pending), "reused":len(document['models']) - len(pending),
+            "parallel":parallel, "seconds":perf_counter() - start}
+        return self.last_report
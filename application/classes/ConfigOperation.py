@@ -0,0 +1,290 @@
+"""Config Operations are small keyed edits that can be journaled and replayed on a KIM Interface configuration."""
+
+# KIM Interface Config Operation Class
+class ConfigOperation:
+    # operation names
+    ADD = "add"
+    REPLACE = "replace"
+    REMOVE = "remove"
+
+    @staticmethod
+    def add(parent_key, data, index = None):
+        """Creates an operation that adds a model (parent_key None), machine (model key)
+        or config (machine key) Dict under its parent (last, or at an index to put a
+        removed object back in its place).
+
+        -> {"op", "parent", "key", "data"[, "index"]}
+        """
+        operation = {"op":ConfigOperation.ADD, "parent":parent_key, "key":data['key'], "data":data}
+        if index is not None:
+            operation['index'] = index
+        return operation
+
+    @staticmethod
+    def replace(data):
+        """Creates an operation that replaces the model, machine or config Dict with the same key.
+
+        -> {"op", "key", "data"}
+        """
+        return {"op":ConfigOperation.REPLACE, "key":data['key'], "data":data}
+
+    @staticmethod
+    def remove(key):
+        """Creates an operation that removes the model, machine or config with the passed key.
+
+        -> {"op", "key"}
+        """
+        return {"op":ConfigOperation.REMOVE, "key":key}
+
+    @staticmethod
+    def modelKey(document, operation, positions):
+        """Returns the key of the model an operation changes (None if its target is unknown)."""
+        # adds change their parent; replaces and removes change their target
+        target = operation.get('parent') if operation['op'] == ConfigOperation.ADD else operation['key']
+        # a new model changes only itself
+        if target is None:
+            return operation['key']
+        # the target is gone
+        if target not in positions:
+            return None
+        # the model is the first step of the position
+        return document['models'][positions[target][0]]['key']
+
+    @staticmethod
+    def children(document, position):
+        """Returns the list that holds the children of the object at a position
+        (models for None, machines of a model, configs of a machine)."""
+        # the document root holds the models
+        if position is None:
+            return document['models']
+        # a model holds its machines
+        model = document['models'][position[0]]
+        if len(position) == 1:
+            return model['machines']
+        # a machine holds its configs
+        return model['machines'][position[1]]['mapping_configurations']
+
+    @staticmethod
+    def lookup(document, position):
+        """Returns the model, machine or config Dict at a position."""
+        return ConfigOperation.children(document, position[:-1] if len(position) > 1 else None)[position[-1]]
+
+    @staticmethod
+    def patch(document, operation, positions):
+        """patch(document, operation, positions)
+
+        Returns the before/after patch of one operation and the keys of the objects it
+        changes (its target and everything above it). Call it before the operation is
+        applied. Replaces only hold the fields that change; adds hold the new object
+        and removes the removed one (with its parent and place).
+
+        -> ({"op", "key", "parent", "index", "before", "after"}, [key]) | (None, [])
+        """
+        op = operation['op']
+        key = operation['key']
+        # adding an object that already exists (replayed operation) replaces it
+        if (op == ConfigOperation.ADD) and (key in positions):
+            op = ConfigOperation.REPLACE
+        # a new object is placed under its parent
+        if op == ConfigOperation.ADD:
+            parent = operation.get('parent')
+            if (parent is not None) and (parent not in positions):
+                return (None, [])
+            above = [] if parent is None else positions[parent]
+            patch = {"op":op, "key":key, "parent":parent, "index":operation.get('index'), "before":None,
+                "after":operation['data']}
+        # the target must exist to be replaced or removed
+        elif key not in positions:
+            return (None, [])
+        else:
+            position = positions[key]
+            above = position[:-1]
+            before = ConfigOperation.lookup(document, position)
+            parent = ConfigOperation.lookup(document, above)['key'] if above else None
+            # the removed object (with its place, to put it back)
+            if op == ConfigOperation.REMOVE:
+                patch = {"op":op, "key":key, "parent":parent, "index":position[-1], "before":before,
+                    "after":None}
+            # only the fields that change (unchanged children are not compared twice)
+            else:
+                after = operation['data']
+                fields = [field for field in set(before).union(after) if (before.get(field) is not after.get(field))
+                    and (before.get(field) != after.get(field))]
+                patch = {"op":op, "key":key, "parent":parent, "index":None,
+                    "before":dict((field, before[field]) for field in fields if field in before),
+                    "after":dict((field, after[field]) for field in fields if field in after)}
+        # the keys of the target and of everything above it
+        keys = [key] + [ConfigOperation.lookup(document, above[:i + 1])['key'] for i in range(len(above))]
+        return (patch, keys)
+
+    @staticmethod
+    def invert(document, patch, positions, pending):
+        """invert(document, patch, positions, pending)
+
+        document: dict; the current config Dict.
+        patch: dict; the decoded patch of one committed operation (see patch).
+        positions: dict; the key -> position map of the document.
+        pending: dict; key -> the Dict an earlier inverse of the same undo puts in place
+            (filled in as the inverses are built).
+
+        Returns the operation that reverses one committed operation: an add is removed, a
+        removed object is added back in its place and a replace puts the old values of
+        the fields it changed back (the other fields keep their current values). Invert
+        the patches of a commit last first.
+
+        -> ConfigOperation
+        """
+        key = patch['key']
+        # an added object is removed
+        if patch['op'] == ConfigOperation.ADD:
+            pending.pop(key, None)
+            return ConfigOperation.remove(key)
+        # a removed object is put back in its place
+        if patch['op'] == ConfigOperation.REMOVE:
+            pending[key] = patch['before']
+            return ConfigOperation.add(patch['parent'], patch['before'], patch['index'])
+        # the object as the earlier inverses leave it (or as it is now)
+        if key in pending:
+            data = dict(pending[key])
+        elif key in positions:
+            data = dict(ConfigOperation.lookup(document, positions[key]))
+        # the object is gone (the commit fails on it)
+        else:
+            data = {"key":key}
+        # the fields the replace added are dropped; the ones it changed get their old values
+        for field in patch['after']:
+            if field not in patch['before']:
+                data.pop(field, None)
+        data.update(patch['before'])
+        pending[key] = data
+        return ConfigOperation.replace(data)
+
+    @staticmethod
+    def matches(document, patch, positions):
+        """matches(document, patch, positions)
+
+        document: dict; the current config Dict.
+        patch: dict; the decoded patch of one committed operation (see patch).
+        positions: dict; the key -> position map of the document.
+
+        Returns True if the object a patch changed is still as the patch left it: an added
+        object is unchanged, a replaced one holds the new values (and not the fields the
+        replace dropped) and a removed one is still gone (with its parent still there).
+        Check it before the inverse of the patch is applied.
+
+        -> bool
+        """
+        key = patch['key']
+        # a removed object was not added back, and its place is still there
+        if patch['op'] == ConfigOperation.REMOVE:
+            return (key not in positions) and ((patch['parent'] is None) or (patch['parent'] in positions))
+        # an added or replaced object must still exist
+        if key not in positions:
+            return False
+        current = ConfigOperation.lookup(document, positions[key])
+        # an added object was not changed since
+        if patch['op'] == ConfigOperation.ADD:
+            return current == patch['after']
+        # a replaced object still holds the new values (and not the dropped fields)
+        for field in patch['after']:
+            if (field not in current) or (current[field] != patch['after'][field]):
+                return False
+        for field in patch['before']:
+            if (field not in patch['after']) and (field in current):
+                return False
+        return True
+
+    @staticmethod
+    def descendantKeys(data):
+        """Returns the keys of everything below a Dict (machines of a model and their
+        configs, configs of a machine)."""
+        keys = []
+        for child_name in ["machines", "mapping_configurations"]:
+            for child in data.get(child_name, []):
+                keys.append(child.get('key'))
+                keys.extend(ConfigOperation.descendantKeys(child))
+        return keys
+
+    @staticmethod
+    def register(data, position, positions):
+        """Maps the key of a Dict and the keys of everything below it to their positions."""
+        # map the object itself
+        positions[data['key']] = position
+        # map the children (machines of a model, configs of a machine)
+        for child_name in ["machines", "mapping_configurations"]:
+            for i, child in enumerate(data.get(child_name, [])):
+                ConfigOperation.register(child, position + (i,), positions)
+
+    @staticmethod
+    def unregister(data, positions):
+        """Drops the key of a Dict and the keys of everything below it from the positions."""
+        # drop the object itself
+        positions.pop(data['key'], None)
+        # drop the children (machines of a model, configs of a machine)
+        for child_name in ["machines", "mapping_configurations"]:
+            for child in data.get(child_name, []):
+                ConfigOperation.unregister(child, positions)
+
+    @staticmethod
+    def remap(siblings, prefix, start, positions):
+        """Maps the siblings from an index on (and everything below them) to their
+        positions after one was added or removed before them (not the whole document)."""
+        for i in range(start, len(siblings)):
+            # configs have nothing below them
+            if len(prefix) == 2:
+                positions[siblings[i]['key']] = prefix + (i,)
+            else:
+                ConfigOperation.register(siblings[i], prefix + (i,), positions)
+
+    @staticmethod
+    def apply(document, operation, positions):
+        """Applies one operation to a config Dict and keeps its key -> position map current.
+        Operations are keyed, so replaying an operation that was already applied is harmless.
+
+        -> bool; False if the operation's target (or parent) no longer exists.
+        """
+        # get the operation name and target key
+        op = operation['op']
+        key = operation['key']
+        # adding an object that already exists (replayed operation) replaces it
+        if (op == ConfigOperation.ADD) and (key in positions):
+            op = ConfigOperation.REPLACE
+        # add a new object under its parent
+        if op == ConfigOperation.ADD:
+            # find the parent (models have no parent)
+            parent = operation.get('parent')
+            if (parent is not None) and (parent not in positions):
+                return False
+            parent_position = None if parent is None else positions[parent]
+            # append the new object to the parent's list (or put it at its index)
+            siblings = ConfigOperation.children(document, parent_position)
+            index = operation.get('index')
+            if (index is None) or (index >= len(siblings)):
+                index = len(siblings)
+            siblings.insert(index, operation['data'])
+            # map the new object and every later sibling (they moved down one place)
+            prefix = () if parent_position is None else parent_position
+            ConfigOperation.register(operation['data'], prefix + (index,), positions)
+            ConfigOperation.remap(siblings, prefix, index + 1, positions)
+            return True
+        # the target must exist to be replaced or removed
+        if key not in positions:
+            return False
+        # find the target in its parent's list
+        position = positions[key]
+        siblings = ConfigOperation.children(document, position[:-1] if len(position) > 1 else None)
+        # replace the object in place
+        if op == ConfigOperation.REPLACE:
+            # the old children may not exist anymore
+            ConfigOperation.unregister(siblings[position[-1]], positions)
+            siblings[position[-1]] = operation['data']
+            ConfigOperation.register(operation['data'], position, positions)
+            return True
+        # remove the object
+        if op == ConfigOperation.REMOVE:
+            ConfigOperation.unregister(siblings.pop(position[-1]), positions)
+            # every later sibling moved up one place
+            ConfigOperation.remap(siblings, position[:-1], position[-1], positions)
+            return True
+        # unknown operation
+        return False
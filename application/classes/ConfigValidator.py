@@ -0,0 +1,429 @@
+"""Config Validators check plain input values for new and edited Models, Machines and Configs (no GUI involved)."""
+
+from re import compile
+from classes.Model import Model as Model
+from classes.Machine import Machine as Machine
+from classes.MappingConfiguration import MappingConfiguration as MappingConfiguration
+
+# KIM Interface Config Validator Class
+class ConfigValidator:
+    # mapping configuration IDs (0-9 and '-')
+    CONFIG_ID = compile('^[0-9\\-]+$')
+    # machine names (0-9, a-z, A-Z, space, and '-')
+    MACHINE_NAME = compile('^[a-zA-Z0-9\\- ]+$')
+    # model names (0-9, A-Z)
+    MODEL_NAME = compile('^[A-Z0-9]+$')
+    # longest measurement spec or base information header
+    MAX_FIELD = 50
+    # rule sets: (test, error) pairs checked in order, built once; the first failed rule is reported
+    CONFIG_ID_RULES = [(bool, "Mapping Configuration IDs cannot be blank."),
+        (CONFIG_ID.match, "Mapping Configuration IDs can only contain digits (0-9) and dashes '-'."
+            + "\nYou have included an invalid character in this ID.")]
+    MACHINE_NAME_RULES = [(bool, "Machine names cannot be blank."),
+        (MACHINE_NAME.match, "Machine names must be alphanumeric (A-Z, 0-9). They may contain\n"
+            + "spaces ' ' and dashes '-' but no other special characters.\n"
+            + "You have included an invalid character in this name.")]
+    MODEL_NAME_RULES = [(bool, "Model names cannot be blank."),
+        (lambda name: len(name) == 3, "Model names must be 3 characters in length."),
+        (MODEL_NAME.match, "Model names can only contain capital letters and digits.\n"
+            + "You have included an invalid character in this name.")]
+
+    # default print
+    def __str__(self):
+        return "Config Validator"
+
+    @staticmethod
+    def nameOf(item):
+        """Returns the name of a Model/Machine object or Dict."""
+        return item['name'] if isinstance(item, dict) else item.name
+
+    @staticmethod
+    def idOf(item):
+        """Returns the ID of a Config object or Dict."""
+        return item['id'] if isinstance(item, dict) else item.id_num
+
+    @staticmethod
+    def checkRules(rules, value):
+        """checkRules(rules, value)
+
+        rules: [(test, error)]; a rule set (see CONFIG_ID_RULES).
+        value: str; the entered value.
+
+        -> None | {"error"}; the error of the first rule the value fails.
+        """
+        for test, error in rules:
+            if not test(value):
+                return {"error":error}
+        return None
+
+    @staticmethod
+    def validateConfigId(machine, new_id, prior_id = None, taken = None):
+        """validateConfigId(machine, new_id, prior_id = None, taken = None)
+
+        machine: machine; machine the config belongs to.
+        new_id: str; ID of the config.
+        prior_id: (optional) str; ID of the config before editing (may be kept).
+        taken: (optional) set | dict; the config IDs of the machine (see ValidationIndex);
+            collected from machine.mapping_configurations if not passed.
+
+        Checks that a config ID is entered, well-formed and unique within its machine.
+
+        -> None | {"error"}
+        """
+        # check the ID against the rules
+        error = ConfigValidator.checkRules(ConfigValidator.CONFIG_ID_RULES, new_id)
+        if error is not None:
+            return error
+        # collect the IDs in use
+        if taken is None:
+            taken = set(ConfigValidator.idOf(config) for config in machine.mapping_configurations)
+        # check that it is unique (the config may keep its prior ID)
+        if (new_id in taken) and (new_id != prior_id):
+            # overlapping IDs, not unique
+            return {"error":"Mapping Configuration IDs must be unique.\n"
+                + "The ID " + new_id + " for " + str(machine)
+                + " has already been assigned.\n"
+                + "Choose a different Mapping Configuration ID for this new Configuration."}
+        # the ID is valid
+        return None
+
+    @staticmethod
+    def validateMaps(items, checks, maps, section):
+        """validateMaps(items, checks, maps, section)
+
+        items: [str]; the mapped items (base information, measurements or config items).
+        checks: [bool]; whether each item is selected.
+        maps: [(sheet, cluster)]; the sheet/cluster entered for each item.
+        section: str; the name of the items in error messages.
+
+        Checks that every selected item has a sheet and cluster #.
+
+        -> [Boolean:result, [mapping]|Error]
+        """
+        # create a map list to hold the verified mapping items
+        map_list = []
+        for index in range(len(checks)):
+            # skip items that are not selected
+            if not checks[index]:
+                continue
+            # check that there were sheet and cluster #s
+            sheet, cluster = maps[index]
+            if not (sheet and cluster):
+                # bad configuration settings
+                return [False,
+                    {"error":"Selected " + section + " must all have\n"
+                    + "Sheet and Cluster #'s. You have ommited a # for at least one."}]
+            # this map is good to add
+            map_list.append({"item":items[index], "sheet":int(sheet),
+                "cluster":int(cluster), "type":"string", "value":""})
+        # return the mappings
+        return [True, map_list]
+
+    @staticmethod
+    def validateTargets(mappings):
+        """validateTargets(mappings)
+
+        mappings: [mapping]; the maps of one config.
+
+        Checks that no two maps of a config write to the same sheet and cluster.
+
+        -> None | {"error"}
+        """
+        # (sheet, cluster) -> item
+        targets = {}
+        for mapping in mappings:
+            target = (mapping['sheet'], mapping['cluster'])
+            # another item writes here
+            if target in targets:
+                return {"error":"Two fields cannot share a Sheet and Cluster #.\n"
+                    + targets[target] + " and " + mapping['item'] + " are both mapped to\n"
+                    + "Sheet " + str(target[0]) + ", Cluster " + str(target[1]) + "."}
+            targets[target] = mapping['item']
+        # every map has its own cluster
+        return None
+
+    @staticmethod
+    def validateAddConfig(model, machine, new_id, info_checks, measurement_checks,
+        info_maps, measurement_maps, taken = None):
+        """validateAddConfig(model, machine, new_id, info_checks, measurement_checks,
+                info_maps, measurement_maps, taken = None)
+
+        model: model; model the config belongs to.
+        machine: machine; machine the config belongs to.
+        new_id: str; ID of the config.
+        info_checks: [bool]; whether each model base information field is included.
+        measurement_checks: [bool]; whether each machine measurement is included.
+        info_maps: [(sheet, cluster)]; the map of each model base information field.
+        measurement_maps: [(sheet, cluster)]; the map of each machine measurement.
+        taken: (optional) set | dict; the config IDs of the machine (see validateConfigId).
+
+        Takes a full set of information that defines a Configuration
+        and returns the validation of that info.
+
+        -> [Boolean:result, Config|Error]
+        """
+        # validate the ID
+        error = ConfigValidator.validateConfigId(machine, new_id, taken = taken)
+        if error is not None:
+            return [False, error]
+        # validate the base information maps, then the measurement maps
+        info = ConfigValidator.validateMaps(model.base_information, info_checks, info_maps,
+            "Model Base Information fields")
+        if not info[0]:
+            return info
+        measurements = ConfigValidator.validateMaps(machine.measurements, measurement_checks,
+            measurement_maps, "Machine Measurements fields")
+        if not measurements[0]:
+            return measurements
+        # no two maps may share a sheet/cluster
+        error = ConfigValidator.validateTargets(info[1] + measurements[1])
+        if error is not None:
+            return [False, error]
+        # if here, the config information can make a config Object
+        config = MappingConfiguration(id_num = new_id, mappings = info[1] + measurements[1],
+            machine = machine)
+        # return the config
+        return [True, config]
+
+    @staticmethod
+    def validateEditConfig(machine, config, new_id, prior_id, checks, maps, taken = None):
+        """validateEditConfig(machine, config, new_id, prior_id, checks, maps, taken = None)
+
+        machine: machine; machine the config belongs to.
+        config: config; the config being edited.
+        new_id: str; edited ID of the config.
+        prior_id: str; original ID of the config.
+        checks: [bool]; whether each of the config's maps is kept.
+        maps: [(sheet, cluster)]; the edited map of each of the config's items.
+        taken: (optional) set | dict; the config IDs of the machine (see validateConfigId).
+
+        Takes a full edited Configuration and returns the validation of that info.
+
+        -> [Boolean:result, Config|Error]
+        """
+        # validate the ID (it may stay the same)
+        error = ConfigValidator.validateConfigId(machine, new_id, prior_id, taken)
+        if error is not None:
+            return [False, error]
+        # validate the maps
+        mappings = ConfigValidator.validateMaps([mapping['item'] for mapping in config.mappings],
+            checks, maps, "Configuration maps")
+        if not mappings[0]:
+            return mappings
+        # no two maps may share a sheet/cluster
+        error = ConfigValidator.validateTargets(mappings[1])
+        if error is not None:
+            return [False, error]
+        # if here, the config information can make a config Object (same identity as before edits)
+        edited_config = MappingConfiguration(id_num = new_id, mappings = mappings[1],
+            machine = machine, key = config.key)
+        # return the config
+        return [True, edited_config]
+
+    @staticmethod
+    def validateMachineName(model, machine_name, prior_name = None, taken = None):
+        """validateMachineName(model, machine_name, prior_name = None, taken = None)
+
+        taken: (optional) set | dict; the machine names in use (see ValidationIndex);
+            collected from model.machines if not passed.
+
+        Checks that a machine name is entered, well-formed and unique.
+
+        -> None | {"error"}
+        """
+        # check the name against the rules
+        error = ConfigValidator.checkRules(ConfigValidator.MACHINE_NAME_RULES, machine_name)
+        if error is not None:
+            return error
+        # collect the names in use
+        if taken is None:
+            taken = set(ConfigValidator.nameOf(machine) for machine in model.machines)
+        # check that the name is unique (the machine may keep its prior name)
+        if (machine_name in taken) and (machine_name != prior_name):
+            # overlapping names, not unique
+            return {"error":"Machine names must be unique.\n"
+                + "The Machine '" + machine_name + "' for " + str(model)
+                + "\nhas already been assigned."
+                + "\nChoose a different name for this Machine."}
+        # the name is valid
+        return None
+
+    @staticmethod
+    def validateFields(values, checks, kind, header):
+        """validateFields(values, checks, kind, header)
+
+        values: [str]; the entered measurement specs or base information headers.
+        checks: [bool] | None; whether each value is selected (None: every value entered is
+            kept and empty values are omitted; otherwise selected values must be entered).
+        kind: str; "Measurement specs" or "Base information headers" (error messages).
+        header: str; "spec" or "header" (error messages).
+
+        Checks the length of every kept value.
+
+        -> [Boolean:result, [str]|Error]
+        """
+        # create a list to hold valid values
+        kept = []
+        for index in range(len(values)):
+            value = values[index]
+            # omit unselected values
+            if (checks is not None) and (not checks[index]):
+                continue
+            # check that there was a value entered
+            if not value:
+                # the input box was empty, omit this input
+                if checks is None:
+                    continue
+                # a selected input box was empty; this is invalid
+                return [False,
+                    {"error":"Selected " + kind + " must have a value.\n"
+                    + "One or more " + header + " you have selected does not have a value."}]
+            # check the length of the value
+            if len(value) > ConfigValidator.MAX_FIELD:
+                # this is excessive in length, the input could be malicious
+                return [False,
+                    {"error":kind + " must be 50 characters or less.\n"
+                    + "One or more " + header + " you have entered is too long."}]
+            # the value is valid
+            kept.append(value)
+        # return the kept values
+        return [True, kept]
+
+    @staticmethod
+    def validateAddMachine(model, machine_name, measurements, taken = None):
+        """validateAddMachine(model, machine_name, measurements, taken = None)
+
+        model: model; model the machine belongs to.
+        machine_name: str; the new machine's name.
+        measurements: [str]; the entered measurement specs (empty ones are omitted).
+        taken: (optional) set | dict; the machine names in use (see validateMachineName).
+
+        Takes a full set of information defining a machine and returns the validation of that info.
+
+        -> [Boolean:result, machine|Error]
+        """
+        # validate the name
+        error = ConfigValidator.validateMachineName(model, machine_name, taken = taken)
+        if error is not None:
+            return [False, error]
+        # validate the measurements
+        meas_list = ConfigValidator.validateFields(measurements, None, "Measurement specs", "spec")
+        if not meas_list[0]:
+            return meas_list
+        # if here, the machine information can make a machine Object
+        machine = Machine(name = machine_name, measurements = meas_list[1],
+            mapping_configurations = [], model = model)
+        # return the machine
+        return [True, machine]
+
+    @staticmethod
+    def validateEditMachine(model, machine, new_name, prior_name, checks, inputs, taken = None):
+        """validateEditMachine(model, machine, new_name, prior_name, checks, inputs, taken = None)
+
+        model: model; model the machine belongs to.
+        machine: machine; machine being edited.
+        new_name: str; the machine's name after editing.
+        prior_name: str; name of the machine before editing.
+        checks: [bool]; whether each measurement is kept.
+        inputs: [str]; the edited spec of each measurement.
+        taken: (optional) set | dict; the machine names in use (see validateMachineName).
+
+        Takes an edited machine and returns the validation of that info.
+
+        -> [Boolean:result, machine|Error]
+        """
+        # validate the name (it may stay the same)
+        error = ConfigValidator.validateMachineName(model, new_name, prior_name, taken)
+        if error is not None:
+            return [False, error]
+        # validate the selected measurements
+        meas_list = ConfigValidator.validateFields(inputs, checks, "Measurement specs", "spec")
+        if not meas_list[0]:
+            return meas_list
+        # if here, the machine information can make a machine Object (same identity as before edits)
+        edited_machine = Machine(name = new_name, measurements = meas_list[1],
+            mapping_configurations = machine.mapping_configurations, model = model, key = machine.key)
+        # return the machine
+        return [True, edited_machine]
+
+    @staticmethod
+    def validateModelName(models, model_name, prior_name = None):
+        """validateModelName(models, model_name, prior_name = None)
+
+        models: [model] | set | dict; the current models, or the model names in use
+            (see ValidationIndex).
+
+        Checks that a model name is entered, 3 characters, well-formed and unique.
+
+        -> None | {"error"}
+        """
+        # check the name against the rules
+        error = ConfigValidator.checkRules(ConfigValidator.MODEL_NAME_RULES, model_name)
+        if error is not None:
+            return error
+        # collect the names in use
+        taken = models if isinstance(models, (set, dict)) \
+            else set(ConfigValidator.nameOf(model) for model in models)
+        # check that the name is unique (the model may keep its prior name)
+        if (model_name in taken) and (model_name != prior_name):
+            # overlapping names, not unique
+            return {"error":"Model names must be unique.\n"
+                + "The Model '" + model_name + "' has already been defined.\n"
+                + "Choose a different name for this Model."}
+        # the name is valid
+        return None
+
+    @staticmethod
+    def validateAddModel(models, model_name, base_information):
+        """validateAddModel(models, model_name, base_information)
+
+        models: [model] | set | dict; the current models, or the model names in use.
+        model_name: str; name of the new model.
+        base_information: [str]; the entered base information headers (empty ones are omitted).
+
+        Takes a full set of information defining a model and returns the validation of that info.
+
+        -> [Boolean:result, model|Error]
+        """
+        # validate the name
+        error = ConfigValidator.validateModelName(models, model_name)
+        if error is not None:
+            return [False, error]
+        # validate the base information headers
+        info_list = ConfigValidator.validateFields(base_information, None,
+            "Base information headers", "header")
+        if not info_list[0]:
+            return info_list
+        # if here, the model information can make a model Object
+        model = Model(name = model_name, base_information = info_list[1], machines = [])
+        # return the model
+        return [True, model]
+
+    @staticmethod
+    def validateEditModel(models, model, new_name, prior_name, checks, inputs):
+        """validateEditModel(models, model, new_name, prior_name, checks, inputs)
+
+        models: [model] | set | dict; the current models, or the model names in use.
+        model: model; model being edited.
+        new_name: str; the model's name after editing.
+        prior_name: str; name of the model before editing.
+        checks: [bool]; whether each base information header is kept.
+        inputs: [str]; the edited base information headers.
+
+        Takes an edited model and returns the validation of that info.
+
+        -> [Boolean:result, model|Error]
+        """
+        # validate the name (it may stay the same)
+        error = ConfigValidator.validateModelName(models, new_name, prior_name)
+        if error is not None:
+            return [False, error]
+        # validate the selected base information headers
+        info_list = ConfigValidator.validateFields(inputs, checks, "Base Information headers", "header")
+        if not info_list[0]:
+            return info_list
+        # if here, the model information can make a model Object (same identity as before edits)
+        edited_model = Model(name = new_name, base_information = info_list[1],
+            machines = model.machines, key = model.key)
+        # return the model
+        return [True, edited_model]
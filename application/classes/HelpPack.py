@@ -0,0 +1,162 @@
+"""Help Packs hold the help pages pre-decoded (float RGBA, the layout DPG textures take) in one memory-mapped file."""
+
+import os as os
+import re as re
+import mmap as mmap
+from array import array
+from json import loads, dumps
+
+# KIM Interface Help Pack Class
+class HelpPack:
+    # manifest version (bumped when the pack layout changes)
+    VERSION = 1
+    # page data starts on 16-byte boundaries
+    ALIGN = 16
+
+    # default constructor
+    def __init__(self, help_dir):
+        self.help_dir = help_dir
+        self.pack_path = os.path.join(help_dir, "help_pages.pack")
+        self.manifest_path = os.path.join(help_dir, "help_pages.json")
+        self.manifest = None
+        self.File = None
+        self.map = None
+        self.checked = False
+
+    # default print
+    def __str__(self):
+        return f"Help Pack {self.pack_path} ({'loaded' if self.map is not None else 'not loaded'})"
+
+    @staticmethod
+    def pageOrder(name):
+        """Sort key that puts "...images-9.jpg" before "...images-10.jpg"."""
+        return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+    @staticmethod
+    def listPages(help_dir):
+        """Lists the page JPGs of every chapter folder in page order, with their stat signatures.
+
+        -> {chapter: [{"file", "size", "mtime_ns"}]}
+        """
+        # create a dictionary to hold the chapters
+        chapters = {}
+        for folder in sorted(os.listdir(help_dir)):
+            # only chapter folders
+            match = re.fullmatch(r'chap(\d+)', folder)
+            if (match is None) or (not os.path.isdir(os.path.join(help_dir, folder))):
+                continue
+            # the pages of the chapter in order
+            names = sorted((name for name in os.listdir(os.path.join(help_dir, folder))
+                if name.lower().endswith(".jpg")), key = HelpPack.pageOrder)
+            pages = []
+            for name in names:
+                stat = os.stat(os.path.join(help_dir, folder, name))
+                pages.append({"file":folder + "/" + name, "size":stat.st_size,
+                    "mtime_ns":stat.st_mtime_ns})
+            chapters[match.group(1)] = pages
+        # return the chapters
+        return chapters
+
+    @staticmethod
+    def build(help_dir, decode):
+        """Decodes every help page once and writes the pack and its page-order manifest.
+
+        decode: function(path) -> (width, height, channels, data); the JPEG decoder
+            (dpg.load_image). data is float RGBA.
+
+        -> int; the size of the pack in bytes.
+        """
+        # list the pages
+        chapters = HelpPack.listPages(help_dir)
+        Pack = HelpPack(help_dir)
+        # write the pack page by page
+        File = open(Pack.pack_path + ".tmp", 'wb')
+        for chapter in chapters:
+            for page in chapters[chapter]:
+                # start the page on an aligned offset
+                padding = (-File.tell()) % HelpPack.ALIGN
+                File.write(b"\0" * padding)
+                # decode and store the float RGBA data
+                width, height, channels, data = decode(os.path.join(help_dir, page['file']))
+                floats = array('f', data)
+                page.update({"width":width, "height":height, "offset":File.tell(),
+                    "length":len(floats) * floats.itemsize})
+                floats.tofile(File)
+        size = File.tell()
+        File.close()
+        # replace the pack, then the manifest that vouches for it
+        os.replace(Pack.pack_path + ".tmp", Pack.pack_path)
+        File = open(Pack.manifest_path + ".tmp", 'w')
+        File.write(dumps({"version":HelpPack.VERSION, "pack_size":size, "chapters":chapters}, indent = 4))
+        File.close()
+        os.replace(Pack.manifest_path + ".tmp", Pack.manifest_path)
+        # return the size of the pack
+        return size
+
+    def load(self):
+        """Maps the pack if it exists and is current (same version, pack size and JPGs).
+
+        -> bool; False if the loose JPGs have to be used.
+        """
+        # already checked this session
+        if self.checked:
+            return self.map is not None
+        self.checked = True
+        try:
+            # read the manifest
+            File = open(self.manifest_path, 'r')
+            manifest = loads(File.read())
+            File.close()
+            # stale: another layout, another pack, or the JPGs changed since the build
+            if (manifest['version'] != HelpPack.VERSION) or \
+                    (os.path.getsize(self.pack_path) != manifest['pack_size']):
+                return False
+            current = HelpPack.listPages(self.help_dir)
+            for chapter in set(current) | set(manifest['chapters']):
+                built = [(page['file'], page['size'], page['mtime_ns'])
+                    for page in manifest['chapters'].get(chapter, [])]
+                if built != [(page['file'], page['size'], page['mtime_ns'])
+                        for page in current.get(chapter, [])]:
+                    return False
+            # map the pack read-only
+            self.File = open(self.pack_path, 'rb')
+            self.map = mmap.mmap(self.File.fileno(), 0, access = mmap.ACCESS_READ)
+            self.manifest = manifest
+            return True
+        # missing or damaged pack
+        except (OSError, ValueError, KeyError):
+            self.close()
+            return False
+
+    def pageFiles(self, chapter):
+        """Returns the page image paths of a chapter in the manifest's page order."""
+        return [os.path.join(self.help_dir, page['file'])
+            for page in self.manifest['chapters'].get(str(chapter), [])]
+
+    def page(self, chapter, page):
+        """Returns a page straight from the mapped pack (no decoding, no copy).
+
+        -> (width, height, memoryview of floats)
+        """
+        # find the page in the offset index
+        entry = self.manifest['chapters'][str(chapter)][page]
+        # view its floats in the mapped pack
+        data = memoryview(self.map)[entry['offset']:entry['offset'] + entry['length']].cast('f')
+        # return the texture inputs
+        return (entry['width'], entry['height'], data)
+
+    def close(self):
+        """Releases the memory map."""
+        # unmap
+        if self.map is not None:
+            try:
+                self.map.close()
+            # views of the pack are still held by textures being created
+            except BufferError:
+                return
+            self.map = None
+        # close the file
+        if self.File is not None:
+            self.File.close()
+            self.File = None
+        self.manifest = None
@@ -0,0 +1,134 @@
+"""Help Page Caches keep a bounded set of help page textures and decode the neighbouring pages in the background."""
+
+import os as os
+import re as re
+from queue import Queue
+from threading import Thread, Lock
+from collections import OrderedDict
+
+# KIM Interface Help Page Cache Class
+class HelpPageCache:
+    # default constructor
+    def __init__(self, dpg, help_dir, chapters, capacity = 6, pack = None):
+        self.dpg = dpg
+        self.help_dir = help_dir
+        # pre-decoded pages (used while current; otherwise the JPGs are decoded)
+        self.pack = pack
+        self.chapters = chapters
+        self.capacity = capacity
+        # chapter -> page image paths (in page order)
+        self.files = {}
+        # (chapter, page) -> texture tag, least recently used first
+        self.textures = OrderedDict()
+        # (chapter, page) -> (width, height, data) decoded ahead by the prefetch thread
+        self.decoded = OrderedDict()
+        self.lock = Lock()
+        self.requests = Queue()
+        self.thread = None
+        self.registry = None
+        self.hits = 0
+        self.misses = 0
+
+    # default print
+    def __str__(self):
+        return f"Help Page Cache {len(self.textures)}/{self.capacity} textures ({self.hits} hits / {self.misses} misses)"
+
+    @staticmethod
+    def pageOrder(name):
+        """Sort key that puts "...images-9.jpg" before "...images-10.jpg"."""
+        return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+    def pageFiles(self, chapter):
+        """Returns the page image paths of a chapter in page order (listed once)."""
+        # list the chapter folder once (the pack's manifest already holds the order)
+        if (chapter not in self.files) and (self.pack is not None) and self.pack.load():
+            self.files[chapter] = self.pack.pageFiles(chapter)
+        elif chapter not in self.files:
+            folder = os.path.join(self.help_dir, "chap" + str(chapter))
+            names = sorted((name for name in os.listdir(folder) if name.lower().endswith(".jpg")),
+                key = HelpPageCache.pageOrder) if os.path.isdir(folder) else []
+            self.files[chapter] = [os.path.join(folder, name) for name in names]
+        # return the pages
+        return self.files[chapter]
+
+    def pageCount(self, chapter):
+        """Returns the number of pages in a chapter."""
+        return len(self.pageFiles(chapter))
+
+    def decode(self, chapter, page):
+        """Decodes one page image (any thread); pages in a current pack are not decoded.
+
+        -> (width, height, data)
+        """
+        # map the page out of the pack
+        if (self.pack is not None) and self.pack.load():
+            return self.pack.page(chapter, page)
+        # decode the JPG
+        width, height, channels, data = self.dpg.load_image(self.pageFiles(chapter)[page])
+        # return the texture inputs
+        return (width, height, data)
+
+    def getTexture(self, chapter, page):
+        """Returns the texture tag of a page, creating it from the prefetched decode if
+        possible and freeing the least recently used texture past capacity. UI thread only.
+        """
+        # the texture is cached
+        key = (chapter, page)
+        if key in self.textures:
+            self.hits += 1
+            self.textures.move_to_end(key)
+            return self.textures[key]
+        # use the prefetched decode, or decode now (or map it from the pack)
+        self.misses += 1
+        with self.lock:
+            decoded = self.decoded.pop(key, None)
+        if decoded is None:
+            decoded = self.decode(chapter, page)
+        # create the texture registry once
+        if self.registry is None:
+            self.registry = self.dpg.add_texture_registry()
+        # create the texture
+        self.textures[key] = self.dpg.add_static_texture(width = decoded[0], height = decoded[1],
+            default_value = decoded[2], parent = self.registry)
+        # free the least recently used textures past capacity
+        while len(self.textures) > self.capacity:
+            old_key, old_texture = self.textures.popitem(last = False)
+            self.dpg.delete_item(old_texture)
+        # return the texture
+        return self.textures[key]
+
+    def prefetch(self, chapter, page):
+        """Queues the next and previous pages and the first pages of the next and previous
+        chapters for decoding in the background."""
+        # pages in the pack need no decoding
+        if (self.pack is not None) and self.pack.load():
+            return
+        # the neighbours of the page
+        neighbours = [(chapter, page + 1), (chapter, page - 1), (chapter + 1, 0), (chapter - 1, 0)]
+        for key in neighbours:
+            # only pages that exist
+            if (1 <= key[0] <= self.chapters) and (0 <= key[1] < self.pageCount(key[0])):
+                self.requests.put(key)
+        # start the prefetch thread once
+        if self.thread is None:
+            self.thread = Thread(target = self.run, name = "HelpPrefetch", daemon = True)
+            self.thread.start()
+
+    def run(self):
+        """Prefetch thread: decodes requested pages that are not cached yet."""
+        while True:
+            key = self.requests.get()
+            # already a texture or decoded
+            with self.lock:
+                if (key in self.textures) or (key in self.decoded):
+                    continue
+            # decode off the UI thread
+            try:
+                decoded = self.decode(key[0], key[1])
+            except Exception:
+                continue
+            # keep the newest decodes (as many as there are neighbours)
+            with self.lock:
+                self.decoded[key] = decoded
+                while len(self.decoded) > 4:
+                    self.decoded.popitem(last = False)
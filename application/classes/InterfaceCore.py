@@ -0,0 +1,584 @@
+"""Interface Cores hold the KIM Interface configuration, its commits and its backups, with no GUI attached."""
+
+import os as os
+from json import loads, dumps
+from datetime import datetime
+from classes.Model import Model as Model
+from classes.Machine import Machine as Machine
+from classes.MappingConfiguration import MappingConfiguration as MappingConfiguration
+from classes.ConfigCache import ConfigCache as ConfigCache
+from classes.ConfigIndex import ConfigIndex as ConfigIndex
+from classes.ConfigFileStore import ConfigFileStore as ConfigFileStore
+from classes.ShardedConfigStore import ShardedConfigStore as ShardedConfigStore
+from classes.SqliteConfigStore import SqliteConfigStore as SqliteConfigStore
+from classes.ChangelogWriter import ChangelogWriter as ChangelogWriter
+from classes.CommitPipeline import CommitPipeline as CommitPipeline
+from classes.ConfigJournal import ConfigJournal as ConfigJournal
+from classes.LookupArtifact import LookupArtifact as LookupArtifact
+from classes.ConfigLinter import ConfigLinter as ConfigLinter
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+from classes.BackupStore import BackupStore as BackupStore
+from classes.BackupWorker import BackupWorker as BackupWorker
+from classes.ConfigDiff import ConfigDiff as ConfigDiff
+from classes.UndoLog import UndoLog as UndoLog
+
+# KIM Interface Core Class
+class InterfaceCore:
+    # number of past backups kept (by default)
+    PAST_BACKUPS = 25
+    # seconds a session end waits for its backup (by default)
+    BACKUP_EXIT_TIMEOUT = 30
+    # number of commits that can be undone (by default)
+    UNDO_DEPTH = 50
+
+    # default constructor
+    def __init__(self, env_dir, user, config_storage = "file", journal_compaction_bytes = 0,
+            backup_retention = None, undo_depth = UNDO_DEPTH):
+        self.env_dir = env_dir
+        self.user = user
+        self.config_storage = config_storage
+        # the single config file the KIM Interface reads
+        self.config_path = os.path.join(env_dir, "config", "KIM_interface_configuration.json")
+        # the compiled getvalue lookups
+        self.lookup_path = os.path.join(env_dir, "config", "KIM_interface_lookup.bin")
+        # the config backups
+        self.backups_dir = os.path.join(env_dir, "config", "backups")
+        # create the config store (one JSON file, a manifest plus one shard per model,
+        # or an SQLite database)
+        if config_storage == "sharded":
+            self.store = ShardedConfigStore(os.path.join(env_dir, "config", "sharded"))
+        elif config_storage == "sqlite":
+            self.store = SqliteConfigStore(os.path.join(env_dir, "config",
+                "KIM_interface_configuration.db"))
+        else:
+            self.store = ConfigFileStore(self.config_path)
+        # the single config file the KIM Interface reads, written after every commit when the
+        # store is not that file
+        self.interface_file = None if config_storage not in ("sharded", "sqlite") \
+            else ConfigFileStore(self.config_path)
+        # create the config journal (write-ahead log of commits not yet in the store); the
+        # single file store is the file the KIM Interface reads, so it is always written through
+        self.journal = ConfigJournal(os.path.join(env_dir, "config",
+            "KIM_interface_configuration.journal"), journal_compaction_bytes
+            if config_storage in ("sharded", "sqlite") else 0)
+        # create the config cache (re-reads the store only when it changes on disk)
+        self.cache = ConfigCache(self.store, self.journal)
+        # create the changelog writer (kept open for the session; a record per commit, in
+        # compressed and indexed segments)
+        self.changelog = ChangelogWriter(os.path.join(env_dir, "logs", "changelog"), user)
+        # create the commit pipeline (journals each commit; rewrites the store on compaction)
+        self.pipeline = CommitPipeline(self.store, self.cache, self.changelog, self.journal, user)
+        # create the undo log of the user (the patches of their recent commits; journaled, so
+        # it survives a restart)
+        self.undo_log = UndoLog(os.path.join(env_dir, "config", "undo", "".join(character
+            if character.isalnum() or character in "-_." else "_" for character in str(user))
+            + ".journal"), undo_depth)
+        # create the memo of compiled getvalue lookups (unchanged configs are not recompiled)
+        self.lookup_memo = {}
+        # create the config linter (keeps the findings of each model for incremental runs)
+        self.linter = ConfigLinter(os.path.join(env_dir, "config", "KIM_interface_lint.json"))
+        # create the backup store (compressed snapshots; unchanged models are stored once)
+        self.backups = BackupStore(self.backups_dir)
+        # the backup limits (0 or None: no limit; the latest backup is always kept)
+        self.backup_retention = {"count":InterfaceCore.PAST_BACKUPS + 1, "days":0, "bytes":0}
+        self.backup_retention.update(backup_retention or {})
+        # create the backup worker (backs up and applies the limits off the calling thread)
+        self.backup_worker = BackupWorker()
+        # seconds the GUI waits for the backup at exit (set by fromManagerConfig)
+        self.backup_exit_timeout = InterfaceCore.BACKUP_EXIT_TIMEOUT
+        # the KIM Interface version (set by fromManagerConfig)
+        self.version = None
+        self.version_date = None
+
+    # default print
+    def __str__(self):
+        return f"Interface Core {self.env_dir} ({self.config_storage} storage)"
+
+    @staticmethod
+    def fromManagerConfig(env_dir, user):
+        """fromManagerConfig(env_dir, user)
+
+        env_dir: str; the application folder (holding KIM_interface_manager_config.json).
+        user: str; the user signature of commits and backups.
+
+        Creates the core with the storage, journal, backup and undo settings of the KIM
+        Interface Manager configuration file.
+
+        -> InterfaceCore
+        """
+        # open the KIM Interface Manager configuration file
+        File = open(os.path.join(env_dir, "KIM_interface_manager_config.json"), 'r')
+        # read it and convert from JSON to Dict
+        Manager_Config_File = loads(File.read())
+        # close it
+        File.close()
+        # create the core
+        Core = InterfaceCore(env_dir, user, Manager_Config_File.get('config_storage', "file"),
+            Manager_Config_File.get('journal_compaction_bytes', 0),
+            {"count":Manager_Config_File.get('backup_count', InterfaceCore.PAST_BACKUPS + 1),
+            "days":Manager_Config_File.get('backup_days', 0),
+            "bytes":Manager_Config_File.get('backup_bytes', 0)},
+            Manager_Config_File.get('undo_depth', InterfaceCore.UNDO_DEPTH))
+        # save the seconds to wait for the backup at exit
+        Core.backup_exit_timeout = Manager_Config_File.get('backup_exit_timeout',
+            InterfaceCore.BACKUP_EXIT_TIMEOUT)
+        # save the version number and date
+        Core.version = Manager_Config_File['version']
+        Core.version_date = Manager_Config_File['version_date']
+        # return the core
+        return Core
+
+    ### Session
+    def verifyFolders(self):
+        """Creates the config folder, an empty config file, the backup folder and the
+        changelog folder if they do not exist yet (first run); the lines of the old text
+        changelog are imported into the changelog once."""
+        # verify the config, backups and changelog folders
+        os.makedirs(self.backups_dir, exist_ok = True)
+        os.makedirs(self.changelog.directory, exist_ok = True)
+        # verify the KIM_interface_configuration.json file
+        try:
+            # create the file (first run)
+            File = open(self.config_path, 'x')
+            # write an empty config
+            File.write(dumps({"timestamp":str(str(datetime.now()) + " | " + str(self.user)),
+                "models":[]}, indent = 4))
+            File.close()
+        except FileExistsError:
+            # file exists
+            pass
+        # import the old changelog.txt (once)
+        self.changelog.index.importLegacy(os.path.join(self.env_dir, "logs", "changelog.txt"))
+
+    def startup(self, background_backup = False):
+        """startup(background_backup = False)
+
+        background_backup: (optional) bool; take the backup on the backup worker.
+
+        Prepares the configuration for a session: fills a new sharded or SQLite store,
+        folds the journal in, refreshes the single config file and the getvalue lookups,
+        and takes a backup."""
+        # verify the sharded or SQLite config (first run with that storage)
+        if (self.config_storage != "file") and (not self.store.exists()):
+            # load the single config file into the store
+            self.store.importFile(self.config_path)
+        # fold any journaled commits into the store
+        self.pipeline.compact()
+        # refresh the single config file from the store
+        self.exportInterfaceConfig()
+        # compile the getvalue lookups
+        self.emitLookupArtifact()
+        # create a backup
+        self.createConfigBackup(background_backup)
+
+    def shutdown(self, backup_timeout = None):
+        """shutdown(backup_timeout = None)
+
+        backup_timeout: (optional) float; the most seconds to wait for the backups
+            (None waits until they are done).
+
+        Ends a session: folds the journal in, refreshes the single config file and the
+        getvalue lookups, takes a backup and releases the changelog and store. A backup cut short by the timeout
+        leaves the store as it was before it (objects are indexed only once written).
+
+        -> bool; True if every backup finished.
+        """
+        # fold the journal into the store (the Interface reads the config file)
+        self.pipeline.compact()
+        # refresh the single config file from the store
+        self.exportInterfaceConfig()
+        # compile the getvalue lookups
+        self.emitLookupArtifact()
+        # create a new backup (after any backup still running) and wait for it
+        self.createConfigBackup(background = True)
+        finished = self.backup_worker.wait(backup_timeout)
+        # release the changelog and store
+        self.close()
+        # return whether the backups finished
+        return finished
+
+    def close(self):
+        """Releases the changelog and store without ending the session (for read-only use:
+        nothing is folded, exported or backed up)."""
+        # close the changelog
+        self.changelog.close()
+        # close the config store
+        self.store.close()
+
+    ### Config File Management
+    def openConfigFile(self):
+        """Returns the Dict Object of the current KIM Interface configuration
+        (re-read only when its store changes on disk)."""
+        return self.cache.getDocument()
+
+    def commitOperations(self, operations, action):
+        """commitOperations(operations, action)
+
+        operations: [ConfigOperation]; the keyed add/replace/remove operations of one commit.
+        action: str; a plaintext description of the action performed.
+
+        Applies the operations to the current configuration, journals them as one record,
+        logs the action and adds the commit to the undo log.
+
+        -> {"action", "bytes", "seconds", "compacted"}
+        """
+        # commit the operations
+        report = self.applyOperations(operations, action)
+        # the commit can be undone
+        self.undo_log.record(action, self.pipeline.last_patches)
+        # return the commit report
+        return report
+
+    def applyOperations(self, operations, action, expected = None):
+        """applyOperations(operations, action, expected = None)
+
+        expected: (optional) [dict]; the patch each target must still match (see
+            CommitPipeline.commitOperations).
+
+        Commits operations like commitOperations, without adding them to the undo log.
+
+        -> {"action", "bytes", "seconds", "compacted"}
+        """
+        # note the models the operations change (read before they are applied)
+        document = self.cache.getDocument()
+        positions = self.cache.getPositions()
+        touched = set(ConfigOperation.modelKey(document, operation, positions)
+            for operation in operations)
+        # apply, journal and log the operations
+        report = self.pipeline.commitOperations(operations, action, expected)
+        # the KIM Interface reads the change right away (only the changed models are serialized)
+        self.exportInterfaceConfig(self.pipeline.last_keys)
+        # the linter re-checks the changed models on its next incremental run
+        self.linter.touch(touched)
+        # return the commit report
+        return report
+
+    def commit(self, new_config_object, action):
+        """commit(new_config_object, action)
+
+        new_config_object: dict; a whole edited configuration.
+        action: str; a plaintext description of the action performed.
+
+        Stamps and writes a whole configuration once (objects without a key get one) and logs
+        the action. Earlier commits can no longer be
+        undone (there is no patch to undo the whole configuration with).
+
+        -> {"action", "bytes", "seconds", "compacted"}
+        """
+        # give new (imported or restored) objects a persistent key, like a load does
+        ConfigIndex.assignKeys(new_config_object)
+        # stamp, write and log the new config in a single pass
+        report = self.pipeline.commit(new_config_object, action)
+        # the KIM Interface reads the new config right away
+        self.exportInterfaceConfig()
+        # the undo log cannot cross it
+        self.undo_log.clear()
+        # the linter re-checks every model on its next incremental run
+        self.linter.touch(None)
+        # return the commit report
+        return report
+
+    def emitLookupArtifact(self):
+        """Compiles the current configuration into the getvalue lookup artifact (at startup
+        and shutdown; the stand-in recompiles it when the config file changes in between).
+
+        -> int; the number of bytes written.
+        """
+        # compile and replace the artifact
+        return LookupArtifact.write(self.lookup_path, self.openConfigFile(), self.lookup_memo)
+
+    def exportInterfaceConfig(self, dirty = None):
+        """exportInterfaceConfig(dirty)
+
+        dirty: (optional) set; keys of the objects changed since the last export (None
+            serializes every model).
+
+        With sharded or SQLite storage, writes the current configuration to the single
+        config file the KIM Interface reads. Does nothing with single-file storage.
+
+        -> int; the number of bytes written.
+        """
+        # the single file is the store
+        if self.interface_file is None:
+            return 0
+        # export the current config (store + journal)
+        return self.interface_file.write(self.openConfigFile(), dirty)
+
+    def lintConfig(self, incremental = False):
+        """lintConfig(incremental = False)
+
+        incremental: (optional) bool; only re-check models changed since the last run.
+
+        Checks the whole current configuration (see ConfigLinter).
+
+        -> {"findings", "models", "checked", "reused", "parallel", "seconds"}
+        """
+        return self.linter.lint(self.openConfigFile(), incremental)
+
+    def undoCommit(self, redo = False):
+        """undoCommit(redo = False)
+
+        redo: (optional) bool; redo the last undone commit instead.
+
+        Undoes the user's last commit (or redoes the last undone one) as a new commit of the
+        operations that reverse its patches; only the objects it changed are read. A KeyError
+        is raised and nothing is changed if an object it changed is gone or was changed
+        since, or if a name or ID it puts back is now taken.
+
+        -> {"action", "bytes", "seconds", "compacted"} | None; None if there is nothing to undo.
+        """
+        entry = self.undo_log.peek(redo)
+        if entry is None:
+            return None
+        # the inverse of each operation, last first (fields are put back over the current values)
+        document = self.cache.getDocument()
+        positions = self.cache.getPositions()
+        pending = {}
+        patches = [loads(patch) for patch in reversed(entry['patches'])]
+        operations = [ConfigOperation.invert(document, patch, positions, pending) for patch in patches]
+        # commit them like any other change (each object must still be as the commit left it)
+        report = self.applyOperations(operations, ("Redo: " if redo else "Undo: ") + entry['action'],
+            patches)
+        # the patches of this commit reverse it
+        self.undo_log.reversed(redo, entry['action'], self.pipeline.last_patches)
+        return report
+
+    ### Object-Returning Functions
+    @staticmethod
+    def getConfigs(machine):
+        """Returns the list of Config objects of a Machine (built from its config Dicts).
+
+        -> [config]
+        """
+        # create a list to hold the config objects
+        configs = []
+        for curr in machine.mapping_configurations:
+            # create a config object (copy the mappings; the config Dict is cached)
+            configs.append(MappingConfiguration(curr['id'],
+                [dict(mapping) for mapping in curr['mappings']], machine, key = curr.get('key')))
+        # return configs list
+        return configs
+
+    @staticmethod
+    def getMachines(model, get_configs):
+        """Returns the list of Machine objects of a Model (built from its machine Dicts).
+
+        get_configs: bool; indicate whether to get config objects.
+
+        -> [machine]
+        """
+        # create a list to hold the machine objects
+        machines = []
+        for curr in model.machines:
+            # create a machine object (copy the measurement list; the config Dict is cached)
+            TempMachine = Machine(curr['name'], list(curr['measurements']),
+                curr['mapping_configurations'], model, key = curr.get('key'))
+            # fix machine measurement character issues
+            for j in range(len(TempMachine.measurements)):
+                TempMachine.measurements[j] = TempMachine.measurements[j].replace(
+                    'Ã˜', 'Ø').replace('Â±', '±')
+            # if the get configs flag is set
+            if get_configs:
+                # add the machine's Configs to its Configs attribute
+                TempMachine.mapping_configurations = InterfaceCore.getConfigs(TempMachine)
+            # append that object to the list
+            machines.append(TempMachine)
+        # return machines list
+        return machines
+
+    @staticmethod
+    def hydrateModels(Interface_Config_File, get_machines, get_configs):
+        """hydrateModels(Interface_Config_File, get_machines, get_configs)
+
+        Converts the Dict Object of the KIM Interface config into a list of Models.
+        The config Dict is left untouched so it can stay cached.
+
+        -> [model]
+        """
+        # create a list to hold the model objects
+        models = []
+        for curr in Interface_Config_File['models']:
+            # create a new model object (copy the base information; the config Dict is cached)
+            TempModel = Model(curr['name'], list(curr['base_information']), curr['machines'],
+                key = curr.get('key'))
+            # if the get_machines flag is set
+            if get_machines:
+                # add the model's Machines to its Machines attribute
+                TempModel.machines = InterfaceCore.getMachines(TempModel, get_configs)
+            # append the model to the models list
+            models.append(TempModel)
+        # return models list
+        return models
+
+    def getModels(self, get_machines, get_configs):
+        """Returns the list of Models in the current configuration (hydrated once per load).
+
+        -> [model]
+        """
+        return self.cache.getModels(get_machines, get_configs, InterfaceCore.hydrateModels)
+
+    def getConfigIndex(self):
+        """Returns the name/ID lookup index of the current configuration (built once per load).
+
+        -> ConfigIndex
+        """
+        return self.cache.getIndex(InterfaceCore.hydrateModels)
+
+    def getValidationIndex(self):
+        """Returns the model names, machine names and config IDs in use (kept current by
+        commits; built once per load).
+
+        -> ValidationIndex
+        """
+        return self.cache.getValidationIndex()
+
+    def getModel(self, name):
+        """Returns the Model with a name, or None."""
+        return self.getConfigIndex().getModel(name)
+
+    def getMachine(self, name, model = None):
+        """Returns the Machine with a name (within a model if passed), or None."""
+        return self.getConfigIndex().getMachine(name, model = model)
+
+    def getConfig(self, id_num, machine = None):
+        """Returns the Config with an ID (within a machine if passed), or None."""
+        return self.getConfigIndex().getConfig(id_num, machine = machine)
+
+    ### Changelog
+    def changeHistory(self, start = None, end = None, user = None, key = None):
+        """changeHistory(start = None, end = None, user = None, key = None)
+
+        start: (optional) str; the earliest time ("2026-10-01" or a full time).
+        end: (optional) str; the time to stop before.
+        user: (optional) str; the user signature of the commits.
+        key: (optional) str; the key of a model, machine or config (changes of the machines
+            and configs below it are included).
+
+        Returns the changelog records of the commits that match (only the segments the
+        changelog index lists for them are read).
+
+        -> [{"time", "user", "action", "type", "keys", "patch"}]; oldest first.
+        """
+        # commits of this session are on disk
+        self.changelog.flush()
+        return self.changelog.index.query(start, end, user, key)
+
+    ### Backup Management
+    def checkBackupCount(self, progress = None):
+        """checkBackupCount(progress = None)
+
+        progress: (optional) function(stage, done, total); called after each snapshot.
+
+        Keeps the newest snapshots within the backup limits (count, days and bytes; by
+        default the latest and 25 past snapshots) in one pass, and removes the objects
+        only the dropped snapshots used.
+
+        -> int; the number of objects removed.
+        """
+        return self.backups.retain(self.backup_retention['count'], self.backup_retention['days'],
+            self.backup_retention['bytes'], progress)
+
+    def storeConfigBackup(self, prepared, progress = None, latest = None):
+        """storeConfigBackup(prepared, progress = None, latest = None)
+
+        prepared: dict | None; the configuration serialized by BackupStore.prepare (None if
+            it did not change since the latest snapshot).
+        progress: (optional) function(stage, done, total); called after each object.
+        latest: (optional) dict; the index entry of the latest snapshot (when prepared is None).
+
+        Moves the full copies of older versions into the backup store (once), stores the
+        snapshot and applies the backup limits (run by the backup worker).
+
+        -> {"hash", "skipped", "objects", "bytes", "removed"}
+        """
+        # move the older latest.json and past copies into the store
+        self.backups.importLegacy(self.backups_dir)
+        # snapshot the config (nothing to hash or write if it did not change)
+        if prepared is None:
+            result = {"hash":latest['hash'], "skipped":True, "objects":0, "bytes":0}
+        else:
+            result = self.backups.store(prepared, progress = progress)
+        # drop the snapshots past the limits (snapshots also age while nothing changes)
+        result['removed'] = 0
+        if (not result['skipped']) or self.backup_retention['days']:
+            result['removed'] = self.checkBackupCount(progress)
+        # return what was written and removed
+        return result
+
+    def createConfigBackup(self, background = False):
+        """createConfigBackup(background = False)
+
+        background: (optional) bool; return right away (see backup_worker for the progress
+            and report) instead of waiting for the backup.
+
+        Snapshots the current configuration into the backup store (unchanged models are
+        not written again; a configuration identical to the latest snapshot is skipped).
+        A configuration whose timestamp is that of the latest snapshot was not committed
+        since, so it is not serialized or hashed at all. Otherwise the configuration is
+        serialized here; the writes and the retention run on the backup worker, after any
+        backup still queued.
+
+        -> {"hash", "skipped", "objects", "bytes", "removed", "seconds"} | None
+        """
+        # nothing was committed since the latest snapshot (every commit stamps the config)
+        document = self.openConfigFile()
+        latest = self.backups.latest()
+        if (latest is not None) and (latest['timestamp'] == document.get('timestamp')):
+            prepared = None
+        # serialize the current config (later commits do not change the snapshot)
+        else:
+            prepared = self.backups.prepare(document)
+        # queue the backup
+        self.backup_worker.submit(lambda progress: self.storeConfigBackup(prepared, progress, latest))
+        if background:
+            return None
+        # wait for it (a failed backup raises here)
+        self.backup_worker.wait()
+        if self.backup_worker.error is not None:
+            raise self.backup_worker.error
+        return self.backup_worker.last_report
+
+    def backupModels(self, entry = None):
+        """Returns the (hash, model Dict | None) of every model of a snapshot (not loaded) or,
+        with no entry, of the current configuration (hashed like the backup store hashes)."""
+        # the models of a snapshot are named in its manifest
+        if entry is not None:
+            return [(name, None) for name in self.backups.models(entry)]
+        # the current models are hashed
+        return [(BackupStore.digest(BackupStore.serialize(model)), model)
+            for model in self.openConfigFile()['models']]
+
+    def diffBackups(self, old = None, new = None):
+        """diffBackups(old = None, new = None)
+
+        old: (optional) dict; the index entry of a snapshot (None: the current configuration).
+        new: (optional) dict; the same for the other side.
+
+        Compares two snapshots (or a snapshot and the current configuration) by model,
+        machine and config identity (see ConfigDiff.compare); models that did not change
+        are not read from the backup store.
+
+        -> [change]
+        """
+        return ConfigDiff.compare(self.backupModels(old), self.backupModels(new),
+            self.backups.readObject)
+
+    def restoreBackup(self, entry, changes = None):
+        """restoreBackup(entry, changes = None)
+
+        entry: dict; the index entry of the snapshot to restore.
+        changes: (optional) [change]; the changes of diffBackups(None, entry) to restore
+            (None restores the whole snapshot).
+
+        Restores a snapshot, or some of its changes, as one commit (a KeyError is raised and
+        nothing is changed if an object of a chosen change is gone since the diff).
+
+        -> {"action", "bytes", "seconds", "compacted"}
+        """
+        action = "Restore Backup: " + str(entry['time'])
+        # replace the whole configuration
+        if changes is None:
+            return self.commit(self.backups.read(entry), action)
+        # apply the chosen changes
+        return self.commitOperations([change['operation'] for change in changes],
+            action + " (" + str(len(changes)) + " changes)")
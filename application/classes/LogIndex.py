@@ -0,0 +1,111 @@
+"""Log Indexes map line numbers of a growing log file to byte offsets, so any page of the log can be read with one seek."""
+
+import os as os
+from array import array
+
+# KIM Interface Log Index Class
+class LogIndex:
+    # default constructor
+    def __init__(self, path, page_bytes = 65536):
+        self.path = path
+        self.page_bytes = page_bytes
+        self.reset()
+
+    # default print
+    def __str__(self):
+        return f"Log Index {self.path} ({self.lineCount()} lines)"
+
+    def reset(self):
+        """Forgets the indexed lines (the log was replaced or truncated)."""
+        # start offset of every line (the last entry starts the line being written)
+        self.offsets = array('Q', [0])
+        self.inode = None
+
+    def lineCount(self):
+        """Returns the number of complete lines indexed."""
+        return len(self.offsets) - 1
+
+    def update(self):
+        """Indexes the lines appended since the last update, reading the log in fixed-size pages.
+
+        -> int; the number of new lines (-1 if the log was replaced or truncated and re-indexed).
+        """
+        # no log yet
+        if not os.path.isfile(self.path):
+            self.reset()
+            return 0
+        # a replaced or truncated log is indexed again
+        stat = os.stat(self.path)
+        restarted = False
+        if (stat.st_ino != self.inode) or (stat.st_size < self.offsets[-1]):
+            restarted = self.inode is not None
+            self.reset()
+            self.inode = stat.st_ino
+        # nothing appended
+        if stat.st_size == self.offsets[-1]:
+            return -1 if restarted else 0
+        # scan the appended bytes page by page
+        before = len(self.offsets)
+        File = open(self.path, 'rb')
+        position = self.offsets[-1]
+        File.seek(position)
+        while True:
+            page = File.read(self.page_bytes)
+            if not page:
+                break
+            # every newline starts a new line
+            start = page.find(b"\n")
+            while start != -1:
+                self.offsets.append(position + start + 1)
+                start = page.find(b"\n", start + 1)
+            position += len(page)
+        File.close()
+        # return the number of new lines
+        return -1 if restarted else (len(self.offsets) - before)
+
+    def readLines(self, start, count):
+        """Returns up to count lines starting at line start (one seek, one read).
+
+        -> [str]
+        """
+        # clamp to the indexed lines
+        start = max(0, min(start, self.lineCount()))
+        end = max(start, min(start + count, self.lineCount()))
+        if start == end:
+            return []
+        # read the lines in one pass
+        File = open(self.path, 'rb')
+        File.seek(self.offsets[start])
+        data = File.read(self.offsets[end] - self.offsets[start])
+        File.close()
+        # split into lines (without their newlines)
+        return [line.rstrip("\r") for line in data.decode('utf-8', errors = 'replace').split("\n")[:-1]]
+
+    def search(self, text = None, date_from = None, date_to = None, start = 0):
+        """Returns the numbers of the lines (from line start) that match a filter, reading
+        the log a page of lines at a time.
+
+        text: (optional) str; a case-insensitive substring the line must contain.
+        date_from, date_to: (optional) str; bounds on the first field of the line
+            (an ISO date, so text order is date order); date_to includes the whole day.
+
+        -> array('L')
+        """
+        # create an array to hold the matches
+        matches = array('L')
+        needle = text.lower() if text else None
+        # read the log in pages of lines
+        page_lines = 4096
+        for first in range(start, self.lineCount(), page_lines):
+            for i, line in enumerate(self.readLines(first, page_lines)):
+                # text filter
+                if (needle is not None) and (needle not in line.lower()):
+                    continue
+                # date filter (first field)
+                if date_from or date_to:
+                    date = line.split(' ', 1)[0]
+                    if (date_from and (date < date_from)) or (date_to and (date[:len(date_to)] > date_to)):
+                        continue
+                matches.append(first + i)
+        # return the matching line numbers
+        return matches
@@ -0,0 +1,95 @@
+"""Log Views page through a Log Index, keeping only the rows that are on screen."""
+
+# KIM Interface Log View Class
+class LogView:
+    # default constructor
+    def __init__(self, index, rows):
+        self.index = index
+        self.rows = rows
+        # first row shown
+        self.top = 0
+        # keep the newest lines on screen as they are appended
+        self.follow = True
+        # active filter and the line numbers that match it (None shows every line)
+        self.filter = None
+        self.matches = None
+
+    # default print
+    def __str__(self):
+        return f"Log View {self.top}/{self.rowCount()} rows"
+
+    def rowCount(self):
+        """Returns the number of rows that can be shown (all lines, or the filter matches)."""
+        return self.index.lineCount() if self.matches is None else len(self.matches)
+
+    def lastTop(self):
+        """Returns the first row of the last page."""
+        return max(0, self.rowCount() - self.rows)
+
+    def setFilter(self, text = None, date_from = None, date_to = None):
+        """Filters the rows by text and/or date range (all empty clears the filter)."""
+        # no filter
+        if not (text or date_from or date_to):
+            self.filter = None
+            self.matches = None
+        # search the whole log once; later lines are searched as they arrive
+        else:
+            self.filter = {"text":text, "date_from":date_from, "date_to":date_to}
+            self.matches = self.index.search(start = 0, **self.filter)
+        # start at the end when following, otherwise at the top
+        self.top = self.lastTop() if self.follow else 0
+
+    def refresh(self):
+        """Indexes newly appended lines, filters them, and moves to the end when following.
+
+        -> bool; True if the rows shown may have changed.
+        """
+        # remember where the index ended
+        indexed = self.index.lineCount()
+        # index the appended lines
+        added = self.index.update()
+        # the log was replaced; index and filter it again
+        if added < 0:
+            if self.filter is not None:
+                self.matches = self.index.search(start = 0, **self.filter)
+            self.top = min(self.top, self.lastTop())
+        # filter only the new lines
+        elif (added > 0) and (self.filter is not None):
+            self.matches.extend(self.index.search(start = indexed, **self.filter))
+        # nothing changed
+        if added == 0:
+            return False
+        # keep the newest lines on screen
+        if self.follow:
+            self.top = self.lastTop()
+        return True
+
+    def scroll(self, delta):
+        """Moves the first row shown by delta rows (stops following if moved up)."""
+        self.top = max(0, min(self.top + delta, self.lastTop()))
+        self.follow = self.top == self.lastTop()
+
+    def jumpStart(self):
+        """Shows the first page."""
+        self.top = 0
+        self.follow = self.rowCount() <= self.rows
+
+    def jumpEnd(self):
+        """Shows the last page and follows new lines."""
+        self.top = self.lastTop()
+        self.follow = True
+
+    def visibleLines(self):
+        """Returns the rows on screen as (line number, text) pairs.
+
+        -> [(int, str)]
+        """
+        # unfiltered rows are consecutive lines (one read)
+        if self.matches is None:
+            lines = self.index.readLines(self.top, self.rows)
+            return [(self.top + i, line) for i, line in enumerate(lines)]
+        # filtered rows are read line by line (each one seek through the index)
+        visible = []
+        for number in self.matches[self.top:self.top + self.rows]:
+            visible.append((number, self.index.readLines(number, 1)[0]))
+        return visible
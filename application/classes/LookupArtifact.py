@@ -0,0 +1,191 @@
+"""Lookup Artifacts answer KIM Interface getvalue lookups (machine_name, mapping_config) without parsing the configuration."""
+
+import os as os
+import mmap as mmap
+from json import loads, dumps
+from struct import Struct
+from hashlib import blake2b
+
+# KIM Interface Lookup Artifact Class
+class LookupArtifact:
+    # file layout: header | offset table (sorted by key hash) | mapping payloads
+    MAGIC = b"KIMLKUP1"
+    HEADER = Struct("<8sI")
+    # key hash, payload offset, payload length
+    ENTRY = Struct("<QQI")
+
+    # default constructor
+    def __init__(self, path):
+        self.path = path
+        self.File = None
+        self.map = None
+        self.signature = None
+        self.count = 0
+
+    # default print
+    def __str__(self):
+        return f"Lookup Artifact {self.path} ({self.count} entries)"
+
+    @staticmethod
+    def urlName(machine_name):
+        """Returns a machine name the way generateURL writes it (spaces -> underscores)."""
+        return str(machine_name).replace(' ', '_')
+
+    @staticmethod
+    def hashKey(machine_name, config_id):
+        """Returns the 64-bit hash of a (URL machine name, config id) key."""
+        # the URL form of the machine name and the config id make up the key
+        key = (LookupArtifact.urlName(machine_name) + "\n" + str(config_id)).encode('utf-8')
+        # hash the key
+        return int.from_bytes(blake2b(key, digest_size = 8).digest(), 'little')
+
+    @staticmethod
+    def build(document, memo = None):
+        """Compiles a config Dict into the artifact bytes; one entry per (machine, config id),
+        first match wins like the Interface's own search.
+
+        memo: (optional) dict; payloads of earlier builds. Commits replace the Dicts they
+            change, so a config Dict seen before (same object, same machine) is not serialized again.
+
+        -> bytes
+        """
+        # create lists to hold the table and the payloads
+        table = []
+        payloads = []
+        seen = set()
+        # the payloads of this build (become the memo for the next one)
+        built = {}
+        # payloads start after the header and the table (sized once the entries are known)
+        offset = 0
+        for model in document['models']:
+            for machine in model['machines']:
+                # the machine name the getvalue URL asks for
+                url_name = LookupArtifact.urlName(machine['name'])
+                for config in machine['mapping_configurations']:
+                    # the key the getvalue URL asks for
+                    key = (url_name, str(config['id']))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    # reuse the payload of an unchanged config
+                    cached = memo.get(id(config)) if memo is not None else None
+                    if (cached is not None) and (cached[0] is config) and (cached[1] == machine['name']):
+                        payload, key_hash = cached[2], cached[3]
+                    # the ready-to-fill mapping list (with its key for verification)
+                    else:
+                        payload = dumps({"machine_name":key[0], "mapping_config":key[1],
+                            "machine":machine['name'], "mappings":config['mappings']},
+                            separators = (',', ':')).encode('utf-8')
+                        key_hash = LookupArtifact.hashKey(key[0], key[1])
+                    built[id(config)] = (config, machine['name'], payload, key_hash)
+                    table.append((key_hash, offset, len(payload)))
+                    payloads.append(payload)
+                    offset += len(payload)
+        # sort the table by hash for binary search
+        table.sort()
+        # shift the offsets past the header and table
+        base = LookupArtifact.HEADER.size + (len(table) * LookupArtifact.ENTRY.size)
+        # assemble the artifact
+        parts = [LookupArtifact.HEADER.pack(LookupArtifact.MAGIC, len(table))]
+        parts += [LookupArtifact.ENTRY.pack(key_hash, base + start, length)
+            for key_hash, start, length in table]
+        parts += payloads
+        # keep only the live payloads for the next build
+        if memo is not None:
+            memo.clear()
+            memo.update(built)
+        # return the artifact bytes
+        return b"".join(parts)
+
+    @staticmethod
+    def write(path, document, memo = None):
+        """Compiles a config Dict and replaces the artifact on disk in one step.
+
+        memo: (optional) dict; payloads of earlier builds (see build).
+
+        -> int; the number of bytes written.
+        """
+        # compile the artifact
+        data = LookupArtifact.build(document, memo)
+        # write the temporary file (the Manager and the stand-in both compile the artifact)
+        temporary = path + "." + str(os.getpid()) + ".tmp"
+        File = open(temporary, 'wb')
+        File.write(data)
+        File.close()
+        # replace the old artifact (open loaders keep their mapping of the old file)
+        os.replace(temporary, path)
+        # return the number of bytes written
+        return len(data)
+
+    def open(self):
+        """Maps the artifact into memory, re-mapping it if it was replaced since it was mapped."""
+        # get the signature of the artifact on disk
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        # the mapped artifact is current
+        if (self.map is not None) and (signature == self.signature):
+            return
+        # release the old mapping
+        self.close()
+        # map the artifact read-only
+        self.File = open(self.path, 'rb')
+        self.map = mmap.mmap(self.File.fileno(), 0, access = mmap.ACCESS_READ)
+        # check the header
+        magic, self.count = LookupArtifact.HEADER.unpack_from(self.map, 0)
+        if magic != LookupArtifact.MAGIC:
+            self.close()
+            raise ValueError("Not a KIM Interface lookup artifact: " + str(self.path))
+        # save the signature it was mapped at
+        self.signature = signature
+
+    def lookup(self, machine_name, config_id):
+        """Returns the mapping list for a getvalue request, reading only the offset table
+        entries on the search path and the one payload.
+
+        machine_name: str; the machine name (URL form or with spaces).
+        config_id: str; the mapping configuration id.
+
+        -> [{"item", "sheet", "cluster", "type", "value"}] | None
+        """
+        # map (or re-map) the artifact
+        self.open()
+        # the key being searched for
+        url_name = LookupArtifact.urlName(machine_name)
+        key_hash = LookupArtifact.hashKey(url_name, config_id)
+        # binary search the offset table for the first entry with the hash
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if LookupArtifact.ENTRY.unpack_from(self.map, self.entryOffset(middle))[0] < key_hash:
+                low = middle + 1
+            else:
+                high = middle
+        # check every entry with the hash (collisions are compared by key)
+        while low < self.count:
+            entry_hash, offset, length = LookupArtifact.ENTRY.unpack_from(self.map,
+                self.entryOffset(low))
+            if entry_hash != key_hash:
+                break
+            payload = loads(self.map[offset:offset + length])
+            if (payload['machine_name'] == url_name) and (payload['mapping_config'] == str(config_id)):
+                return payload['mappings']
+            low += 1
+        # no such machine / config
+        return None
+
+    def entryOffset(self, position):
+        """Returns the byte offset of an offset table entry."""
+        return LookupArtifact.HEADER.size + (position * LookupArtifact.ENTRY.size)
+
+    def close(self):
+        """Releases the memory map."""
+        # unmap
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        # close the file
+        if self.File is not None:
+            self.File.close()
+            self.File = None
+        self.signature = None
+        self.count = 0
@@ -2,16 +2,19 @@
 """Machines are virtualizations of specific Keyence IM Machines involved in production processes."""
 
 from json import dumps
+from uuid import uuid4
 from classes.MappingConfiguration import MappingConfiguration as MappingConfiguration
 
 # KIM Interface Machine Class
 class Machine:
     # default constructor
-    def __init__(self, name, measurements, mapping_configurations, model):
+    def __init__(self, name, measurements, mapping_configurations, model, key = None):
         self.name = name
         self.measurements = measurements
         self.mapping_configurations = mapping_configurations 
         self.model = model
+        # persistent internal identity (survives renames)
+        self.key = key if key else uuid4().hex
 
     # default print
     def __str__(self):
@@ -20,7 +23,8 @@ class Machine:
     def machineToDict(self):
         """Converts the object to a Dict that can be used in config writing/JSON conversion."""
         # create a dictionary to hold the object
-        to_dict = {"name":self.name, 
+        to_dict = {"key":self.key,
+                   "name":self.name, 
                    "measurements":self.measurements,
                    "mapping_configurations":[]}
         # for each config in the machine's config list
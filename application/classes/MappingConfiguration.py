@@ -2,14 +2,17 @@
 """Mapping Configurations instruct the Interface to send data to specific places on i-Reporter forms."""
 
 from json import dumps
+from uuid import uuid4
 
 # KIM Interface Mapping Configuration Class
 class MappingConfiguration:
     # default constructor
-    def __init__(self, id_num, mappings, machine):
+    def __init__(self, id_num, mappings, machine, key = None):
         self.id_num = id_num
         self.mappings = mappings
         self.machine = machine
+        # persistent internal identity (survives ID changes)
+        self.key = key if key else uuid4().hex
 
     # default print
     def __str__(self):
@@ -18,7 +21,8 @@ class MappingConfiguration:
     def configToDict(self):
         """Converts the object to a Dict that can be used in config writing/JSON conversion."""
         # create a dictionary to hold the object
-        to_dict = {"id":str(self.id_num), 
+        to_dict = {"key":self.key,
+                   "id":str(self.id_num), 
                    "mappings":self.mappings}
         # return the dictionary
         return to_dict
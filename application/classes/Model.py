@@ -2,15 +2,18 @@
 """Models are virtualizations of specific production processes."""
 
 from json import dumps
+from uuid import uuid4
 from classes.Machine import Machine as Machine
 
 # KIM Interface Model Class
 class Model:
     # default constructor
-    def __init__(self, name, base_information, machines):
+    def __init__(self, name, base_information, machines, key = None):
         self.name = name
         self.base_information = base_information
         self.machines = machines
+        # persistent internal identity (survives renames)
+        self.key = key if key else uuid4().hex
 
     # default print
     def __str__(self):
@@ -19,7 +22,8 @@ class Model:
     def modelToDict(self):
         """Converts the object to a Dict that can be used in config writing/JSON conversion."""
         # create a Dictionary to hold the Object
-        to_dict = {"name":self.name, 
+        to_dict = {"key":self.key,
+                   "name":self.name, 
                    "base_information":self.base_information,
                    "machines":[]}
         # add the machines in the machine list as dicts
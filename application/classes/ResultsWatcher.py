@@ -0,0 +1,113 @@
+"""Results Watchers follow results.txt from a background thread and hand new text to the UI through a queue."""
+
+import os as os
+from queue import Queue, Empty
+from threading import Thread, Event
+from time import perf_counter, time
+
+# KIM Interface Results Watcher Class
+class ResultsWatcher:
+    # invalid character readings of the results file and their replacements
+    FIXUPS = [('Ã˜', 'Ø'), ('Â±', '±')]
+
+    # default constructor
+    def __init__(self, path, interval = 0.5):
+        self.path = path
+        self.interval = interval
+        self.updates = Queue()
+        self.stopping = Event()
+        self.thread = None
+        # the last file signature read and its decoded text
+        self.signature = None
+        self.text = None
+        self.reads = 0
+        self.polls = 0
+
+    # default print
+    def __str__(self):
+        return f"Results Watcher {self.path} ({self.reads} reads / {self.polls} polls)"
+
+    def running(self):
+        """Returns True while the watcher thread is running."""
+        return (self.thread is not None) and self.thread.is_alive()
+
+    def start(self):
+        """Starts the watcher thread (reads the file right away)."""
+        # already running
+        if self.running():
+            return
+        # the cached text is still queued for a new view
+        if self.text is not None:
+            self.updates.put({"text":self.text, "latency":0.0, "read_at":time()})
+        # start polling
+        self.stopping.clear()
+        self.thread = Thread(target = self.run, name = "ResultsWatcher", daemon = True)
+        self.thread.start()
+
+    def stop(self):
+        """Stops the watcher thread (waits up to one poll interval for it)."""
+        # not running
+        if not self.running():
+            return
+        # signal and wait
+        self.stopping.set()
+        self.thread.join(self.interval * 2)
+
+    def run(self):
+        """Watcher thread: checks the file now and then once per interval until stopped."""
+        self.check()
+        while not self.stopping.wait(self.interval):
+            self.check()
+
+    def check(self):
+        """Re-reads the results file only if its stat signature changed; queues the new text.
+
+        -> bool; True if new text was queued.
+        """
+        # count the poll
+        self.polls += 1
+        # get the signature of the file (None if there is no file)
+        try:
+            stat = os.stat(self.path)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            signature = None
+        # unchanged
+        if (signature == self.signature) and (self.text is not None):
+            return False
+        # read and decode the file
+        start = perf_counter()
+        if signature is None:
+            text = "No results yet."
+        else:
+            try:
+                File = open(self.path, 'r')
+                text = File.read()
+                File.close()
+            # the file is being replaced; try again next poll
+            except OSError:
+                return False
+            # replace invalid character readings
+            for bad, good in ResultsWatcher.FIXUPS:
+                text = text.replace(bad, good)
+        latency = perf_counter() - start
+        # cache the decoded text
+        self.signature = signature
+        self.text = text
+        self.reads += 1
+        # hand it to the UI thread
+        self.updates.put({"text":text, "latency":latency, "read_at":time()})
+        return True
+
+    def latest(self):
+        """Returns the newest queued update (older ones are dropped), or None. Called by the UI thread.
+
+        -> {"text", "latency", "read_at"} | None
+        """
+        # drain the queue, keeping the newest update
+        update = None
+        while True:
+            try:
+                update = self.updates.get_nowait()
+            except Empty:
+                return update
@@ -0,0 +1,158 @@
+"""Runtime Stats keep running statistics of the KIM Interface runtime log, reading only what was appended since the last call."""
+
+import os as os
+from math import ceil, log
+from json import loads, dumps
+
+# KIM Interface Runtime Stats Class
+class RuntimeStats:
+    # relative accuracy of the quantile sketch (1%)
+    ACCURACY = 0.01
+
+    # default constructor
+    def __init__(self, log_path, sidecar_path):
+        self.log_path = log_path
+        self.sidecar_path = sidecar_path
+        self.gamma = (1 + RuntimeStats.ACCURACY) / (1 - RuntimeStats.ACCURACY)
+        self.reset()
+        self.loaded = False
+
+    # default print
+    def __str__(self):
+        return f"Runtime Stats {self.count} runs (offset {self.offset})"
+
+    def reset(self):
+        """Forgets everything read so far (the log was replaced or truncated)."""
+        self.inode = None
+        self.offset = 0
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        # sketch bucket -> count (runtimes of 0 or less are counted apart)
+        self.buckets = {}
+        self.zeros = 0
+
+    def load(self):
+        """Reads the sidecar left by an earlier session (a missing or damaged sidecar starts over)."""
+        # only once per session
+        self.loaded = True
+        try:
+            File = open(self.sidecar_path, 'r')
+            state = loads(File.read())
+            File.close()
+            # restore the running state
+            self.inode = state['inode']
+            self.offset = state['offset']
+            self.count = state['count']
+            self.total = state['total']
+            self.minimum = state['min']
+            self.maximum = state['max']
+            self.buckets = {int(bucket):count for bucket, count in state['buckets'].items()}
+            self.zeros = state['zeros']
+        except Exception:
+            self.reset()
+
+    def save(self):
+        """Writes the running state to the sidecar (replaced in one step)."""
+        # the running state
+        state = {"inode":self.inode, "offset":self.offset, "count":self.count, "total":self.total,
+            "min":self.minimum, "max":self.maximum, "zeros":self.zeros,
+            "buckets":{str(bucket):count for bucket, count in self.buckets.items()}}
+        # write and replace
+        File = open(self.sidecar_path + ".tmp", 'w')
+        File.write(dumps(state))
+        File.close()
+        os.replace(self.sidecar_path + ".tmp", self.sidecar_path)
+
+    def add(self, runtime):
+        """Adds one runtime to the running statistics."""
+        # running count / sum / min / max
+        self.count += 1
+        self.total += runtime
+        self.minimum = runtime if self.minimum is None else min(self.minimum, runtime)
+        self.maximum = runtime if self.maximum is None else max(self.maximum, runtime)
+        # the sketch bucket of the runtime (log scale; 1% relative error)
+        if runtime <= 0:
+            self.zeros += 1
+        else:
+            bucket = int(ceil(log(runtime, self.gamma)))
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def update(self):
+        """Parses only the lines appended to the runtime log since the last update.
+
+        -> int; the number of runs added.
+        """
+        # pick up the previous session's state
+        if not self.loaded:
+            self.load()
+        # no log yet
+        if not os.path.isfile(self.log_path):
+            return 0
+        # a replaced or truncated log starts over
+        stat = os.stat(self.log_path)
+        if (stat.st_ino != self.inode) or (stat.st_size < self.offset):
+            self.reset()
+            self.inode = stat.st_ino
+        # nothing appended
+        if stat.st_size == self.offset:
+            return 0
+        # read the appended tail
+        File = open(self.log_path, 'rb')
+        File.seek(self.offset)
+        tail = File.read(stat.st_size - self.offset)
+        File.close()
+        # only complete lines are consumed (a run being written is read next time)
+        end = tail.rfind(b"\n") + 1
+        added = 0
+        for line in tail[:end].decode('utf-8', errors = 'replace').split("\n"):
+            # skip blank lines
+            if not line.strip():
+                continue
+            # the tracked time of the run is the fourth field
+            try:
+                self.add(float(line.split(' ')[3]))
+                added += 1
+            # not a runtime line
+            except (IndexError, ValueError):
+                continue
+        # save the consumed offset
+        self.offset += end
+        if end:
+            self.save()
+        # return the number of runs added
+        return added
+
+    def quantile(self, fraction):
+        """Returns the runtime at a quantile (within 1%), or None if no runs are logged."""
+        # no runs
+        if self.count == 0:
+            return None
+        # the rank being searched for
+        rank = fraction * (self.count - 1)
+        # runtimes of 0 or less come first
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        # walk the buckets in order
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if rank < seen:
+                # the middle of the bucket, kept inside the observed range
+                value = 2 * (self.gamma ** bucket) / (self.gamma + 1)
+                return min(max(value, self.minimum), self.maximum)
+        # the top of the range
+        return self.maximum
+
+    def summary(self):
+        """Returns the statistics of every logged run (after reading the appended tail).
+
+        -> {"count", "mean", "min", "max", "p50", "p95", "p99"}
+        """
+        # read the new runs
+        self.update()
+        # return the summary (no mean without runs)
+        return {"count":self.count, "mean":(self.total / self.count) if self.count else None,
+            "min":self.minimum, "max":self.maximum, "p50":self.quantile(0.50),
+            "p95":self.quantile(0.95), "p99":self.quantile(0.99)}
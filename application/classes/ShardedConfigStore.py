@@ -0,0 +1,204 @@
+"""Sharded Config Stores keep the KIM Interface configuration as a manifest plus one JSON file per model."""
+
+import os as os
+from json import loads, dumps
+from classes.ConfigIndex import ConfigIndex as ConfigIndex
+
+# KIM Interface Sharded Config Store Class
+class ShardedConfigStore:
+    # default constructor
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self.shards_dir = os.path.join(directory, "models")
+        # model key -> (shard version, parsed model Dict)
+        self.shards = {}
+        self.shard_reads = 0
+        self.shard_writes = 0
+
+    # default print
+    def __str__(self):
+        return f"Sharded Config Store {self.directory} ({len(self.shards)} shards loaded)"
+
+    def shardPath(self, key):
+        """Returns the path of the shard that holds the model with the passed key."""
+        return os.path.join(self.shards_dir, str(key) + ".json")
+
+    @staticmethod
+    def statFile(path):
+        """Returns the (mtime, size, inode) signature of a file on disk."""
+        # stat the file
+        stat = os.stat(path)
+        # the signature changes whenever the file is rewritten or replaced
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    @staticmethod
+    def writeFile(path, text):
+        """Writes text to a temporary file and moves it over the path (readers never see
+        half a file).
+
+        -> int; the number of bytes written.
+        """
+        # write the temporary file
+        File = open(path + ".tmp", 'w')
+        File.write(text)
+        # save the number of bytes written
+        size = File.tell()
+        File.close()
+        # replace the old file in one step
+        os.replace(path + ".tmp", path)
+        # return the number of bytes written
+        return size
+
+    def exists(self):
+        """Returns True if the manifest exists."""
+        return os.path.isfile(self.manifest_path)
+
+    def signature(self):
+        """Returns the signature of the manifest (a single stat; every write rewrites the
+        manifest, which records the version of each shard). Shards edited by hand are not
+        detected; edit the config through the Manager or KIM_Config_Shards."""
+        # the manifest changes with every write
+        return self.statFile(self.manifest_path)
+
+    def readManifest(self):
+        """Reads the manifest: the timestamp and the key, name and shard of every model.
+
+        -> {"timestamp", "models":[{"key", "name", "shard", "version"}]}
+        """
+        # open the manifest
+        File = open(self.manifest_path, 'r')
+        # read and parse the manifest
+        manifest = loads(File.read())
+        # close
+        File.close()
+        # return the manifest
+        return manifest
+
+    def readModel(self, key, version = None):
+        """readModel(key, version = None)
+
+        key: str; the key of the model.
+        version: (optional) [int]; the shard version listed in the manifest (None stats
+            the shard).
+
+        Returns the model Dict with the passed key, parsing its shard only if it is not
+        loaded yet or was rewritten since it was loaded.
+
+        -> dict
+        """
+        # manifests written before shard versions were listed: stat the shard
+        path = self.shardPath(key)
+        version = self.statFile(path) if version is None else tuple(version)
+        # is the loaded shard still current?
+        loaded = self.shards.get(key)
+        if (loaded is not None) and (loaded[0] == version):
+            return loaded[1]
+        # open the shard
+        File = open(path, 'r')
+        # read and parse the shard
+        model = loads(File.read())
+        # close
+        File.close()
+        # count the parse
+        self.shard_reads += 1
+        # keep the parsed shard
+        self.shards[key] = (version, model)
+        # return the model Dict
+        return model
+
+    def read(self):
+        """Assembles the config Dict from the manifest and the shards (shards whose version
+        in the manifest is unchanged are not read again).
+
+        -> {"timestamp", "models"}
+        """
+        # read the manifest
+        manifest = self.readManifest()
+        # load each model in manifest order
+        models = [self.readModel(entry['key'], entry.get('version')) for entry in manifest['models']]
+        # return the config Dict
+        return {"timestamp":manifest['timestamp'], "models":models}
+
+    def write(self, document, dirty = None):
+        """Writes the shards of the changed models, then the manifest (with the version of
+        every shard), then removes the shards of removed models.
+
+        dirty: (optional) set; keys of the objects changed since the last write (with the key
+            of every changed model; None writes every shard).
+
+        -> int; the number of bytes written.
+        """
+        # make sure the shard folder exists
+        os.makedirs(self.shards_dir, exist_ok = True)
+        # count the bytes written
+        size = 0
+        # create a list to hold the manifest entries
+        entries = []
+        try:
+            for model in document['models']:
+                # only changed (or never written) models are rewritten
+                key = model['key']
+                if (dirty is None) or (key in dirty) or (key not in self.shards):
+                    path = self.shardPath(key)
+                    size += self.writeFile(path, dumps(model, indent = 4))
+                    self.shard_writes += 1
+                    # the written shard is loaded
+                    self.shards[key] = (self.statFile(path), model)
+                # list the model and its shard version in the manifest
+                entries.append({"key":key, "name":model['name'],
+                    "shard":"models/" + str(key) + ".json", "version":list(self.shards[key][0])})
+            # write the manifest last; it names the shards that make up the config
+            size += self.writeFile(self.manifest_path, dumps({"timestamp":document['timestamp'],
+                "models":entries}, indent = 4))
+        # the write failed; the loaded shards may hold unsaved edits
+        except Exception:
+            self.invalidate()
+            raise
+        # remove the shards of models that are no longer in the manifest
+        live = set(entry['key'] for entry in entries)
+        for name in os.listdir(self.shards_dir):
+            if name.endswith(".json") and (name[:-len(".json")] not in live):
+                os.remove(os.path.join(self.shards_dir, name))
+                self.shards.pop(name[:-len(".json")], None)
+        # return the number of bytes written
+        return size
+
+    def invalidate(self):
+        """Drops the loaded shards so the next read parses them from disk."""
+        self.shards = {}
+
+    def close(self):
+        """Releases the store (no shard is kept open)."""
+        pass
+
+    def importFile(self, path):
+        """Splits a single-file KIM Interface configuration into shards.
+
+        -> int; the number of models imported.
+        """
+        # open the single config file
+        File = open(path, 'r')
+        # read and parse the file
+        document = loads(File.read())
+        # close
+        File.close()
+        # shards are named by model key
+        ConfigIndex.assignKeys(document)
+        # write every shard and the manifest
+        self.write(document)
+        # return the number of models imported
+        return len(document['models'])
+
+    def exportFile(self, path, document = None):
+        """Writes the single-file KIM Interface configuration (the layout the KIM Interface reads).
+
+        document: (optional) config Dict; the config to export (defaults to the shards on disk).
+
+        -> int; the number of bytes written.
+        """
+        # assemble the config from the shards
+        if document is None:
+            document = self.read()
+        # write the single file in one pass
+        return self.writeFile(path, dumps(document, indent = 4))
@@ -0,0 +1,149 @@
+"""Sheet Importers turn the rows of a measurement/mapping sheet into machines and configs of a Config Batch, one machine at a time."""
+
+from collections import OrderedDict
+
+# KIM Interface Sheet Importer Class
+class SheetImporter:
+    # accepted column names -> field
+    COLUMNS = {"model":"model", "machine":"machine", "item":"item", "measurement":"item",
+        "config":"config", "configuration":"config", "sheet":"sheet", "cluster":"cluster"}
+
+    # default constructor
+    def __init__(self, batch):
+        self.batch = batch
+        # the machine being collected: name, model, first row, measurements (and their set),
+        # config -> maps
+        self.group = None
+        self.machines = 0
+        self.configs = 0
+
+    # default print
+    def __str__(self):
+        return f"Sheet Importer {self.machines} machines / {self.configs} configs"
+
+    def fail(self, number, message):
+        """Records an error against a sheet row.
+
+        -> False
+        """
+        self.batch.rows = number
+        return self.batch.fail(message)
+
+    def importRecords(self, records):
+        """importRecords(records)
+
+        records: iterable of (row number, {header: text}); see SheetReader.records().
+
+        Reads the sheet in one pass. Each row names a machine (and its model), an item
+        (a measurement spec of the machine, added if it is new, or a base information
+        field of the model) and optionally a config with the sheet/cluster the item maps
+        to. Rows are checked as they are read; the rows of each machine are validated
+        into the batch when the next machine starts.
+
+        -> ConfigBatch; the batch (see its operations and errors).
+        """
+        for number, record in records:
+            # name the fields
+            row = {}
+            for header, text in record.items():
+                if header in SheetImporter.COLUMNS:
+                    row[SheetImporter.COLUMNS[header]] = text
+            # check the row on its own
+            if not self.checkRow(number, row):
+                continue
+            # a new machine starts; validate the one before it
+            if (self.group is None) or (self.group['machine'] != row['machine']):
+                self.flush()
+                self.group = {"machine":row['machine'], "model":row.get('model'), "row":number,
+                    "measurements":[], "seen":set(), "configs":OrderedDict()}
+            # the same machine under another model
+            elif row.get('model') and self.group['model'] and (row['model'] != self.group['model']):
+                self.fail(number, "Machine " + row['machine'] + " is listed under models "
+                    + self.group['model'] + " and " + row['model'] + ".")
+                continue
+            # collect the item
+            self.collect(row)
+        # validate the last machine
+        self.flush()
+        # return the batch
+        return self.batch
+
+    def checkRow(self, number, row):
+        """Checks the fields of one row.
+
+        -> bool
+        """
+        # a row needs a machine and an item
+        if not row.get('machine'):
+            return self.fail(number, "The machine column is empty.")
+        if not row.get('item'):
+            return self.fail(number, "The item (measurement) column is empty.")
+        # a map needs a config, a sheet and a cluster
+        mapped = [bool(row.get('config')), bool(row.get('sheet')), bool(row.get('cluster'))]
+        if any(mapped) and not all(mapped):
+            return self.fail(number, "Mapped items need a config, a sheet and a cluster.")
+        # sheet and cluster numbers
+        if all(mapped) and not (row['sheet'].isdigit() and row['cluster'].isdigit()):
+            return self.fail(number, "Sheet and cluster must be whole numbers.")
+        return True
+
+    def collect(self, row):
+        """Adds the item (and its map) of a row to the machine being collected."""
+        group = self.group
+        # keep the model named by any row of the machine
+        if not group['model']:
+            group['model'] = row.get('model')
+        # measurements are added in sheet order (each once)
+        if row['item'] not in group['seen']:
+            group['seen'].add(row['item'])
+            group['measurements'].append(row['item'])
+        # maps are collected per config
+        if row.get('config'):
+            group['configs'].setdefault(row['config'], []).append(
+                (row['item'], row['sheet'], row['cluster']))
+
+    def flush(self):
+        """Validates the collected machine into the batch: adds it (or its new
+        measurements), then adds its configs (or extends the maps of existing ones)."""
+        group = self.group
+        self.group = None
+        # nothing collected
+        if group is None:
+            return
+        # errors are reported against the machine's first row
+        self.batch.rows = group['row']
+        batch = self.batch
+        # items that are base information of the model are not measurements
+        found = batch.machine(group['machine'])
+        model = batch.model(group['model']) if group['model'] else None
+        if (model is None) and (found is not None):
+            model = batch.working['models'][batch.positions[found['key']][0]]
+        if model is None:
+            self.fail(group['row'], ("No model named " + group['model'] if group['model']
+                else "No model column") + " for new machine " + group['machine'] + ".")
+            return
+        base_information = set(model['base_information'])
+        measurements = [item for item in group['measurements'] if item not in base_information]
+        # add the machine, or its new measurements
+        if found is None:
+            if not batch.addMachine(model['name'], group['machine'], measurements):
+                return
+            self.machines += 1
+        else:
+            existing = set(found['measurements'])
+            new = [item for item in measurements if item not in existing]
+            if new and not batch.editMachine(group['machine'], values = found['measurements'] + new):
+                return
+        # add the configs, or extend the maps of configs that exist
+        machine = batch.machine(group['machine'])
+        for id_num, maps in group['configs'].items():
+            existing = batch.config(machine, id_num)
+            if existing is None:
+                if batch.addConfig(group['machine'], id_num, maps):
+                    self.configs += 1
+                continue
+            # the sheet's maps replace the maps of the same items
+            mapped = set(item for item, sheet, cluster in maps)
+            kept = [(mapping['item'], mapping['sheet'], mapping['cluster'])
+                for mapping in existing['mappings'] if mapping['item'] not in mapped]
+            batch.editConfig(group['machine'], id_num, mappings = kept + maps)
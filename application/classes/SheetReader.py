@@ -0,0 +1,148 @@
+"""Sheet Readers stream the rows of a CSV or XLSX file one at a time (an XLSX sheet is never loaded whole)."""
+
+import csv as csv
+import zipfile as zipfile
+from xml.etree.ElementTree import iterparse
+
+# KIM Interface Sheet Reader Class
+class SheetReader:
+    # XLSX XML namespaces
+    MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+    RELATIONSHIPS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+    PACKAGE = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+    # default constructor
+    def __init__(self, path, sheet = None):
+        self.path = path
+        # the XLSX sheet to read (None reads the first)
+        self.sheet = sheet
+        self.rows_read = 0
+
+    # default print
+    def __str__(self):
+        return f"Sheet Reader {self.path} ({self.rows_read} rows read)"
+
+    def isWorkbook(self):
+        """Returns True for XLSX files (everything else is read as CSV)."""
+        return self.path.lower().endswith((".xlsx", ".xlsm"))
+
+    def rows(self):
+        """Yields (row number, [cell text]) for every row of the file, in order."""
+        # pick the reader
+        source = self.workbookRows() if self.isWorkbook() else self.csvRows()
+        for number, cells in source:
+            self.rows_read += 1
+            yield (number, cells)
+
+    def records(self):
+        """Yields (row number, {header: cell text}) for every row below the header row.
+        Headers are lower-cased; blank rows are skipped."""
+        header = None
+        for number, cells in self.rows():
+            # skip blank rows
+            if not any(cell.strip() for cell in cells):
+                continue
+            # the first row names the columns
+            if header is None:
+                header = [cell.strip().lower() for cell in cells]
+                continue
+            # pair the cells with the headers
+            yield (number, {header[i]:cells[i].strip() if i < len(cells) else ""
+                for i in range(len(header)) if header[i]})
+
+    def csvRows(self):
+        """Yields the rows of a CSV file."""
+        File = open(self.path, 'r', encoding = 'utf-8-sig', newline = "")
+        try:
+            for number, cells in enumerate(csv.reader(File), start = 1):
+                yield (number, cells)
+        finally:
+            File.close()
+
+    @staticmethod
+    def columnIndex(reference, columns):
+        """Converts the column letters of a cell reference ("AB12") to a 0-based index.
+
+        columns: dict; letters -> index, filled as columns are seen (every row repeats them).
+        """
+        # the letters of the reference
+        letters = reference.rstrip("0123456789")
+        index = columns.get(letters)
+        # convert new letters once
+        if index is None:
+            index = 0
+            for letter in letters:
+                index = (index * 26) + (ord(letter) - 64)
+            index -= 1
+            columns[letters] = index
+        return index
+
+    def sheetPath(self, Archive):
+        """Returns the archive path of the sheet to read."""
+        # list the sheets of the workbook in order
+        sheets = []
+        for event, element in iterparse(Archive.open("xl/workbook.xml")):
+            if element.tag == SheetReader.MAIN + "sheet":
+                sheets.append((element.get("name"), element.get(SheetReader.RELATIONSHIPS + "id")))
+        # map relationship IDs to sheet files
+        targets = {}
+        for event, element in iterparse(Archive.open("xl/_rels/workbook.xml.rels")):
+            if element.tag == SheetReader.PACKAGE + "Relationship":
+                targets[element.get("Id")] = element.get("Target")
+        # find the requested (or first) sheet
+        for name, relationship in sheets:
+            if (self.sheet is None) or (name == self.sheet):
+                target = targets[relationship].lstrip("/")
+                return target if target.startswith("xl/") else "xl/" + target
+        raise KeyError("No sheet named " + str(self.sheet) + " in " + self.path)
+
+    def sharedStrings(self, Archive):
+        """Returns the shared string table of the workbook (the only part kept in memory)."""
+        strings = []
+        # no shared strings
+        if "xl/sharedStrings.xml" not in Archive.namelist():
+            return strings
+        # one string per <si> (rich text is split over several <t>)
+        for event, element in iterparse(Archive.open("xl/sharedStrings.xml")):
+            if element.tag == SheetReader.MAIN + "si":
+                strings.append("".join(text.text or "" for text in element.iter(SheetReader.MAIN + "t")))
+                element.clear()
+        return strings
+
+    def workbookRows(self):
+        """Yields the rows of an XLSX sheet, parsing the sheet XML a row at a time."""
+        Archive = zipfile.ZipFile(self.path)
+        try:
+            strings = self.sharedStrings(Archive)
+            columns = {}
+            # stream the rows of the sheet
+            for event, element in iterparse(Archive.open(self.sheetPath(Archive))):
+                if element.tag != SheetReader.MAIN + "row":
+                    continue
+                cells = []
+                for cell in element.iter(SheetReader.MAIN + "c"):
+                    # place the cell in its column (empty cells are not written)
+                    reference = cell.get("r")
+                    index = SheetReader.columnIndex(reference, columns) if reference else len(cells)
+                    while len(cells) < index:
+                        cells.append("")
+                    # read the value by type
+                    kind = cell.get("t")
+                    value = cell.find(SheetReader.MAIN + "v")
+                    if kind == "inlineStr":
+                        text = "".join(part.text or "" for part in cell.iter(SheetReader.MAIN + "t"))
+                    elif value is None:
+                        text = ""
+                    elif kind == "s":
+                        text = strings[int(value.text)]
+                    else:
+                        text = value.text or ""
+                        # whole numbers are written as "2.0" by some tools
+                        if (kind in [None, "n"]) and text.endswith(".0"):
+                            text = text[:-2]
+                    cells.append(text)
+                yield (int(element.get("r", 0)) or (self.rows_read + 1), cells)
+                # drop the parsed row
+                element.clear()
+        finally:
+            Archive.close()
@@ -0,0 +1,301 @@
+"""Sqlite Config Stores keep the KIM Interface configuration in normalized SQLite tables."""
+
+import os as os
+import sqlite3 as sqlite3
+from classes.ConfigIndex import ConfigIndex as ConfigIndex
+from classes.ConfigFileStore import ConfigFileStore as ConfigFileStore
+
+# KIM Interface Sqlite Config Store Class
+class SqliteConfigStore:
+    # table definitions (payload columns without a type keep their JSON type exactly)
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS models (
+            key TEXT PRIMARY KEY, position INTEGER NOT NULL, name);
+        CREATE TABLE IF NOT EXISTS base_information (
+            model_key TEXT NOT NULL REFERENCES models(key) ON DELETE CASCADE,
+            position INTEGER NOT NULL, item);
+        CREATE TABLE IF NOT EXISTS machines (
+            key TEXT PRIMARY KEY,
+            model_key TEXT NOT NULL REFERENCES models(key) ON DELETE CASCADE,
+            position INTEGER NOT NULL, name);
+        CREATE TABLE IF NOT EXISTS measurements (
+            machine_key TEXT NOT NULL REFERENCES machines(key) ON DELETE CASCADE,
+            position INTEGER NOT NULL, item);
+        CREATE TABLE IF NOT EXISTS configurations (
+            key TEXT PRIMARY KEY,
+            machine_key TEXT NOT NULL REFERENCES machines(key) ON DELETE CASCADE,
+            position INTEGER NOT NULL, id);
+        CREATE TABLE IF NOT EXISTS mappings (
+            config_key TEXT NOT NULL REFERENCES configurations(key) ON DELETE CASCADE,
+            position INTEGER NOT NULL, item, sheet, cluster, type, value);
+        CREATE INDEX IF NOT EXISTS machines_name ON machines(name);
+        CREATE INDEX IF NOT EXISTS machines_model ON machines(model_key, position);
+        CREATE INDEX IF NOT EXISTS configurations_machine_id ON configurations(machine_key, id);
+        CREATE INDEX IF NOT EXISTS base_information_model ON base_information(model_key, position);
+        CREATE INDEX IF NOT EXISTS measurements_machine ON measurements(machine_key, position);
+        CREATE INDEX IF NOT EXISTS mappings_config ON mappings(config_key, position);
+    """
+
+    # default constructor
+    def __init__(self, path):
+        self.path = path
+        self.connection = None
+        # commits made through this store (other connections are caught by data_version)
+        self.writes = 0
+
+    # default print
+    def __str__(self):
+        return f"Sqlite Config Store {self.path}"
+
+    def connect(self):
+        """Returns the database connection, opening it (and creating the tables) on first use."""
+        # already open
+        if self.connection is not None:
+            return self.connection
+        # open the database
+        self.connection = sqlite3.connect(self.path)
+        # removing a model or machine removes everything below it
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        # readers do not block the commit
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        # create the tables
+        self.connection.executescript(SqliteConfigStore.SCHEMA)
+        # return the connection
+        return self.connection
+
+    def exists(self):
+        """Returns True if the database holds a configuration."""
+        # no database yet
+        if not os.path.isfile(self.path):
+            return False
+        # the timestamp is written with every configuration
+        return self.connect().execute(
+            "SELECT 1 FROM meta WHERE name = 'timestamp'").fetchone() is not None
+
+    def signature(self):
+        """Returns a signature that changes whenever the configuration is committed."""
+        # data_version moves when another connection commits; writes when this one does
+        version = self.connect().execute("PRAGMA data_version").fetchone()[0]
+        # return the combined signature
+        return (version, self.writes)
+
+    def read(self):
+        """Assembles the config Dict from the tables (one ordered scan per table).
+
+        -> {"timestamp", "models"}
+        """
+        # get the connection
+        connection = self.connect()
+        # get the timestamp
+        row = connection.execute("SELECT value FROM meta WHERE name = 'timestamp'").fetchone()
+        # build every model, machine and config, keeping them by key for their children
+        models = []
+        by_key = {}
+        for key, name in connection.execute("SELECT key, name FROM models ORDER BY position"):
+            by_key[key] = {"key":key, "name":name, "base_information":[], "machines":[]}
+            models.append(by_key[key])
+        for model_key, item in connection.execute(
+                "SELECT model_key, item FROM base_information ORDER BY model_key, position"):
+            by_key[model_key]['base_information'].append(item)
+        for key, model_key, name in connection.execute(
+                "SELECT key, model_key, name FROM machines ORDER BY model_key, position"):
+            by_key[key] = {"key":key, "name":name, "measurements":[], "mapping_configurations":[]}
+            by_key[model_key]['machines'].append(by_key[key])
+        for machine_key, item in connection.execute(
+                "SELECT machine_key, item FROM measurements ORDER BY machine_key, position"):
+            by_key[machine_key]['measurements'].append(item)
+        for key, machine_key, id_num in connection.execute(
+                "SELECT key, machine_key, id FROM configurations ORDER BY machine_key, position"):
+            by_key[key] = {"key":key, "id":id_num, "mappings":[]}
+            by_key[machine_key]['mapping_configurations'].append(by_key[key])
+        for config_key, item, sheet, cluster, kind, value in connection.execute(
+                "SELECT config_key, item, sheet, cluster, type, value FROM mappings "
+                + "ORDER BY config_key, position"):
+            by_key[config_key]['mappings'].append({"item":item, "sheet":sheet, "cluster":cluster,
+                "type":kind, "value":value})
+        # return the config Dict
+        return {"timestamp":row[0] if row else "", "models":models}
+
+    @staticmethod
+    def mappingRows(config):
+        """Returns the (item, sheet, cluster, type, value) rows of a config's mappings."""
+        return [(mapping['item'], mapping['sheet'], mapping['cluster'], mapping['type'],
+            mapping['value']) for mapping in config['mappings']]
+
+    def insertConfig(self, cursor, machine_key, config, position):
+        """Inserts the rows of one config and its mappings."""
+        cursor.execute("INSERT INTO configurations (key, machine_key, position, id) "
+            + "VALUES (?, ?, ?, ?)", (config['key'], machine_key, position, config['id']))
+        cursor.executemany("INSERT INTO mappings (config_key, position, item, sheet, cluster, "
+            + "type, value) VALUES (?, ?, ?, ?, ?, ?, ?)", [(config['key'], i) + row
+            for i, row in enumerate(self.mappingRows(config))])
+
+    def insertMachine(self, cursor, model_key, machine, position):
+        """Inserts the rows of one machine and everything below it."""
+        cursor.execute("INSERT INTO machines (key, model_key, position, name) VALUES (?, ?, ?, ?)",
+            (machine['key'], model_key, position, machine['name']))
+        cursor.executemany("INSERT INTO measurements (machine_key, position, item) VALUES (?, ?, ?)",
+            [(machine['key'], i, item) for i, item in enumerate(machine['measurements'])])
+        # its configs
+        for k, config in enumerate(machine['mapping_configurations']):
+            self.insertConfig(cursor, machine['key'], config, k)
+
+    def insertModel(self, cursor, model, position):
+        """Inserts the rows of one model and everything below it."""
+        # the model
+        cursor.execute("INSERT INTO models (key, position, name) VALUES (?, ?, ?)",
+            (model['key'], position, model['name']))
+        cursor.executemany("INSERT INTO base_information (model_key, position, item) VALUES (?, ?, ?)",
+            [(model['key'], i, item) for i, item in enumerate(model['base_information'])])
+        # its machines
+        for j, machine in enumerate(model['machines']):
+            self.insertMachine(cursor, model['key'], machine, j)
+
+    def updateItems(self, cursor, table, owner_column, owner_key, columns, rows):
+        """Rewrites the ordered rows one object owns (its base information, measurements or
+        mappings), only if they differ from the rows in the table."""
+        # read the current rows (one indexed scan)
+        current = cursor.execute("SELECT " + ", ".join(columns) + " FROM " + table + " WHERE "
+            + owner_column + " = ? ORDER BY position", (owner_key,)).fetchall()
+        if current == rows:
+            return
+        # replace them
+        cursor.execute("DELETE FROM " + table + " WHERE " + owner_column + " = ?", (owner_key,))
+        cursor.executemany("INSERT INTO " + table + " (" + owner_column + ", position, "
+            + ", ".join(columns) + ") VALUES (" + ", ".join(["?"] * (len(columns) + 2)) + ")",
+            [(owner_key, i) + row for i, row in enumerate(rows)])
+
+    def updateConfigs(self, cursor, machine, dirty):
+        """Brings the configs of a changed machine up to date: removed configs are deleted,
+        new ones inserted, changed ones (named in dirty) rewritten and moved ones renumbered."""
+        # the configs in the table and their places
+        existing = dict(cursor.execute("SELECT key, position FROM configurations WHERE machine_key = ?",
+            (machine['key'],)).fetchall())
+        live = set(config['key'] for config in machine['mapping_configurations'])
+        cursor.executemany("DELETE FROM configurations WHERE key = ?", [(key,) for key in existing if key not in live])
+        for k, config in enumerate(machine['mapping_configurations']):
+            # a new config (or one moved from another machine)
+            if config['key'] not in existing:
+                cursor.execute("DELETE FROM configurations WHERE key = ?", (config['key'],))
+                self.insertConfig(cursor, machine['key'], config, k)
+            # a changed config
+            elif config['key'] in dirty:
+                cursor.execute("UPDATE configurations SET position = ?, id = ? WHERE key = ?",
+                    (k, config['id'], config['key']))
+                self.updateItems(cursor, "mappings", "config_key", config['key'],
+                    ["item", "sheet", "cluster", "type", "value"], self.mappingRows(config))
+            # an unchanged config that moved
+            elif existing[config['key']] != k:
+                cursor.execute("UPDATE configurations SET position = ? WHERE key = ?", (k, config['key']))
+
+    def updateMachines(self, cursor, model, dirty):
+        """Brings the machines of a changed model up to date: removed machines are deleted,
+        new ones inserted, changed ones (named in dirty) rewritten and moved ones renumbered."""
+        # the machines in the table and their places
+        existing = dict(cursor.execute("SELECT key, position FROM machines WHERE model_key = ?",
+            (model['key'],)).fetchall())
+        live = set(machine['key'] for machine in model['machines'])
+        cursor.executemany("DELETE FROM machines WHERE key = ?", [(key,) for key in existing if key not in live])
+        for j, machine in enumerate(model['machines']):
+            # a new machine (or one moved from another model)
+            if machine['key'] not in existing:
+                cursor.execute("DELETE FROM machines WHERE key = ?", (machine['key'],))
+                self.insertMachine(cursor, model['key'], machine, j)
+            # a changed machine (or a machine above a changed config)
+            elif machine['key'] in dirty:
+                cursor.execute("UPDATE machines SET position = ?, name = ? WHERE key = ?",
+                    (j, machine['name'], machine['key']))
+                self.updateItems(cursor, "measurements", "machine_key", machine['key'], ["item"],
+                    [(item,) for item in machine['measurements']])
+                self.updateConfigs(cursor, machine, dirty)
+            # an unchanged machine that moved
+            elif existing[machine['key']] != j:
+                cursor.execute("UPDATE machines SET position = ? WHERE key = ?", (j, machine['key']))
+
+    def updateModel(self, cursor, model, position, dirty):
+        """Rewrites the rows of a changed model that differ from the config Dict (the rows of
+        machines and configs that did not change are left alone)."""
+        cursor.execute("UPDATE models SET position = ?, name = ? WHERE key = ?",
+            (position, model['name'], model['key']))
+        self.updateItems(cursor, "base_information", "model_key", model['key'], ["item"],
+            [(item,) for item in model['base_information']])
+        self.updateMachines(cursor, model, dirty)
+
+    def write(self, document, dirty = None):
+        """Rewrites the rows of the changed objects in a single transaction.
+
+        dirty: (optional) set; keys of the objects changed since the last write, with every
+            object above them (only their rows are rewritten; None rewrites every model).
+
+        -> int; the number of rows written.
+        """
+        # get the connection
+        connection = self.connect()
+        # count the rows written
+        before = connection.total_changes
+        # one transaction per commit (rolled back if anything fails)
+        with connection:
+            cursor = connection.cursor()
+            # stamp the configuration
+            cursor.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('timestamp', ?)",
+                (document['timestamp'],))
+            # remove the models that are no longer in the config (and everything below them)
+            existing = dict(cursor.execute("SELECT key, position FROM models").fetchall())
+            live = set(model['key'] for model in document['models'])
+            cursor.executemany("DELETE FROM models WHERE key = ?", [(key,) for key in existing if key not in live])
+            for position, model in enumerate(document['models']):
+                # rewrite new models (or every model)
+                if (dirty is None) or (model['key'] not in existing):
+                    cursor.execute("DELETE FROM models WHERE key = ?", (model['key'],))
+                    self.insertModel(cursor, model, position)
+                # update the rows of changed models
+                elif model['key'] in dirty:
+                    self.updateModel(cursor, model, position, dirty)
+                # unchanged models may only have moved
+                elif existing[model['key']] != position:
+                    cursor.execute("UPDATE models SET position = ? WHERE key = ?", (position, model['key']))
+        # count the commit
+        self.writes += 1
+        # return the number of rows written
+        return connection.total_changes - before
+
+    def invalidate(self):
+        """Drops anything held from earlier reads (rows are always read from the database)."""
+        pass
+
+    def close(self):
+        """Closes the database connection."""
+        # nothing to close
+        if self.connection is None:
+            return
+        # close the connection
+        self.connection.close()
+        self.connection = None
+
+    def importFile(self, path):
+        """Loads a single-file KIM Interface configuration into the database.
+
+        -> int; the number of models imported.
+        """
+        # read the single config file
+        document = ConfigFileStore(path).read()
+        # rows are linked by key
+        ConfigIndex.assignKeys(document)
+        # write every model
+        self.write(document)
+        # return the number of models imported
+        return len(document['models'])
+
+    def exportFile(self, path, document = None):
+        """Writes the single-file KIM Interface configuration (the layout the KIM Interface reads).
+
+        document: (optional) config Dict; the config to export (defaults to the database).
+
+        -> int; the number of bytes written.
+        """
+        # assemble the config from the database
+        if document is None:
+            document = self.read()
+        # write the single file in one pass
+        return ConfigFileStore(path).write(document)
@@ -0,0 +1,139 @@
+"""Undo Logs keep the patches of a user's recent commits so they can be undone and redone, and journal them so they survive a restart."""
+
+import os as os
+from collections import deque
+from datetime import datetime
+from classes.ConfigJournal import ConfigJournal as ConfigJournal
+
+# KIM Interface Undo Log Class
+class UndoLog:
+    # default constructor
+    def __init__(self, path, depth = 50, max_bytes = 8388608):
+        self.path = path
+        # the most commits (and encoded patch bytes) kept; the oldest are dropped first
+        self.depth = depth
+        self.max_bytes = max_bytes
+        # the journal of the log (an event per commit, undo and redo)
+        self.journal = ConfigJournal(path, 0)
+        # [{"action", "time", "patches":[str]}]; the last entry is undone or redone first
+        self.undo_entries = deque()
+        self.redo_entries = deque()
+        self.bytes = 0
+        # events appended since the journal was last rewritten (None until loaded)
+        self.events = None
+
+    # default print
+    def __str__(self):
+        return f"Undo Log {len(self.undo_entries)} undo / {len(self.redo_entries)} redo"
+
+    @staticmethod
+    def entry(action, patches):
+        """Creates the entry of one commit.
+
+        patches: [str]; the encoded patch of each operation of the commit.
+
+        -> {"action", "time", "patches"}
+        """
+        return {"action":str(action), "time":str(datetime.now()), "patches":list(patches)}
+
+    @staticmethod
+    def size(entry):
+        """Returns the bytes of the encoded patches of an entry."""
+        return sum(len(patch) for patch in entry['patches'])
+
+    def push(self, entries, entry):
+        """Adds an entry on top of a stack, then drops the oldest entries past the limits
+        (the newest entry is always kept)."""
+        entries.append(entry)
+        self.bytes += UndoLog.size(entry)
+        while (len(self.undo_entries) + len(self.redo_entries) > self.depth) \
+                or ((self.bytes > self.max_bytes) and (len(self.undo_entries) + len(self.redo_entries) > 1)):
+            # the oldest commit that can be undone goes first, then the last one to be redone
+            oldest = self.undo_entries
+            if (not self.undo_entries) or ((entries is self.undo_entries) and (len(self.undo_entries) == 1)):
+                oldest = self.redo_entries
+            self.bytes -= UndoLog.size(oldest.popleft())
+
+    def clearStacks(self):
+        """Empties both stacks in memory."""
+        self.undo_entries.clear()
+        self.redo_entries.clear()
+        self.bytes = 0
+
+    def apply(self, event):
+        """Applies one journaled event to the stacks in memory."""
+        if event['event'] == "state":
+            self.clearStacks()
+            for entry in event['undo']:
+                self.push(self.undo_entries, entry)
+            for entry in event['redo']:
+                self.push(self.redo_entries, entry)
+        # a new commit can no longer be redone over
+        elif event['event'] == "record":
+            self.redo_entries.clear()
+            self.bytes = sum(UndoLog.size(entry) for entry in self.undo_entries)
+            self.push(self.undo_entries, event['entry'])
+        # the undone commit is replaced by the commit that undid it (and the other way round)
+        elif event['event'] in ("undo", "redo"):
+            source, target = (self.undo_entries, self.redo_entries) if event['event'] == "undo" \
+                else (self.redo_entries, self.undo_entries)
+            if source:
+                self.bytes -= UndoLog.size(source.pop())
+            self.push(target, event['entry'])
+        elif event['event'] == "clear":
+            self.clearStacks()
+
+    def load(self):
+        """Reads the journal into memory once per session (a torn final event is ignored)."""
+        if self.events is not None:
+            return
+        self.events = 0
+        for event in self.journal.readRecords():
+            self.apply(event)
+            self.events += 1
+
+    def log(self, event):
+        """Applies an event and journals it; the journal is rewritten as one state event
+        once it holds more events than the log holds entries."""
+        self.load()
+        self.apply(event)
+        if self.events >= self.depth:
+            self.rewrite()
+        else:
+            os.makedirs(os.path.dirname(self.path), exist_ok = True)
+            self.journal.append(event)
+            self.events += 1
+
+    def rewrite(self):
+        """Writes the stacks as one state event to a temporary journal, then swaps it in."""
+        os.makedirs(os.path.dirname(self.path), exist_ok = True)
+        Journal = ConfigJournal(self.path + ".tmp", 0)
+        Journal.truncate()
+        Journal.append({"event":"state", "undo":list(self.undo_entries), "redo":list(self.redo_entries)})
+        os.replace(Journal.path, self.path)
+        self.events = 1
+
+    def record(self, action, patches):
+        """Adds a commit that can be undone (the commits that could be redone are dropped)."""
+        self.log({"event":"record", "entry":UndoLog.entry(action, patches)})
+
+    def peek(self, redo = False):
+        """Returns the entry the next undo (or redo) reverses, or None.
+
+        -> {"action", "time", "patches"} | None
+        """
+        self.load()
+        entries = self.redo_entries if redo else self.undo_entries
+        return entries[-1] if entries else None
+
+    def reversed(self, redo, action, patches):
+        """Notes that the top entry was undone (or redone) by a commit with these patches
+        (its entry is the one that reverses the undo or redo)."""
+        self.log({"event":"redo" if redo else "undo", "entry":UndoLog.entry(action, patches)})
+
+    def clear(self):
+        """Drops every entry (a whole configuration was committed; there is nothing to
+        reverse it with)."""
+        self.load()
+        if self.undo_entries or self.redo_entries:
+            self.log({"event":"clear"})
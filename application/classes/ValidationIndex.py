@@ -0,0 +1,135 @@
+"""Validation Indexes hold the names and IDs that must stay unique in a KIM Interface configuration, kept current as keyed operations are applied."""
+
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+
+# KIM Interface Validation Index Class
+class ValidationIndex:
+    # default constructor
+    def __init__(self, document):
+        # model name -> key
+        self.models = {}
+        # machine name -> key (machine names are unique across models)
+        self.machines = {}
+        # machine key -> {config id -> key}
+        self.configs = {}
+        # index every model, machine and config once (first match wins, like the linear scans)
+        for model in document['models']:
+            self.index(model, None)
+
+    # default print
+    def __str__(self):
+        return (f"Validation Index {len(self.models)} models / {len(self.machines)} machines"
+            + f" / {sum(len(ids) for ids in self.configs.values())} configs")
+
+    def configIds(self, machine_key):
+        """Returns the config ID -> key map of a machine (empty if it has no configs)."""
+        return self.configs.get(machine_key, {})
+
+    def index(self, data, parent_key):
+        """Adds the name (or ID) of a model, machine or config Dict and of everything below it.
+
+        parent_key: str | None; the key of the machine that holds a config.
+        """
+        # a model
+        if 'base_information' in data:
+            self.models.setdefault(str(data['name']), data['key'])
+            for machine in data.get('machines', []):
+                self.index(machine, data['key'])
+        # a machine
+        elif 'measurements' in data:
+            self.machines.setdefault(str(data['name']), data['key'])
+            self.configs.setdefault(data['key'], {})
+            for config in data.get('mapping_configurations', []):
+                self.index(config, data['key'])
+        # a config
+        else:
+            self.configs.setdefault(parent_key, {}).setdefault(str(data['id']), data['key'])
+
+    def unindex(self, data, parent_key):
+        """Drops the name (or ID) of a model, machine or config Dict and of everything below it
+        (names held by another object with the same name are kept)."""
+        # a model
+        if 'base_information' in data:
+            if self.models.get(str(data['name'])) == data['key']:
+                del self.models[str(data['name'])]
+            for machine in data.get('machines', []):
+                self.unindex(machine, data['key'])
+        # a machine (its configs go with it)
+        elif 'measurements' in data:
+            if self.machines.get(str(data['name'])) == data['key']:
+                del self.machines[str(data['name'])]
+            self.configs.pop(data['key'], None)
+        # a config
+        else:
+            ids = self.configs.get(parent_key, {})
+            if ids.get(str(data['id'])) == data['key']:
+                del ids[str(data['id'])]
+
+    def taken(self, data, parent_key):
+        """Returns the names (and IDs) of a model, machine or config Dict and of everything
+        below it that another object already holds.
+
+        parent_key: str | None; the key of the machine that holds a config.
+
+        -> [str]
+        """
+        # a model
+        if 'base_information' in data:
+            names = [] if self.models.get(str(data['name']), data['key']) == data['key'] else [str(data['name'])]
+            for machine in data.get('machines', []):
+                names += self.taken(machine, data['key'])
+        # a machine
+        elif 'measurements' in data:
+            names = [] if self.machines.get(str(data['name']), data['key']) == data['key'] else [str(data['name'])]
+            for config in data.get('mapping_configurations', []):
+                names += self.taken(config, data['key'])
+        # a config
+        else:
+            holder = self.configs.get(parent_key, {}).get(str(data['id']), data['key'])
+            names = [] if holder == data['key'] else [str(data['id'])]
+        return names
+
+    def conflicts(self, document, operation, positions):
+        """Returns the names and IDs an add or replace would give its object (or anything
+        below it) that another object already holds. Call it before the operation is
+        applied.
+
+        -> [str]
+        """
+        # removes give no names
+        if operation['op'] == ConfigOperation.REMOVE:
+            return []
+        # configs are checked under their machine
+        parent_key = operation.get('parent')
+        if operation['key'] in positions:
+            position = positions[operation['key']]
+            parent_key = ConfigOperation.lookup(document, position[:-1])['key'] if len(position) > 1 else None
+        return self.taken(operation['data'], parent_key)
+
+    def update(self, document, operation, positions):
+        """Applies the name changes of one operation. Call it before the operation is applied
+        to the document (the replaced or removed Dict is read from it); operations that
+        ConfigOperation.apply would reject change nothing."""
+        key = operation['key']
+        # the object being replaced or removed (or re-added by a replayed add)
+        if key in positions:
+            position = positions[key]
+            # configs are indexed under their machine
+            parent_key = None
+            if len(position) > 1:
+                parent_key = ConfigOperation.children(document,
+                    position[:-2] if len(position) > 2 else None)[position[-2]]['key']
+            # drop its old names
+            self.unindex(ConfigOperation.children(document,
+                position[:-1] if len(position) > 1 else None)[position[-1]], parent_key)
+        # the target must exist to be replaced or removed
+        elif operation['op'] != ConfigOperation.ADD:
+            return
+        # the parent must exist to add under it
+        else:
+            parent_key = operation.get('parent')
+            if (parent_key is not None) and (parent_key not in positions):
+                return
+        # add the new names
+        if operation['op'] != ConfigOperation.REMOVE:
+            self.index(operation['data'], parent_key)
@@ -0,0 +1,103 @@
+"""Tests of the backup store: deduplicated snapshots, retention and skipped unchanged backups."""
+
+import os as os
+import sys as sys
+import shutil as shutil
+import tempfile as tempfile
+import unittest as unittest
+from json import dumps
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from classes.BackupStore import BackupStore as BackupStore
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+from classes.InterfaceCore import InterfaceCore as InterfaceCore
+
+# builds a small keyed configuration
+def makeConfig(timestamp = "2026-10-01 08:00:00 | test", models = 3):
+    return {"timestamp":timestamp, "models":[{"key":"model" + str(a), "name":"M" + str(a),
+        "base_information":["Program"], "machines":[{"key":"machine" + str(a), "name":"M" + str(a)
+        + " LATHE", "measurements":["OD", "ID"], "mapping_configurations":[]}]} for a in range(models)]}
+
+class BackupStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.Store = BackupStore(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def takeSnapshots(self, count, days_apart = 0):
+        """Stores count snapshots, each with one more changed model name (oldest first)."""
+        document = makeConfig()
+        start = datetime.now() - timedelta(days = count * days_apart)
+        for i in range(count):
+            document['models'][i % 3]['name'] = "N" + str(i)
+            document['timestamp'] = "t" + str(i)
+            self.Store.snapshot(document, str(start + timedelta(days = i * days_apart)))
+        return document
+
+    def testSnapshotRoundTripAndDeduplication(self):
+        document = makeConfig()
+        first = self.Store.snapshot(document)
+        self.assertFalse(first['skipped'])
+        self.assertEqual(first['objects'], 4)
+        # an identical configuration is not stored again
+        self.assertTrue(self.Store.snapshot(document)['skipped'])
+        # only the changed model and the manifest are new
+        document['models'][1]['name'] = "M9"
+        self.assertEqual(self.Store.snapshot(document)['objects'], 2)
+        self.assertEqual(self.Store.read(self.Store.snapshots()[-1]), document)
+
+    def testRetentionByCount(self):
+        latest = self.takeSnapshots(6)
+        self.Store.retain(count = 2)
+        entries = BackupStore(self.directory).snapshots()
+        self.assertEqual([entry['timestamp'] for entry in entries], ["t4", "t5"])
+        self.assertEqual(self.Store.read(entries[-1]), latest)
+        # every object a kept snapshot uses is still there
+        self.Store.read(entries[0])
+
+    def testRetentionByAgeKeepsTheLatest(self):
+        self.takeSnapshots(4, days_apart = 10)
+        self.Store.retain(days = 25)
+        self.assertEqual([entry['timestamp'] for entry in self.Store.snapshots()], ["t2", "t3"])
+        self.Store.retain(days = 0.001)
+        self.assertEqual([entry['timestamp'] for entry in self.Store.snapshots()], ["t3"])
+
+    def testRetentionBySizeRemovesUnusedObjects(self):
+        self.takeSnapshots(6)
+        removed = self.Store.retain(size = 1)
+        self.assertGreater(removed, 0)
+        self.assertEqual(len(self.Store.snapshots()), 1)
+        names = [name[:-len(".json.gz")] for folder in os.listdir(self.Store.objects_dir)
+            for name in os.listdir(os.path.join(self.Store.objects_dir, folder))]
+        entry = self.Store.snapshots()[0]
+        self.assertEqual(sorted(names), sorted([entry['hash']] + self.Store.models(entry)))
+
+class ConfigBackupTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, "config"))
+        File = open(os.path.join(self.directory, "config", "KIM_interface_configuration.json"), 'w')
+        File.write(dumps(makeConfig(), indent = 4))
+        File.close()
+        self.Core = InterfaceCore(self.directory, "test")
+        self.Core.verifyFolders()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testUnchangedConfigIsNotSnapshotAgain(self):
+        self.assertFalse(self.Core.createConfigBackup()['skipped'])
+        report = self.Core.createConfigBackup()
+        self.assertTrue(report['skipped'])
+        self.assertEqual(report['objects'], 0)
+        # a commit stamps the config, so the next backup stores it
+        machine = dict(self.Core.openConfigFile()['models'][0]['machines'][0], name = "M0 MILL")
+        self.Core.commitOperations([ConfigOperation.replace(machine)], "Rename")
+        self.assertFalse(self.Core.createConfigBackup()['skipped'])
+        self.assertEqual(len(self.Core.backups.snapshots()), 2)
+
+# run as a script
+if __name__ == "__main__":
+    unittest.main()
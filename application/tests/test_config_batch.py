@@ -0,0 +1,55 @@
+"""Tests of config batch validation: rows are checked in order against a working copy."""
+
+import os as os
+import sys as sys
+import unittest as unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from classes.ConfigBatch import ConfigBatch as ConfigBatch
+
+# builds a small keyed configuration
+def makeConfig():
+    return {"timestamp":"2026-10-01 08:00:00 | test", "models":[{"key":"model0", "name":"3D4",
+        "base_information":["Program"], "machines":[{"key":"machine0", "name":"3D4 LATHE",
+        "measurements":["OD", "ID"], "mapping_configurations":[{"key":"config0", "id":"1-1",
+        "mappings":[{"item":"OD", "sheet":1, "cluster":2, "type":"string", "value":""}]}]}]}]}
+
+class ConfigBatchTest(unittest.TestCase):
+    def testValidRowsBecomeOperations(self):
+        document = makeConfig()
+        Batch = ConfigBatch(document)
+        errors = Batch.validate([
+            {"op":"add-model", "model":"5K2", "values":["Program"]},
+            {"op":"add-machine", "model":"5K2", "machine":"5K2 MILL", "values":["OD"]},
+            {"op":"add-config", "machine":"5K2 MILL", "id":"1-1", "mappings":[("OD", 1, 2)]},
+            {"op":"duplicate-config", "machine":"3D4 LATHE", "id":"1-1", "new":"1-2"}])
+        self.assertEqual(errors, [])
+        self.assertEqual([operation['op'] for operation in Batch.operations], ["add"] * 4)
+        # the committed config is not changed by validation
+        self.assertEqual(document, makeConfig())
+
+    def testLaterRowsSeeEarlierOnes(self):
+        Batch = ConfigBatch(makeConfig())
+        errors = Batch.validate([
+            {"op":"add-config", "machine":"3D4 LATHE", "id":"2-1", "mappings":[]},
+            {"op":"add-config", "machine":"3D4 LATHE", "id":"2-1", "mappings":[]},
+            {"op":"remove-machine", "machine":"3D4 LATHE"},
+            {"op":"edit-config", "machine":"3D4 LATHE", "id":"1-1", "new":"1-3"}])
+        self.assertEqual([error['row'] for error in errors], [2, 4])
+        self.assertEqual(len(Batch.operations), 2)
+
+    def testInvalidRowsAreReported(self):
+        Batch = ConfigBatch(makeConfig())
+        errors = Batch.validate([
+            {"op":"bogus"},
+            {"op":"add-model", "model":"3D4"},
+            {"op":"add-config", "machine":"3D4 LATHE", "id":"2-1", "mappings":[("OD", 1, 2), ("OD", 1, 3)]},
+            {"op":"add-config", "machine":"3D4 LATHE", "id":"2-2", "mappings":[("OD", 1, 2), ("ID", 1, 2)]},
+            {"op":"add-config", "machine":"3D4 LATHE", "id":"2-3", "mappings":[("Width", 1, 2)]},
+            {"error":"Row 6 could not be read."}])
+        self.assertEqual([error['row'] for error in errors], [1, 2, 3, 4, 5, 6])
+        self.assertIn("more than once", errors[2]['error'])
+        self.assertEqual(Batch.operations, [])
+
+# run as a script
+if __name__ == "__main__":
+    unittest.main()
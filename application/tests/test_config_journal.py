@@ -0,0 +1,124 @@
+"""Tests of the config journal: commits are replayed over the snapshot and folded into it."""
+
+import os as os
+import sys as sys
+import shutil as shutil
+import tempfile as tempfile
+import unittest as unittest
+from json import dumps
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from classes.ConfigJournal import ConfigJournal as ConfigJournal
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+from classes.InterfaceCore import InterfaceCore as InterfaceCore
+
+# builds a small keyed configuration
+def makeConfig(models = 2):
+    return {"timestamp":"2026-10-01 08:00:00 | test", "models":[{"key":"model" + str(a),
+        "name":"M" + str(a), "base_information":["Program"], "machines":[{"key":"machine" + str(a),
+        "name":"M" + str(a) + " LATHE", "measurements":["OD", "ID"], "mapping_configurations":[
+        {"key":"config" + str(a), "id":"1-1", "mappings":[{"item":"OD", "sheet":1, "cluster":1,
+        "type":"string", "value":""}]}]}]} for a in range(models)]}
+
+class ConfigJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "journal")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testReplayAppliesRecordsInOrder(self):
+        Journal = ConfigJournal(self.path, 1024)
+        Journal.append({"timestamp":"t1", "operations":[ConfigOperation.add("machine0",
+            {"key":"new", "id":"2-1", "mappings":[]})]})
+        Journal.append({"timestamp":"t2", "operations":[ConfigOperation.remove("config0")]})
+        document = makeConfig()
+        self.assertEqual(Journal.replay(document), 2)
+        self.assertEqual(document['timestamp'], "t2")
+        self.assertEqual([config['id'] for config in document['models'][0]['machines'][0]
+            ['mapping_configurations']], ["2-1"])
+
+    def testTornFinalLineIsIgnored(self):
+        Journal = ConfigJournal(self.path, 1024)
+        Journal.append({"timestamp":"t1", "operations":[ConfigOperation.remove("model1")]})
+        File = open(self.path, 'a')
+        File.write('{"timestamp":"t2","operations":[')
+        File.close()
+        document = makeConfig()
+        self.assertEqual(Journal.replay(document), 1)
+        self.assertEqual([model['key'] for model in document['models']], ["model0"])
+
+    def testCompactionThreshold(self):
+        Journal = ConfigJournal(self.path, 64)
+        self.assertFalse(Journal.needsCompaction())
+        Journal.append({"timestamp":"t1", "operations":[ConfigOperation.remove("model1")] * 4})
+        self.assertTrue(Journal.needsCompaction())
+        Journal.truncate()
+        self.assertEqual(Journal.size(), 0)
+        self.assertTrue(ConfigJournal(self.path, 0).writeThrough())
+
+class JournaledCommitTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, "config"))
+        File = open(os.path.join(self.directory, "config", "KIM_interface_configuration.json"), 'w')
+        File.write(dumps(makeConfig(), indent = 4))
+        File.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def openCore(self, user, compaction_bytes):
+        Core = InterfaceCore(self.directory, user, "sharded", compaction_bytes)
+        Core.verifyFolders()
+        return Core
+
+    def rename(self, Core, name):
+        machine = dict(Core.openConfigFile()['models'][0]['machines'][0], name = name)
+        return Core.commitOperations([ConfigOperation.replace(machine)], "Rename")
+
+    def testCommitIsJournaledAndSeenByAnotherSession(self):
+        First = self.openCore("first", 1 << 20)
+        First.startup()
+        Second = self.openCore("second", 1 << 20)
+        Second.openConfigFile()
+        report = self.rename(First, "M0 MILL")
+        self.assertFalse(report['compacted'])
+        self.assertGreater(First.journal.size(), 0)
+        # the other session replays the journal over the unchanged snapshot
+        self.assertEqual(Second.openConfigFile()['models'][0]['machines'][0]['name'], "M0 MILL")
+        self.assertEqual(self.openCore("third", 1 << 20).store.read()['models'][0]['machines'][0]['name'],
+            "M0 LATHE")
+        First.shutdown()
+        Second.close()
+
+    def testCompactionFoldsTheJournalIntoTheSnapshot(self):
+        Core = self.openCore("test", 1)
+        Core.startup()
+        report = self.rename(Core, "M0 MILL")
+        self.assertTrue(report['compacted'])
+        self.assertEqual(Core.journal.size(), 0)
+        self.assertEqual(self.openCore("other", 1).store.read(), Core.openConfigFile())
+        Core.shutdown()
+
+    def testShutdownCompacts(self):
+        Core = self.openCore("test", 1 << 20)
+        Core.startup()
+        self.rename(Core, "M0 MILL")
+        Core.shutdown()
+        self.assertEqual(Core.journal.size(), 0)
+        self.assertEqual(self.openCore("test", 1 << 20).store.read()['models'][0]['machines'][0]['name'],
+            "M0 MILL")
+
+    def testFileStorageWritesThrough(self):
+        Core = InterfaceCore(self.directory, "test", "file", 1 << 20)
+        Core.verifyFolders()
+        Core.startup()
+        self.rename(Core, "M0 MILL")
+        self.assertEqual(Core.journal.size(), 0)
+        self.assertEqual(Core.store.read()['models'][0]['machines'][0]['name'], "M0 MILL")
+        Core.shutdown()
+
+# run as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests of the sharded and single-file config stores: round-trips and incremental writes."""
+
+import os as os
+import sys as sys
+import shutil as shutil
+import tempfile as tempfile
+import unittest as unittest
+from json import loads, dumps
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from classes.ConfigFileStore import ConfigFileStore as ConfigFileStore
+from classes.ShardedConfigStore import ShardedConfigStore as ShardedConfigStore
+
+# builds a small keyed configuration
+def makeConfig(models = 3):
+    return {"timestamp":"2026-10-01 08:00:00 | test", "models":[{"key":"model" + str(a),
+        "name":"M" + str(a), "base_information":["Program"], "machines":[{"key":"machine" + str(a),
+        "name":"M" + str(a) + " LATHE", "measurements":["OD", "ID"], "mapping_configurations":[
+        {"key":"config" + str(a), "id":"1-1", "mappings":[{"item":"OD", "sheet":1, "cluster":1,
+        "type":"string", "value":""}]}]}]} for a in range(models)]}
+
+class ShardedConfigStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testRoundTrip(self):
+        document = makeConfig()
+        ShardedConfigStore(self.directory).write(document)
+        self.assertEqual(ShardedConfigStore(self.directory).read(), document)
+
+    def testOnlyDirtyShardsAreWrittenAndRead(self):
+        Writer = ShardedConfigStore(self.directory)
+        Writer.write(makeConfig())
+        Reader = ShardedConfigStore(self.directory)
+        Reader.read()
+        signature = Reader.signature()
+        # change one model
+        document = makeConfig()
+        document['models'][1]['name'] = "M9"
+        writes = Writer.shard_writes
+        Writer.write(document, {"model1"})
+        self.assertEqual(Writer.shard_writes - writes, 1)
+        # the other session notices through the manifest and parses only that shard
+        self.assertNotEqual(Reader.signature(), signature)
+        reads = Reader.shard_reads
+        self.assertEqual(Reader.read(), document)
+        self.assertEqual(Reader.shard_reads - reads, 1)
+
+    def testRemovedModelsLoseTheirShards(self):
+        Store = ShardedConfigStore(self.directory)
+        document = makeConfig()
+        Store.write(document)
+        del document['models'][0]
+        Store.write(document, set())
+        self.assertEqual(sorted(os.listdir(Store.shards_dir)), ["model1.json", "model2.json"])
+        self.assertEqual(ShardedConfigStore(self.directory).read(), document)
+
+    def testImportAndExport(self):
+        path = os.path.join(self.directory, "config.json")
+        ConfigFileStore(path).write(makeConfig())
+        Store = ShardedConfigStore(os.path.join(self.directory, "sharded"))
+        self.assertEqual(Store.importFile(path), 3)
+        exported = os.path.join(self.directory, "exported.json")
+        Store.exportFile(exported)
+        self.assertEqual(ConfigFileStore(exported).read(), makeConfig())
+
+class ConfigFileStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "config.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def readText(self):
+        File = open(self.path, 'r')
+        text = File.read()
+        File.close()
+        return text
+
+    def testWriteMatchesDumps(self):
+        document = makeConfig()
+        ConfigFileStore(self.path).write(document)
+        self.assertEqual(self.readText(), dumps(document, indent = 4))
+        for document in [{}, {"timestamp":"t", "models":[]}]:
+            ConfigFileStore(self.path).write(document)
+            self.assertEqual(self.readText(), dumps(document, indent = 4))
+
+    def testIncrementalWriteMatchesDumps(self):
+        Store = ConfigFileStore(self.path)
+        document = makeConfig()
+        Store.write(document)
+        # change one model in place and replace another
+        document['models'][0]['machines'][0]['name'] = "M0 MILL"
+        document['models'][2] = loads(dumps(document['models'][2]))
+        document['models'][2]['base_information'].append("Operator")
+        Store.write(document, {"model0"})
+        self.assertEqual(self.readText(), dumps(document, indent = 4))
+
+# run as a script
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests of the SQLite config store: round-trips and row-level writes."""
+
+import os as os
+import sys as sys
+import shutil as shutil
+import tempfile as tempfile
+import unittest as unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from classes.SqliteConfigStore import SqliteConfigStore as SqliteConfigStore
+
+# builds a small keyed configuration
+def makeConfig(models = 3):
+    return {"timestamp":"2026-10-01 08:00:00 | test", "models":[{"key":"model" + str(a),
+        "name":"M" + str(a), "base_information":["Program"], "machines":[{"key":"machine" + str(a)
+        + "_" + str(b), "name":"M" + str(a) + " LATHE " + str(b), "measurements":["OD", "ID"],
+        "mapping_configurations":[{"key":"config" + str(a) + "_" + str(b) + "_" + str(c),
+        "id":str(c) + "-1", "mappings":[{"item":"OD", "sheet":1, "cluster":c + 1, "type":"string",
+        "value":""}]} for c in range(2)]} for b in range(2)]} for a in range(models)]}
+
+class SqliteConfigStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "config.db")
+        self.Store = SqliteConfigStore(self.path)
+
+    def tearDown(self):
+        self.Store.close()
+        shutil.rmtree(self.directory)
+
+    def testRoundTrip(self):
+        document = makeConfig()
+        self.Store.write(document)
+        Reader = SqliteConfigStore(self.path)
+        self.assertTrue(Reader.exists())
+        self.assertEqual(Reader.read(), document)
+        Reader.close()
+
+    def testOneConfigWritesOnlyItsRows(self):
+        document = makeConfig()
+        self.Store.write(document)
+        document['models'][1]['machines'][0]['mapping_configurations'][1]['id'] = "9-9"
+        # the timestamp and the config, machine and model rows (their unchanged lists are kept)
+        rows = self.Store.write(document, {"model1", "machine1_0", "config1_0_1"})
+        self.assertEqual(rows, 4)
+        self.assertEqual(self.Store.read(), document)
+
+    def testAddsRemovesAndMoves(self):
+        document = makeConfig()
+        self.Store.write(document)
+        machine = document['models'][0]['machines'][1]
+        machine['mapping_configurations'].insert(0, {"key":"new", "id":"5-1", "mappings":[]})
+        del document['models'][0]['machines'][0]
+        document['models'].reverse()
+        document['models'].append({"key":"model9", "name":"M9", "base_information":[], "machines":[]})
+        self.Store.write(document, {"model0", "machine0_1", "new"})
+        self.assertEqual(self.Store.read(), document)
+
+    def testReplacedChildrenAreRewritten(self):
+        document = makeConfig()
+        self.Store.write(document)
+        machine = document['models'][2]['machines'][0]
+        machine['measurements'] = ["OD"]
+        machine['mapping_configurations'].reverse()
+        machine['mapping_configurations'][0]['mappings'] = []
+        self.Store.write(document, {"model2", "machine2_0", "config2_0_0", "config2_0_1"})
+        self.assertEqual(self.Store.read(), document)
+
+    def testSignatureChangesWithEveryWrite(self):
+        document = makeConfig()
+        self.Store.write(document)
+        signature = self.Store.signature()
+        self.Store.write(document, set())
+        self.assertNotEqual(self.Store.signature(), signature)
+
+# run as a script
+if __name__ == "__main__":
+    unittest.main()
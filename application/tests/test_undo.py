@@ -0,0 +1,184 @@
+"""Tests of undo and redo: patches, their inverses, the checks before an undo and the undo log."""
+
+import os as os
+import sys as sys
+import shutil as shutil
+import tempfile as tempfile
+import unittest as unittest
+from json import loads, dumps
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from classes.ConfigIndex import ConfigIndex as ConfigIndex
+from classes.ConfigOperation import ConfigOperation as ConfigOperation
+from classes.InterfaceCore import InterfaceCore as InterfaceCore
+from classes.UndoLog import UndoLog as UndoLog
+from classes.ValidationIndex import ValidationIndex as ValidationIndex
+
+# builds a small keyed configuration
+def makeConfig(models = 2):
+    return {"timestamp":"2026-10-01 08:00:00 | test", "models":[{"key":"model" + str(a),
+        "name":"M" + str(a), "base_information":["Program"], "machines":[{"key":"machine" + str(a),
+        "name":"M" + str(a) + " LATHE", "measurements":["OD", "ID"], "mapping_configurations":[
+        {"key":"config" + str(a), "id":"1-1", "mappings":[{"item":"OD", "sheet":1, "cluster":1,
+        "type":"string", "value":""}]}]}]} for a in range(models)]}
+
+class ConfigOperationTest(unittest.TestCase):
+    def commit(self, document, operations):
+        """Applies operations like a commit, returning their decoded patches."""
+        positions = ConfigIndex.mapPositions(document)
+        patches = []
+        for operation in operations:
+            patches.append(loads(dumps(ConfigOperation.patch(document, operation, positions)[0])))
+            self.assertTrue(ConfigOperation.apply(document, operation, positions))
+        return patches
+
+    def undo(self, document, patches):
+        """Applies the inverses of a commit's patches, last first, checking each one."""
+        positions = ConfigIndex.mapPositions(document)
+        pending = {}
+        for patch in reversed(patches):
+            self.assertTrue(ConfigOperation.matches(document, patch, positions))
+            operation = ConfigOperation.invert(document, patch, positions, pending)
+            self.assertTrue(ConfigOperation.apply(document, operation, positions))
+
+    def testPatchHoldsOnlyChangedFields(self):
+        document = makeConfig()
+        machine = dict(document['models'][0]['machines'][0], name = "M0 MILL")
+        patch, keys = ConfigOperation.patch(document, ConfigOperation.replace(machine),
+            ConfigIndex.mapPositions(document))
+        self.assertEqual((patch['before'], patch['after']), ({"name":"M0 LATHE"}, {"name":"M0 MILL"}))
+        self.assertEqual(keys, ["machine0", "model0"])
+
+    def testUndoRestoresTheConfig(self):
+        document = makeConfig()
+        machine = dict(document['models'][1]['machines'][0], name = "M1 MILL")
+        patches = self.commit(document, [
+            ConfigOperation.add("machine0", {"key":"new", "id":"2-1", "mappings":[]}, 0),
+            ConfigOperation.remove("config0"),
+            ConfigOperation.replace(machine),
+            ConfigOperation.remove("model0")])
+        self.undo(document, patches)
+        self.assertEqual(document, makeConfig())
+
+    def testChangedObjectsDoNotMatch(self):
+        document = makeConfig()
+        machine = dict(document['models'][0]['machines'][0], name = "M0 MILL")
+        rename, removal = self.commit(document, [ConfigOperation.replace(machine),
+            ConfigOperation.remove("config1")])
+        positions = ConfigIndex.mapPositions(document)
+        self.assertTrue(ConfigOperation.matches(document, rename, positions))
+        # renamed again since
+        document['models'][0]['machines'][0]['name'] = "M0 GRINDER"
+        self.assertFalse(ConfigOperation.matches(document, rename, positions))
+        # its parent removed since
+        self.commit(document, [ConfigOperation.remove("machine1")])
+        self.assertFalse(ConfigOperation.matches(document, removal, ConfigIndex.mapPositions(document)))
+
+    def testTakenNamesConflict(self):
+        document = makeConfig()
+        Index = ValidationIndex(document)
+        positions = ConfigIndex.mapPositions(document)
+        taken = ConfigOperation.add("machine0", {"key":"new", "id":"1-1", "mappings":[]})
+        self.assertEqual(Index.conflicts(document, taken, positions), ["1-1"])
+        renamed = ConfigOperation.replace(dict(document['models'][0], name = "M1"))
+        self.assertEqual(Index.conflicts(document, renamed, positions), ["M1"])
+        unchanged = ConfigOperation.replace(dict(document['models'][0]))
+        self.assertEqual(Index.conflicts(document, unchanged, positions), [])
+
+class UndoLogTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "undo", "test.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testEntriesSurviveARestart(self):
+        Log = UndoLog(self.path)
+        Log.record("First", ["a"])
+        Log.record("Second", ["b"])
+        Log.reversed(False, "Second", ["c"])
+        Reopened = UndoLog(self.path)
+        self.assertEqual(Reopened.peek()['action'], "First")
+        self.assertEqual(Reopened.peek(True)['patches'], ["c"])
+        # a new commit drops the redo entries
+        Reopened.record("Third", ["d"])
+        self.assertIsNone(UndoLog(self.path).peek(True))
+
+    def testDepthIsKept(self):
+        Log = UndoLog(self.path, depth = 3)
+        for i in range(10):
+            Log.record("Commit " + str(i), [str(i)])
+        Reopened = UndoLog(self.path, depth = 3)
+        actions = []
+        while Reopened.peek() is not None:
+            actions.append(Reopened.peek()['action'])
+            Reopened.reversed(False, actions[-1], [])
+        self.assertEqual(actions, ["Commit 9", "Commit 8", "Commit 7"])
+
+class UndoCommitTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, "config"))
+        File = open(os.path.join(self.directory, "config", "KIM_interface_configuration.json"), 'w')
+        File.write(dumps(makeConfig(), indent = 4))
+        File.close()
+        # the first session fills the sharded store
+        self.First = self.openCore("first")
+        self.First.startup()
+        self.Second = self.openCore("second")
+
+    def tearDown(self):
+        self.First.close()
+        self.Second.close()
+        shutil.rmtree(self.directory)
+
+    def openCore(self, user):
+        Core = InterfaceCore(self.directory, user, "sharded", 1 << 20)
+        Core.verifyFolders()
+        return Core
+
+    def machine(self, Core):
+        return loads(dumps(Core.openConfigFile()['models'][0]['machines'][0]))
+
+    def testUndoAndRedo(self):
+        machine = dict(self.machine(self.First), name = "M0 MILL")
+        self.First.commitOperations([ConfigOperation.replace(machine)], "Rename")
+        self.First.undoCommit()
+        self.assertEqual(self.First.openConfigFile()['models'], makeConfig()['models'])
+        self.First.undoCommit(True)
+        self.assertEqual(self.machine(self.First)['name'], "M0 MILL")
+
+    def testOtherFieldsChangedSinceAreKept(self):
+        machine = dict(self.machine(self.First), name = "M0 MILL")
+        self.First.commitOperations([ConfigOperation.replace(machine)], "Rename")
+        machine = self.machine(self.Second)
+        machine['measurements'].append("Width")
+        self.Second.commitOperations([ConfigOperation.replace(machine)], "Add Width")
+        self.First.undoCommit()
+        self.assertEqual(self.machine(self.First)['name'], "M0 LATHE")
+        self.assertEqual(self.machine(self.First)['measurements'], ["OD", "ID", "Width"])
+
+    def testUndoOfAChangedObjectIsRefused(self):
+        machine = self.machine(self.First)
+        machine['measurements'].append("Width")
+        self.First.commitOperations([ConfigOperation.replace(machine)], "Add Width")
+        machine = self.machine(self.Second)
+        machine['measurements'].append("Depth")
+        self.Second.commitOperations([ConfigOperation.replace(machine)], "Add Depth")
+        with self.assertRaises(KeyError):
+            self.First.undoCommit()
+        self.assertEqual(self.machine(self.First)['measurements'], ["OD", "ID", "Width", "Depth"])
+        self.assertEqual(self.First.undo_log.peek()['action'], "Add Width")
+
+    def testUndoOfARemovalWhoseIdIsTakenIsRefused(self):
+        self.First.commitOperations([ConfigOperation.remove("config0")], "Remove 1-1")
+        self.Second.commitOperations([ConfigOperation.add("machine0", {"key":"other", "id":"1-1",
+            "mappings":[]})], "Add 1-1")
+        with self.assertRaises(KeyError):
+            self.First.undoCommit()
+        self.assertEqual([config['key'] for config in self.machine(self.First)['mapping_configurations']],
+            ["other"])
+
+# run as a script
+if __name__ == "__main__":
+    unittest.main()